@@ -0,0 +1,74 @@
+"""
+Compare the JSON and binary cache formats.
+
+Run with `uv run python benchmarks/bench_cache_format.py`.
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from cur.adapters.binary_cache import CANONICAL_CODES, BinaryFileCacheStorage
+from cur.adapters.cache import CacheStorage, FileCacheStorage
+
+ITERATIONS = 5_000
+
+
+def _rate_table() -> dict:
+    now = int(time.time())
+    rates = {code: random.uniform(0.001, 20_000) for code in CANONICAL_CODES}
+    rates["USD"] = 1.0
+    return {
+        "data": {
+            "result": "success",
+            "time_last_update_unix": now,
+            "time_next_update_unix": now + 86_400,
+            "base_code": "USD",
+            "rates": rates,
+        },
+        "ttl": now + 86_400,
+    }
+
+
+def _measure(storage: CacheStorage) -> tuple[float, float]:
+    """Median microseconds for a read, and for a read plus one rate lookup."""
+    read_samples = []
+    lookup_samples = []
+    for _ in range(ITERATIONS):
+        started = time.perf_counter()
+        data = storage.read("USD")
+        read_samples.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        storage.read("USD")["data"]["rates"]["KRW"]
+        lookup_samples.append(time.perf_counter() - started)
+
+    assert data is not None
+    read_samples.sort()
+    lookup_samples.sort()
+    return (
+        read_samples[ITERATIONS // 2] * 1e6,
+        lookup_samples[ITERATIONS // 2] * 1e6,
+    )
+
+
+def main() -> None:
+    table = _rate_table()
+    print(f"{'format':<8}{'bytes':>10}{'read µs':>12}{'read+lookup µs':>18}")
+
+    for name, storage_class in (
+        ("json", FileCacheStorage),
+        ("binary", BinaryFileCacheStorage),
+    ):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            storage = storage_class(Path(cache_dir))
+            storage.write("USD", table)
+            size = sum(f.stat().st_size for f in Path(cache_dir).iterdir())
+            read_us, lookup_us = _measure(storage)
+
+        print(f"{name:<8}{size:>10}{read_us:>12.1f}{lookup_us:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare bulk conversion with floats, Decimal and fixed-point minor units.
+
+Run with `uv run python benchmarks/bench_fixed_point.py`.
+"""
+
+import random
+import time
+from array import array
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from cur.core.entity import Currency
+from cur.core.money import FixedRate, Rounding, convert_minor_many, from_minor
+
+ROWS = 200_000
+REPEATS = 5
+RATE = 1385.27
+
+
+def _best(function) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    cents = array("q", (random.randint(1, 10**9) for _ in range(ROWS)))
+    floats = [amount / 100 for amount in cents]
+    decimal_rate = Decimal(repr(RATE))
+    fixed_rate = FixedRate.from_float(RATE)
+
+    def with_floats() -> None:
+        [round(amount * RATE) for amount in floats]
+
+    def with_decimal() -> None:
+        one = Decimal(1)
+        [
+            (from_minor(amount, Currency.USD) * decimal_rate).quantize(
+                one, rounding=ROUND_HALF_EVEN
+            )
+            for amount in cents
+        ]
+
+    def with_fixed_point() -> None:
+        convert_minor_many(
+            cents, Currency.USD, Currency.KRW, fixed_rate, Rounding.HALF_EVEN
+        )
+
+    print(f"{'engine':<14}{'rows/s':>14}")
+    for name, function in (
+        ("float", with_floats),
+        ("decimal", with_decimal),
+        ("fixed point", with_fixed_point),
+    ):
+        print(f"{name:<14}{ROWS / _best(function):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Compare format_korean_many with calling format_korean in a loop.
+
+Run with `uv run python benchmarks/bench_korean_formatter.py`.
+"""
+
+import random
+import time
+from array import array
+
+from cur.core.entity import Currency
+from cur.utils.formatters.korean_formatter import format_korean, format_korean_many
+
+ROWS = 200_000
+REPEATS = 5
+
+
+def _loop(amounts: array, currency: Currency) -> None:
+    for amount in amounts:
+        format_korean(amount, currency)
+
+
+def _best(function, amounts: array, currency: Currency) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        function(amounts, currency)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    amounts = array("d", (random.uniform(0, 10**10) for _ in range(ROWS)))
+    print(f"{'currency':<10}{'loop ms':>10}{'batch ms':>10}{'speedup':>10}")
+
+    for currency in (Currency.KRW, Currency.USD):
+        loop = _best(_loop, amounts, currency)
+        batch = _best(format_korean_many, amounts, currency)
+        print(
+            f"{currency.code:<10}{loop * 1e3:>10.1f}{batch * 1e3:>10.1f}"
+            f"{loop / batch:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare the batch number writers with the scalar formatters in a loop.
+
+Run with `uv run python benchmarks/bench_number_formatter.py`.
+"""
+
+import io
+import random
+import time
+from array import array
+
+from cur.utils.formatters.number_formatter import (
+    format_plain,
+    format_short,
+    format_with_commas,
+    write_plain,
+    write_short,
+    write_with_commas,
+)
+
+ROWS = 500_000
+REPEATS = 5
+
+
+def _best(function) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    numbers = array("d", (random.uniform(0, 10**10) for _ in range(ROWS)))
+    print(f"{'format':<8}{'loop /s':>14}{'batch /s':>14}{'speedup':>10}")
+
+    for name, format_one, write_many in (
+        ("commas", format_with_commas, write_with_commas),
+        ("plain", format_plain, write_plain),
+        ("short", format_short, write_short),
+    ):
+
+        def loop() -> None:
+            out = io.StringIO()
+            for number in numbers:
+                out.write(format_one(number))
+                out.write("\n")
+
+        def batch() -> None:
+            write_many(numbers, io.StringIO())
+
+        loop_time = _best(loop)
+        batch_time = _best(batch)
+        print(
+            f"{name:<8}{ROWS / loop_time:>14,.0f}{ROWS / batch_time:>14,.0f}"
+            f"{loop_time / batch_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
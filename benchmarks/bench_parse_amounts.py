@@ -0,0 +1,62 @@
+"""
+Compare parse_amounts with calling parse_amount in a loop.
+
+Run with `uv run python benchmarks/bench_parse_amounts.py`.
+"""
+
+import random
+import time
+
+from cur.core.exception import ParseError
+from cur.services.parser import parse_amount, parse_amounts
+
+ROWS = 200_000
+REPEATS = 5
+
+
+def _plain_column() -> list[str]:
+    return [f"{random.uniform(0.01, 1_000_000):.2f}" for _ in range(ROWS)]
+
+
+def _mixed_column() -> list[str]:
+    def amount() -> str:
+        roll = random.random()
+        if roll < 0.4:
+            return f"{random.randint(1, 9_999_999):,}"
+        if roll < 0.7:
+            return f"{random.uniform(0.1, 999):.1f}{random.choice('kKmMbB')}"
+        if roll < 0.98:
+            return f"{random.uniform(0.01, 1_000_000):.2f}"
+        return random.choice(["", "abc", "-5", "0"])
+
+    return [amount() for _ in range(ROWS)]
+
+
+def _loop(column: list[str]) -> None:
+    for amount in column:
+        try:
+            parse_amount(amount)
+        except ParseError:
+            pass
+
+
+def _best(function, column: list[str]) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        function(column)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    print(f"{'column':<8}{'loop ms':>10}{'batch ms':>10}{'speedup':>10}")
+
+    for name, column in (("plain", _plain_column()), ("mixed", _mixed_column())):
+        loop = _best(_loop, column)
+        batch = _best(parse_amounts, column)
+        print(f"{name:<8}{loop * 1e3:>10.1f}{batch * 1e3:>10.1f}{loop / batch:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
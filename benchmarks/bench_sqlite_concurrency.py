@@ -0,0 +1,102 @@
+"""
+Hammer one cache from many processes at once and count torn reads.
+
+Every worker repeatedly writes a full rate table under a shared key and
+reads it back. A read that fails to parse, or comes back missing after any
+worker has written it, is counted as torn.
+
+Run with `uv run python benchmarks/bench_sqlite_concurrency.py`.
+"""
+
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from cur.adapters.binary_cache import CANONICAL_CODES
+from cur.adapters.cache import CacheStorage, FileCacheStorage
+from cur.adapters.sqlite_cache import SqliteCacheStorage
+
+WORKERS = 16
+OPERATIONS = 500
+KEYS = ("USD", "KRW", "AUD")
+
+
+def _make_storage(kind: str, cache_dir: Path) -> CacheStorage:
+    if kind == "sqlite":
+        return SqliteCacheStorage(cache_dir / "cache.sqlite3")
+    return FileCacheStorage(cache_dir)
+
+
+def _rate_table(worker: int, step: int) -> dict:
+    return {
+        "data": {
+            "result": "success",
+            "time_last_update_unix": step,
+            "time_next_update_unix": step + 86_400,
+            "base_code": "USD",
+            "rates": {code: float(worker) for code in CANONICAL_CODES},
+        },
+        "ttl": int(time.time()) + 86_400,
+    }
+
+
+def _worker(kind: str, cache_dir: str, worker: int, results) -> None:
+    storage = _make_storage(kind, Path(cache_dir))
+    torn = 0
+    started = time.perf_counter()
+
+    for step in range(OPERATIONS):
+        key = KEYS[step % len(KEYS)]
+        if step % 4 == 0:
+            storage.write(key, _rate_table(worker, step))
+            continue
+
+        try:
+            data = storage.read(key)
+        except Exception:
+            torn += 1
+            continue
+        if data is None or len(data["data"]["rates"]) != len(CANONICAL_CODES):
+            torn += 1
+
+    elapsed = time.perf_counter() - started
+    if isinstance(storage, SqliteCacheStorage):
+        storage.close()
+    results.put((torn, elapsed))
+
+
+def _run(kind: str) -> tuple[int, float]:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        storage = _make_storage(kind, Path(cache_dir))
+        for key in KEYS:
+            storage.write(key, _rate_table(0, 0))
+        if isinstance(storage, SqliteCacheStorage):
+            storage.close()
+
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=_worker, args=(kind, cache_dir, n, results))
+            for n in range(WORKERS)
+        ]
+        started = time.perf_counter()
+        for process in processes:
+            process.start()
+        outcomes = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - started
+
+    return sum(torn for torn, _ in outcomes), WORKERS * OPERATIONS / elapsed
+
+
+def main() -> None:
+    print(f"{WORKERS} processes x {OPERATIONS} operations (1 write : 3 reads)")
+    print(f"{'storage':<8}{'torn reads':>12}{'ops/s':>12}")
+    for kind in ("json", "sqlite"):
+        torn, ops_per_second = _run(kind)
+        print(f"{kind:<8}{torn:>12}{ops_per_second:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
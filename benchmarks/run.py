@@ -0,0 +1,256 @@
+"""
+Offline microbenchmarks for the hot paths, with JSON baselines.
+
+Run with `uv run python benchmarks/run.py`. Pass `--save baseline.json` to
+record a run and `--compare baseline.json` to check a later one against it;
+the comparison exits non-zero when any case got slower than `--threshold`.
+
+Rates come from an in-memory cache and an httpx.MockTransport, so nothing
+touches the network or the real cache directory.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+from unittest import mock
+
+import httpx
+from typer.testing import CliRunner
+
+from cur.adapters import clipboard
+from cur.adapters.binary_cache import CANONICAL_CODES
+from cur.adapters.cache import ExchangeRateCache, FileCacheStorage, MemoryCacheStorage
+from cur.adapters.exchange_rate_client import (
+    ExchangeRateClient,
+    LatestExchangeRateResponse,
+)
+from cur.core.entity import Currency
+from cur.entrypoints.launcher import _convert_in_process, parse_convert_args
+from cur.services.conversion import ConversionService
+from cur.services.parser import parse_amount
+from cur.utils.formatters.korean_formatter import format_korean
+from cur.utils.formatters.number_formatter import format_short, format_with_commas
+
+# Each sample times a batch of calls, so sub-microsecond cases are not lost
+# in timer overhead; the batch size is picked to make a sample about 1ms.
+SAMPLE_SECONDS = 0.001
+SAMPLES = 200
+WARMUP_SAMPLES = 20
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_kib: float
+
+
+def _rate_table(base_code: str = "USD") -> dict:
+    now = int(time.time())
+    rates = {code: 1.0 + i / 7 for i, code in enumerate(CANONICAL_CODES)}
+    rates[base_code] = 1.0
+    return {
+        "result": "success",
+        "time_last_update_unix": now,
+        "time_next_update_unix": now + 86_400,
+        "base_code": base_code,
+        "rates": rates,
+    }
+
+
+def _mock_client() -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        base_code = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json=_rate_table(base_code))
+
+    return httpx.Client(
+        transport=httpx.MockTransport(handler), base_url="https://bench/"
+    )
+
+
+def _service(cache: ExchangeRateCache) -> ConversionService:
+    return ConversionService(ExchangeRateClient(cache, http_client=_mock_client()))
+
+
+def _cases(work_dir: Path) -> dict[str, Callable[[], object]]:
+    table = _rate_table()
+
+    memory_cache = ExchangeRateCache(MemoryCacheStorage())
+    memory_cache.set("USD", table, table["time_next_update_unix"])
+
+    file_storage = FileCacheStorage(work_dir)
+    file_storage.write("USD", {"data": table, "ttl": table["time_next_update_unix"]})
+
+    cached_service = _service(memory_cache)
+    cold_cache = ExchangeRateCache(MemoryCacheStorage())
+    cold_service = _service(cold_cache)
+
+    def convert_cold() -> object:
+        cold_cache.clear()
+        return cold_service.convert(1_000.0, Currency.USD, Currency.KRW)
+
+    runner = CliRunner()
+    clipboard.set_backend(clipboard.NullClipboard())
+
+    def cli() -> object:
+        from cur.entrypoints import cli
+
+        with mock.patch.object(cli, "bootstrap", return_value=cached_service):
+            return runner.invoke(cli.app, ["1.5m", "usd", "krw"])
+
+    # What `cur 1.5m usd krw` runs when no daemon is up: the launcher's own
+    # argument parsing and rendering, without Typer or Rich.
+    def launcher() -> object:
+        request = parse_convert_args(["1.5m", "usd", "krw"])
+        with (
+            mock.patch("cur.bootstrap.bootstrap", return_value=cached_service),
+            contextlib.redirect_stdout(io.StringIO()),
+        ):
+            return _convert_in_process(request)
+
+    return {
+        "parse_amount": lambda: parse_amount("1,234.5K"),
+        "format_with_commas": lambda: format_with_commas(1_385_000.5),
+        "format_short": lambda: format_short(1_385_000.5),
+        "format_korean": lambda: format_korean(1_385_000.5, Currency.KRW),
+        "cache_get": lambda: memory_cache.get("USD"),
+        "file_storage_read": lambda: file_storage.read("USD"),
+        "response_from_dict": lambda: LatestExchangeRateResponse.from_dict(table),
+        "convert_cached": lambda: cached_service.convert(
+            1_000.0, Currency.USD, Currency.KRW
+        ),
+        "convert_fetch": convert_cold,
+        "cli_convert": cli,
+        "launcher_convert": launcher,
+    }
+
+
+def _batch_size(function: Callable[[], object]) -> int:
+    batch = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(batch):
+            function()
+        if time.perf_counter() - started >= SAMPLE_SECONDS / 10 or batch >= 1 << 20:
+            break
+        batch *= 2
+    elapsed = time.perf_counter() - started
+    return max(1, int(batch * SAMPLE_SECONDS / max(elapsed, 1e-9)))
+
+
+def measure(function: Callable[[], object]) -> CaseResult:
+    batch = _batch_size(function)
+    calls = range(batch)
+    perf_counter = time.perf_counter
+
+    samples = []
+    gc.collect()
+    for index in range(WARMUP_SAMPLES + SAMPLES):
+        started = perf_counter()
+        for _ in calls:
+            function()
+        if index >= WARMUP_SAMPLES:
+            samples.append((perf_counter() - started) / batch)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    median = samples[len(samples) // 2]
+    return CaseResult(
+        # From the median rather than the mean, so one slow sample (a GC
+        # pause, a scheduler hiccup) does not read as a regression.
+        ops_per_sec=1 / median,
+        p50_us=median * 1e6,
+        p99_us=samples[min(len(samples) - 1, len(samples) * 99 // 100)] * 1e6,
+        peak_kib=peak / 1024,
+    )
+
+
+def compare(
+    results: dict[str, CaseResult], baseline: dict, threshold: float
+) -> list[str]:
+    """Names of the cases whose throughput fell by more than threshold."""
+    regressed = []
+    for name, result in results.items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        if result.ops_per_sec < previous["ops_per_sec"] * (1 - threshold):
+            regressed.append(name)
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", dest="pattern", help="only run cases containing this")
+    parser.add_argument("--save", type=Path, help="write the results to this file")
+    parser.add_argument("--compare", type=Path, help="baseline file to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.20,
+        help="allowed throughput drop against the baseline (default 0.20)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    results: dict[str, CaseResult] = {}
+
+    header = f"{'case':<20}{'ops/s':>14}{'p50 µs':>10}{'p99 µs':>10}{'peak KiB':>10}"
+    print(header + (f"{'vs base':>10}" if baseline else ""))
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for name, function in _cases(Path(work_dir)).items():
+            if args.pattern and args.pattern not in name:
+                continue
+
+            result = results[name] = measure(function)
+            line = (
+                f"{name:<20}{result.ops_per_sec:>14,.0f}{result.p50_us:>10.2f}"
+                f"{result.p99_us:>10.2f}{result.peak_kib:>10.1f}"
+            )
+            previous = baseline["results"].get(name) if baseline else None
+            if previous:
+                change = result.ops_per_sec / previous["ops_per_sec"] - 1
+                line += f"{change:>+10.1%}"
+            print(line)
+
+    if args.save:
+        args.save.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "created_unix": int(time.time()),
+                    "results": {name: asdict(r) for name, r in results.items()},
+                },
+                indent=2,
+            )
+        )
+
+    if baseline:
+        regressed = compare(results, baseline, args.threshold)
+        if regressed:
+            print(f"Slower than baseline: {', '.join(regressed)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Iterable
+
+from cur.adapters.cache import ExchangeRateCache
+from cur.adapters.exchange_rate_client import (
+    LatestExchangeRateResponse,
+    conditional_headers,
+    fresh_cached_tables,
+    http_client_options,
+    record_request,
+    record_served,
+    resolve_from_table,
+    store_response,
+)
+from cur.adapters.rate_resolver import CrossRateResolver, ResolvedRate
+from cur.core.entity import Currency
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+    from cur.adapters.history import RateHistory
+
+
+class AsyncExchangeRateClient:
+    """
+    asyncio counterpart of ExchangeRateClient with the same cache semantics.
+
+    Coroutines asking for the same base while it is being fetched share the
+    one in-flight request instead of issuing their own.
+    """
+
+    def __init__(
+        self,
+        cache: ExchangeRateCache | None = None,
+        http_client: "AsyncClient | None" = None,
+        cross_rates: bool = True,
+        stale_grace: int = 0,
+        max_concurrency: int = 8,
+        history: "RateHistory | None" = None,
+    ) -> None:
+        self._http_client = http_client
+        self._cache = cache if cache is not None else ExchangeRateCache()
+        self._resolver = CrossRateResolver() if cross_rates else None
+        self._stale_grace = stale_grace
+        self._max_concurrency = max_concurrency
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._history = history
+
+    @property
+    def _client(self) -> "AsyncClient":
+        if self._http_client is None:
+            from httpx import AsyncClient
+
+            self._http_client = AsyncClient(**http_client_options())
+        return self._http_client
+
+    async def aclose(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncExchangeRateClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def refresh(self, base_currency: Currency) -> LatestExchangeRateResponse:
+        code = base_currency.code
+        in_flight = self._in_flight.get(code)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(self._fetch_latest_rates(base_currency))
+            self._in_flight[code] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(code, None))
+
+        # A cancelled waiter must not cancel the fetch the others are sharing.
+        return await asyncio.shield(in_flight)
+
+    def cached_latest_rates(
+        self, base_currency: Currency
+    ) -> LatestExchangeRateResponse | None:
+        cached_data = self._cache.get(base_currency.code)
+        if cached_data is None:
+            return None
+        return LatestExchangeRateResponse.from_dict(cached_data)
+
+    async def _get_latest_rates(
+        self, base_currency: Currency
+    ) -> LatestExchangeRateResponse:
+        latest_rates = self.cached_latest_rates(base_currency)
+        if latest_rates is not None:
+            return latest_rates
+
+        return await self.refresh(base_currency)
+
+    async def _fetch_latest_rates(
+        self, base_currency: Currency
+    ) -> LatestExchangeRateResponse:
+        cache_key = base_currency.code
+        cached = self._cache.get_entry(cache_key, record=False)
+
+        started = time.perf_counter()
+        try:
+            response = await self._client.get(
+                url=base_currency.code, headers=conditional_headers(cached)
+            )
+        except Exception:
+            record_request(started, None)
+            raise
+        record_request(started, response)
+
+        return store_response(self._cache, cache_key, response, cached, self._history)
+
+    async def get_latest_rates_many(
+        self, base_currencies: Iterable[Currency], concurrency: int | None = None
+    ) -> dict[Currency, LatestExchangeRateResponse]:
+        """Fetch many base tables with at most `concurrency` requests in flight."""
+        semaphore = asyncio.Semaphore(concurrency or self._max_concurrency)
+
+        async def fetch(base_currency: Currency) -> LatestExchangeRateResponse:
+            async with semaphore:
+                return await self._get_latest_rates(base_currency)
+
+        base_currencies = list(dict.fromkeys(base_currencies))
+        tables = await asyncio.gather(*(fetch(base) for base in base_currencies))
+        return dict(zip(base_currencies, tables))
+
+    async def resolve_rate(
+        self, base_currency: Currency, target_currency: Currency
+    ) -> ResolvedRate:
+        return record_served(await self._resolve_rate(base_currency, target_currency))
+
+    async def _resolve_rate(
+        self, base_currency: Currency, target_currency: Currency
+    ) -> ResolvedRate:
+        base_code = base_currency.code
+        target_code = target_currency.code
+
+        cached = self._cache.get_entry(base_code)
+        if cached is not None and not cached.is_expired():
+            latest_rates = LatestExchangeRateResponse.from_dict(cached.data)
+            return resolve_from_table(latest_rates, target_code)
+
+        if self._resolver is not None:
+            resolved = self._resolver.resolve(
+                base_code, target_code, fresh_cached_tables(self._cache)
+            )
+            if resolved is not None:
+                return resolved
+
+        if cached is not None and cached.is_within_grace(self._stale_grace):
+            self._schedule_refresh(base_currency)
+            latest_rates = LatestExchangeRateResponse.from_dict(cached.data)
+            return resolve_from_table(latest_rates, target_code, stale=True)
+
+        latest_rates = await self.refresh(base_currency)
+        return resolve_from_table(latest_rates, target_code, source="network")
+
+    def _schedule_refresh(self, base_currency: Currency) -> None:
+        def ignore_failure(task: asyncio.Future) -> None:
+            if not task.cancelled():
+                task.exception()  # The stale table stays; the next lookup retries.
+
+        asyncio.ensure_future(self.refresh(base_currency)).add_done_callback(
+            ignore_failure
+        )
+
+    async def get_rate(
+        self, base_currency: Currency, target_currency: Currency
+    ) -> float:
+        return (await self.resolve_rate(base_currency, target_currency)).rate
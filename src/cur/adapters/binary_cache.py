@@ -0,0 +1,266 @@
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Iterator, Mapping
+
+from cur.adapters.cache import CacheStorage, CorruptEntryError, write_atomic
+
+# Order of the packed rate array. Changing it requires bumping VERSION.
+CANONICAL_CODES: tuple[str, ...] = (
+    "USD", "AED", "AFN", "ALL", "AMD", "ANG", "AOA", "ARS", "AUD", "AWG",
+    "AZN", "BAM", "BBD", "BDT", "BGN", "BHD", "BIF", "BMD", "BND", "BOB",
+    "BRL", "BSD", "BTN", "BWP", "BYN", "BZD", "CAD", "CDF", "CHF", "CLP",
+    "CNY", "COP", "CRC", "CUP", "CVE", "CZK", "DJF", "DKK", "DOP", "DZD",
+    "EGP", "ERN", "ETB", "EUR", "FJD", "FKP", "FOK", "GBP", "GEL", "GGP",
+    "GHS", "GIP", "GMD", "GNF", "GTQ", "GYD", "HKD", "HNL", "HRK", "HTG",
+    "HUF", "IDR", "ILS", "IMP", "INR", "IQD", "IRR", "ISK", "JEP", "JMD",
+    "JOD", "JPY", "KES", "KGS", "KHR", "KID", "KMF", "KRW", "KWD", "KYD",
+    "KZT", "LAK", "LBP", "LKR", "LRD", "LSL", "LYD", "MAD", "MDL", "MGA",
+    "MKD", "MMK", "MNT", "MOP", "MRU", "MUR", "MVR", "MWK", "MXN", "MYR",
+    "MZN", "NAD", "NGN", "NIO", "NOK", "NPR", "NZD", "OMR", "PAB", "PEN",
+    "PGK", "PHP", "PKR", "PLN", "PYG", "QAR", "RON", "RSD", "RUB", "RWF",
+    "SAR", "SBD", "SCR", "SDG", "SEK", "SGD", "SHP", "SLE", "SLL", "SOS",
+    "SRD", "SSP", "STN", "SYP", "SZL", "THB", "TJS", "TMT", "TND", "TOP",
+    "TRY", "TTD", "TVD", "TWD", "TZS", "UAH", "UGX", "UYU", "UZS", "VES",
+    "VND", "VUV", "WST", "XAF", "XCD", "XCG", "XDR", "XOF", "XPF", "YER",
+    "ZAR", "ZMW", "ZWL",
+)  # fmt: skip
+CANONICAL_INDEX: dict[str, int] = {code: i for i, code in enumerate(CANONICAL_CODES)}
+
+MAGIC = b"CURB"
+VERSION = 2
+
+# magic, version, result ok, ttl, last update, next update, base code,
+# number of codes outside CANONICAL_CODES, number of packed rates, and the
+# byte lengths of the ETag and Last-Modified validators (0 when absent).
+_HEADER = struct.Struct("<4sH?xqqq8sIIHH4x")
+_NAN = float("nan")
+
+_RATE_TABLE_KEYS = {
+    "result",
+    "time_last_update_unix",
+    "time_next_update_unix",
+    "base_code",
+    "rates",
+}
+_ENTRY_KEYS = {"data", "ttl", "etag", "last_modified"}
+
+
+class PackedRates(Mapping):
+    """Read-only view of a packed rate array. Missing rates are stored as NaN."""
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: dict[str, int], values: memoryview) -> None:
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, code: str) -> float:
+        value = self._values[self._index[code]]
+        if value != value:
+            raise KeyError(code)
+        return value
+
+    def __contains__(self, code: object) -> bool:
+        index = self._index.get(code)  # type: ignore[arg-type]
+        if index is None:
+            return False
+        value = self._values[index]
+        return value == value
+
+    def __iter__(self) -> Iterator[str]:
+        values = self._values
+        for code, index in self._index.items():
+            value = values[index]
+            if value == value:
+                yield code
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+def _is_rate_table(data: dict) -> bool:
+    table = data.get("data")
+    return (
+        isinstance(table, dict)
+        and isinstance(data.get("ttl"), int)
+        and data.keys() <= _ENTRY_KEYS
+        and all(isinstance(data.get(key, ""), str) for key in ("etag", "last_modified"))
+        and table.keys() == _RATE_TABLE_KEYS
+        and isinstance(table["rates"], Mapping)
+    )
+
+
+def encode_rate_table(data: dict) -> bytes:
+    table = data["data"]
+    rates = table["rates"]
+    extra_codes = [code for code in rates if code not in CANONICAL_INDEX]
+
+    values = [_NAN] * (len(CANONICAL_CODES) + len(extra_codes))
+    for code, rate in rates.items():
+        index = CANONICAL_INDEX.get(code)
+        if index is None:
+            index = len(CANONICAL_CODES) + extra_codes.index(code)
+        values[index] = float(rate)
+
+    etag = data.get("etag", "").encode()
+    last_modified = data.get("last_modified", "").encode()
+    blob = etag + last_modified + "".join(extra_codes).encode("ascii")
+    blob += b"\0" * (-len(blob) % 8)
+
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        table["result"] == "success",
+        data["ttl"],
+        table["time_last_update_unix"],
+        table["time_next_update_unix"],
+        table["base_code"].encode("ascii"),
+        len(extra_codes),
+        len(values),
+        len(etag),
+        len(last_modified),
+    )
+    return header + blob + struct.pack(f"<{len(values)}d", *values)
+
+
+def decode_rate_table(buffer) -> dict:
+    view = memoryview(buffer)
+    if len(view) < _HEADER.size:
+        raise ValueError("Truncated header")
+
+    (
+        magic,
+        version,
+        ok,
+        ttl,
+        last_update,
+        next_update,
+        base,
+        n_extra,
+        n_values,
+        n_etag,
+        n_last_modified,
+    ) = _HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Unknown cache format")
+
+    offset = _HEADER.size
+    entry: dict = {}
+    if n_etag:
+        entry["etag"] = bytes(view[offset : offset + n_etag]).decode()
+    offset += n_etag
+    if n_last_modified:
+        entry["last_modified"] = bytes(
+            view[offset : offset + n_last_modified]
+        ).decode()
+    offset += n_last_modified
+
+    index = CANONICAL_INDEX
+    if n_extra:
+        extra_blob = bytes(view[offset : offset + 3 * n_extra]).decode("ascii")
+        index = {**CANONICAL_INDEX}
+        for i in range(n_extra):
+            index[extra_blob[3 * i : 3 * i + 3]] = len(CANONICAL_CODES) + i
+    offset += 3 * n_extra
+    offset += -(offset - _HEADER.size) % 8
+
+    if n_values != len(CANONICAL_CODES) + n_extra or len(view) != offset + 8 * n_values:
+        raise ValueError("Truncated rates")
+
+    return {
+        "data": {
+            "result": "success" if ok else "error",
+            "time_last_update_unix": last_update,
+            "time_next_update_unix": next_update,
+            "base_code": base.rstrip(b"\0").decode("ascii"),
+            "rates": PackedRates(index, view[offset:].cast("d")),
+        },
+        "ttl": ttl,
+        **entry,
+    }
+
+
+class BinaryFileCacheStorage(CacheStorage):
+    """
+    Stores rate tables as a fixed header plus a packed float64 array.
+
+    Files are memory-mapped on read, so looking up a rate touches only the
+    page holding it. Entries that are not rate tables are kept as JSON, and
+    JSON rate tables written by FileCacheStorage are converted on first read.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        if cache_dir is None:
+            from platformdirs import user_cache_dir
+
+            cache_dir = Path(user_cache_dir("currency-translator"))
+
+        self._cache_dir = cache_dir
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_cache_path(self, key: str, suffix: str) -> Path:
+        safe_key = key.replace("/", "_").replace("\\", "_")
+        return self._cache_dir / f"{safe_key}{suffix}"
+
+    def read(self, key: str) -> dict | None:
+        binary_path = self._get_cache_path(key, ".bin")
+        try:
+            with binary_path.open("rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return self._read_json(key)
+        except (OSError, ValueError) as e:
+            # Empty files cannot be mapped
+            raise CorruptEntryError(key) from e
+
+        try:
+            return decode_rate_table(mapped)
+        except (ValueError, struct.error, UnicodeDecodeError) as e:
+            raise CorruptEntryError(key) from e
+
+    def _read_json(self, key: str) -> dict | None:
+        json_path = self._get_cache_path(key, ".json")
+        try:
+            with json_path.open("r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError as e:
+            raise CorruptEntryError(key) from e
+
+        if isinstance(data, dict) and _is_rate_table(data):
+            self.write(key, data)
+        return data
+
+    def write(self, key: str, data: dict) -> None:
+        if _is_rate_table(data):
+            path = self._get_cache_path(key, ".bin")
+            payload = encode_rate_table(data)
+            stale_path = self._get_cache_path(key, ".json")
+        else:
+            path = self._get_cache_path(key, ".json")
+            payload = json.dumps(data).encode()
+            stale_path = self._get_cache_path(key, ".bin")
+
+        # Replace rather than rewrite: readers may still have the old file mapped.
+        write_atomic(path, payload)
+        stale_path.unlink(missing_ok=True)
+
+    def delete(self, key: str) -> None:
+        self._get_cache_path(key, ".bin").unlink(missing_ok=True)
+        self._get_cache_path(key, ".json").unlink(missing_ok=True)
+
+    def list_keys(self) -> list[str]:
+        if not self._cache_dir.exists():
+            return []
+
+        keys: dict[str, None] = {}
+        for pattern in ("*.bin", "*.json"):
+            for cache_file in self._cache_dir.glob(pattern):
+                keys[cache_file.stem] = None
+        return list(keys)
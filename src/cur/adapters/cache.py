@@ -1,26 +1,62 @@
 import json
+import os
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Protocol
 
-from platformdirs import user_cache_dir
+from cur.utils import tracing
+from cur.utils.metrics import REGISTRY
+
+CACHE_LOOKUPS = REGISTRY.counter(
+    "cur_cache_lookups_total",
+    "Rate cache lookups by result: hit, miss, expired or corrupt",
+    ("result",),
+)
 
 
 @dataclass
 class CachedData:
     data: dict
     ttl: int
+    # Validators of the response the data came from, for conditional refetches.
+    etag: str | None = None
+    last_modified: str | None = None
 
     def is_expired(self) -> bool:
         return int(time.time()) >= self.ttl
 
+    def is_within_grace(self, grace: int) -> bool:
+        return int(time.time()) < self.ttl + grace
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Absent validators are left out, keeping entries in the old layout.
+        return {key: value for key, value in asdict(self).items() if value is not None}
 
     @classmethod
     def from_dict(cls, data: dict) -> "CachedData":
-        return cls(data=data["data"], ttl=data["ttl"])
+        return cls(
+            data=data["data"],
+            ttl=data["ttl"],
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+        )
+
+
+def write_atomic(path: Path, payload: bytes) -> None:
+    """Write through a temp file and rename, so readers see the old or new file, never a mix."""
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+class CorruptEntryError(Exception):
+    """Raised by CacheStorage.read when an entry exists but cannot be decoded."""
 
 
 class CacheStorage(Protocol):
@@ -32,10 +68,16 @@ class CacheStorage(Protocol):
 
     def list_keys(self) -> list[str]: ...
 
+    def clear(self) -> None:
+        for key in self.list_keys():
+            self.delete(key)
+
 
 class FileCacheStorage(CacheStorage):
     def __init__(self, cache_dir: Path | None = None) -> None:
         if cache_dir is None:
+            from platformdirs import user_cache_dir
+
             cache_dir = Path(user_cache_dir("currency-translator"))
 
         self._cache_dir = cache_dir
@@ -48,20 +90,17 @@ class FileCacheStorage(CacheStorage):
     def read(self, key: str) -> dict | None:
         cache_path = self._get_cache_path(key)
 
-        if not cache_path.exists():
-            return None
-
         try:
             with cache_path.open("r") as f:
                 return json.load(f)
-        except json.JSONDecodeError:
-            self.delete(key)
+        except FileNotFoundError:
             return None
+        except json.JSONDecodeError as e:
+            raise CorruptEntryError(key) from e
 
     def write(self, key: str, data: dict) -> None:
         cache_path = self._get_cache_path(key)
-        with cache_path.open("w") as f:
-            json.dump(data, f, indent=2)
+        write_atomic(cache_path, json.dumps(data, indent=2).encode())
 
     def delete(self, key: str) -> None:
         cache_path = self._get_cache_path(key)
@@ -77,32 +116,168 @@ class FileCacheStorage(CacheStorage):
         return keys
 
 
+class MemoryCacheStorage(CacheStorage):
+    """
+    Size-bounded LRU kept in process memory.
+
+    Entries are dropped on read once they are `grace` seconds past their
+    ttl. Until then they are kept, so ExchangeRateCache can serve an expired
+    entry within its grace window without going to a slower tier.
+    """
+
+    def __init__(self, max_entries: int = 64, grace: int = 0) -> None:
+        self._max_entries = max_entries
+        self._grace = grace
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(self, key: str) -> dict | None:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                return None
+
+            if _is_expired_entry(data, self._grace):
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return data
+
+    def write(self, key: str, data: dict) -> None:
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def list_keys(self) -> list[str]:
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _is_expired_entry(data: dict, grace: int) -> bool:
+    ttl = data.get("ttl")
+    return isinstance(ttl, int) and int(time.time()) >= ttl + grace
+
+
+@dataclass
+class TierStats:
+    name: str
+    hits: int = 0
+    misses: int = 0
+
+
+class TieredCacheStorage(CacheStorage):
+    """
+    Stack storages from fastest to slowest.
+
+    Reads go through the tiers in order and copy a hit into every faster
+    tier; writes and deletes go through to all of them.
+    """
+
+    def __init__(self, *tiers: CacheStorage) -> None:
+        self._tiers = tiers
+        self._stats = [TierStats(type(tier).__name__) for tier in tiers]
+
+    def read(self, key: str) -> dict | None:
+        for index, tier in enumerate(self._tiers):
+            data = tier.read(key)
+            if data is None:
+                self._stats[index].misses += 1
+                continue
+
+            self._stats[index].hits += 1
+            source = "memory" if isinstance(tier, MemoryCacheStorage) else "file"
+            tracing.annotate(source=source)
+            tracing.record_cache(source)
+            for faster_tier in self._tiers[:index]:
+                faster_tier.write(key, data)
+            return data
+
+        return None
+
+    def write(self, key: str, data: dict) -> None:
+        for tier in self._tiers:
+            tier.write(key, data)
+
+    def delete(self, key: str) -> None:
+        for tier in self._tiers:
+            tier.delete(key)
+
+    def list_keys(self) -> list[str]:
+        keys: dict[str, None] = {}
+        for tier in self._tiers:
+            keys.update(dict.fromkeys(tier.list_keys()))
+        return list(keys)
+
+    def clear(self) -> None:
+        for tier in self._tiers:
+            tier.clear()
+
+    def stats(self) -> list[TierStats]:
+        return list(self._stats)
+
+
 class ExchangeRateCache:
     def __init__(self, storage: CacheStorage | None = None) -> None:
         self._storage = storage if storage is not None else FileCacheStorage()
 
-    def get(self, key: str) -> dict | None:
-        raw_data = self._storage.read(key)
-        if raw_data is None:
-            return None
+    def get(self, key: str, record: bool = True) -> dict | None:
+        cached = self.get_entry(key, record)
 
-        try:
-            cached = CachedData.from_dict(raw_data)
+        # Expired entries are left in place: another process may already
+        # be replacing this one, and deleting could remove its fresh write.
+        if cached is None or cached.is_expired():
+            return None
 
-            if cached.is_expired():
-                self._storage.delete(key)
-                return None
+        return cached.data
 
-            return cached.data
+    def get_entry(self, key: str, record: bool = True) -> CachedData | None:
+        """
+        Like get, but returns the entry even when it has expired.
 
-        except (KeyError, TypeError):
+        With record=False the lookup is left out of CACHE_LOOKUPS: scans and
+        re-checks read the cache too, but only the one lookup that decides
+        how a rate is served should count towards the hit ratio.
+        """
+        try:
+            with tracing.span("cache.read", key=key):
+                raw_data = self._storage.read(key)
+            if raw_data is None:
+                result, cached = "miss", None
+            else:
+                cached = CachedData.from_dict(raw_data)
+                result = "expired" if cached.is_expired() else "hit"
+        except (CorruptEntryError, KeyError, TypeError):
+            result, cached = "corrupt", None
             self._storage.delete(key)
-            return None
 
-    def set(self, key: str, data: dict, ttl: int) -> None:
-        cached = CachedData(data=data, ttl=ttl)
+        if record:
+            CACHE_LOOKUPS.inc(result)
+        return cached
+
+    def set(
+        self,
+        key: str,
+        data: dict,
+        ttl: int,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        cached = CachedData(data=data, ttl=ttl, etag=etag, last_modified=last_modified)
         self._storage.write(key, cached.to_dict())
 
+    def keys(self) -> list[str]:
+        return self._storage.list_keys()
+
     def clear(self) -> None:
-        for key in self._storage.list_keys():
-            self._storage.delete(key)
+        self._storage.clear()
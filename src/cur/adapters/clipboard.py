@@ -1,9 +1,335 @@
-import pyperclip
+# Imported on the launcher's fast path: pyperclip and subprocess are only
+# imported once a copy actually needs them.
+#
+# CURRENCY_TRANSLATOR_CLIPBOARD picks the backend: "auto" (the default)
+# probes for a clipboard command once per session and remembers it,
+# "pyperclip" and "none" are what they say, and anything else is run as the
+# copy command, e.g. "xclip -selection clipboard".
+import os
+import sys
+import threading
+from typing import Protocol
 
+from cur.utils.runtime import private_runtime_dir
 
-def copy(text: str):
-    pyperclip.copy(text)
+ENV_VAR = "CURRENCY_TRANSLATOR_CLIPBOARD"
+DETACH_ENV_VAR = "CURRENCY_TRANSLATOR_CLIPBOARD_DETACH"
+
+# Probed in order; each maps to its copy and paste command lines.
+_COMMANDS: dict[str, tuple[list[str], list[str]]] = {
+    "pbcopy": (["pbcopy"], ["pbpaste"]),
+    "wl-copy": (["wl-copy"], ["wl-paste", "--no-newline"]),
+    "xclip": (
+        ["xclip", "-selection", "clipboard"],
+        ["xclip", "-selection", "clipboard", "-o"],
+    ),
+    "xsel": (["xsel", "--clipboard", "--input"], ["xsel", "--clipboard", "--output"]),
+}
+
+
+class ClipboardError(Exception):
+    pass
+
+
+class PendingCopy(Protocol):
+    def wait(self) -> None:
+        """Block until the copy has finished; raises ClipboardError if it failed."""
+        ...
+
+
+class ClipboardBackend(Protocol):
+    def copy(self, text: str) -> None: ...
+
+    def paste(self) -> str: ...
+
+
+class _Done:
+    def wait(self) -> None:
+        return None
+
+
+_DONE = _Done()
+
+
+class _Failed:
+    def __init__(self, error: Exception) -> None:
+        self._error = error
+
+    def wait(self) -> None:
+        raise self._error
+
+
+class _ThreadCopy:
+    """Runs a blocking copy on a thread, so the caller can render meanwhile."""
+
+    def __init__(self, backend: ClipboardBackend, text: str) -> None:
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, args=(backend, text))
+        self._thread.start()
+
+    def _run(self, backend: ClipboardBackend, text: str) -> None:
+        try:
+            backend.copy(text)
+        except Exception as e:
+            self._error = e
+
+    def wait(self) -> None:
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+class _ProcessCopy:
+    def __init__(self, process, name: str) -> None:
+        self._process = process
+        self._name = name
+
+    def wait(self) -> None:
+        status = self._process.wait()
+        if status != 0:
+            raise ClipboardError(f"{self._name} exited with status {status}")
+
+
+class PyperclipBackend:
+    def copy(self, text: str) -> None:
+        import pyperclip
+
+        try:
+            pyperclip.copy(text)
+        except pyperclip.PyperclipException as e:
+            raise ClipboardError(str(e)) from e
+
+    def paste(self) -> str:
+        import pyperclip
+
+        try:
+            return pyperclip.paste()
+        except pyperclip.PyperclipException as e:
+            raise ClipboardError(str(e)) from e
+
+
+class CommandBackend:
+    """Pipes the text into a clipboard command such as wl-copy or pbcopy."""
+
+    def __init__(
+        self, copy_command: list[str], paste_command: list[str] | None = None
+    ) -> None:
+        self.copy_command = copy_command
+        self.paste_command = paste_command
+
+    def start(self, text: str, detach: bool = False) -> PendingCopy:
+        import subprocess
+
+        try:
+            # Output stays on DEVNULL: xclip and xsel fork a child that keeps
+            # serving the selection, and a pipe would wait for it.
+            process = subprocess.Popen(
+                self.copy_command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=detach,
+            )
+        except OSError as e:
+            raise ClipboardError(f"Cannot run {self.copy_command[0]}: {e}") from e
+
+        assert process.stdin is not None
+        try:
+            with process.stdin:
+                process.stdin.write(text.encode())
+        except BrokenPipeError:
+            pass  # Exited early; wait() reports its status
+
+        if detach:
+            return _DONE
+        return _ProcessCopy(process, self.copy_command[0])
+
+    def copy(self, text: str) -> None:
+        self.start(text).wait()
+
+    def paste(self) -> str:
+        import subprocess
+
+        if self.paste_command is None:
+            raise ClipboardError(f"No paste command for {self.copy_command[0]}")
+        try:
+            return subprocess.run(
+                self.paste_command, capture_output=True, check=True
+            ).stdout.decode()
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise ClipboardError(f"Cannot run {self.paste_command[0]}: {e}") from e
+
+
+class MemoryClipboard:
+    """Keeps the text in the process; for tests and headless runs."""
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.copies: list[str] = []
+
+    def copy(self, text: str) -> None:
+        self.text = text
+        self.copies.append(text)
+
+    def paste(self) -> str:
+        return self.text
+
+
+class NullClipboard:
+    def copy(self, text: str) -> None:
+        return None
+
+    def paste(self) -> str:
+        return ""
+
+
+# A planted symlink must not redirect our reads or writes.
+_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+
+
+def _choice_path() -> str:
+    """Raises InsecurePathError when the runtime dir is not private to us."""
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(private_runtime_dir(), f"currency-translator-clipboard-{uid}")
+
+
+def _session_key() -> str:
+    display = (os.getenv("WAYLAND_DISPLAY", ""), os.getenv("DISPLAY", ""))
+    return f"{sys.platform}:{display[0]}:{display[1]}"
+
+
+def _probe() -> str | None:
+    from shutil import which
+
+    if sys.platform == "darwin":
+        candidates = ["pbcopy"]
+    else:
+        candidates = []
+        if os.getenv("WAYLAND_DISPLAY"):
+            candidates.append("wl-copy")
+        if os.getenv("DISPLAY"):
+            candidates += ["xclip", "xsel"]
+
+    for name in candidates:
+        if which(name):
+            return name
+    return None
+
+
+def session_command() -> str | None:
+    """
+    The clipboard command for this session, probed on the first call.
+
+    The choice is stored in the private runtime dir next to the daemon
+    socket, so later `cur` calls in the same session skip the probe. None
+    means no command was found and pyperclip is used instead.
+    """
+    session_key = _session_key()
+    try:
+        path = _choice_path()
+    except OSError:
+        return _probe()  # Nowhere safe to remember the choice
+
+    try:
+        fd = os.open(path, os.O_RDONLY | _NOFOLLOW)
+        with open(fd, encoding="utf-8") as f:
+            stored_key, _, name = f.read().strip().partition("\t")
+        if stored_key == session_key and (name in _COMMANDS or name == "-"):
+            return None if name == "-" else name
+    except OSError:
+        pass
+
+    name = _probe()
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _NOFOLLOW, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(f"{session_key}\t{name or '-'}\n")
+    except OSError:
+        pass
+    return name
+
+
+def forget_session_command() -> None:
+    # unlink removes a symlink itself, never its target.
+    try:
+        os.unlink(_choice_path())
+    except OSError:
+        pass
+
+
+class _SessionBackend(CommandBackend):
+    """A probed command; a failure to start it forgets the stored choice."""
+
+    def start(self, text: str, detach: bool = False) -> PendingCopy:
+        try:
+            return super().start(text, detach)
+        except ClipboardError:
+            forget_session_command()
+            raise
+
+
+def configured_backend() -> ClipboardBackend:
+    setting = os.getenv(ENV_VAR, "auto").strip()
+    if setting == "none":
+        return NullClipboard()
+    if setting == "pyperclip":
+        return PyperclipBackend()
+    if setting != "auto" and setting:
+        import shlex
+
+        return CommandBackend(shlex.split(setting))
+
+    name = session_command()
+    if name is None:
+        return PyperclipBackend()
+    return _SessionBackend(*_COMMANDS[name])
+
+
+_backend: ClipboardBackend | None = None
+
+
+def get_backend() -> ClipboardBackend:
+    global _backend
+
+    if _backend is None:
+        _backend = configured_backend()
+    return _backend
+
+
+def set_backend(backend: ClipboardBackend | None) -> None:
+    """Use backend for every copy in this process; None restores the configured one."""
+    global _backend
+
+    _backend = backend
+
+
+def copy(text: str) -> None:
+    get_backend().copy(text)
 
 
 def paste() -> str:
-    return pyperclip.paste()
+    return get_backend().paste()
+
+
+def start_copy(text: str, detach: bool | None = None) -> PendingCopy:
+    """
+    Start copying text and return at once; wait() on the result to finish.
+
+    With detach (default: CURRENCY_TRANSLATOR_CLIPBOARD_DETACH is set), a
+    clipboard command is left to finish on its own in a new session, so the
+    process can exit without waiting for it.
+    """
+    if detach is None:
+        detach = os.getenv(DETACH_ENV_VAR, "") not in ("", "0")
+
+    backend = get_backend()
+    if isinstance(backend, (MemoryClipboard, NullClipboard)):
+        backend.copy(text)
+        return _DONE
+    if not isinstance(backend, CommandBackend):
+        return _ThreadCopy(backend, text)
+
+    try:
+        return backend.start(text, detach)
+    except ClipboardError as e:
+        return _Failed(e)
@@ -1,10 +1,52 @@
-from dataclasses import asdict, dataclass
-from typing import Literal
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Literal
 
-from httpx import Client
-
-from cur.adapters.cache import ExchangeRateCache
+from cur.adapters.cache import CachedData, ExchangeRateCache
+from cur.adapters.lock import KeyLock, NullKeyLock
+from cur.adapters.rate_resolver import CrossRateResolver, ResolvedRate
+from cur.adapters.refresher import BackgroundRefresher, ThreadRefresher
 from cur.core.entity import Currency
+from cur.core.exception import RateNotFoundError
+from cur.utils import tracing
+from cur.utils.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from httpx import Client, Response
+
+    from cur.adapters.history import RateHistory
+    from cur.adapters.rate_matrix import RateMatrix
+
+API_BASE_URL = "https://open.er-api.com/v6/latest/"
+
+# How long a table confirmed unchanged by a 304 is trusted when the response
+# carries no max-age. Upstream publishes once a day, so polling hourly after
+# the advertised update time is enough.
+REVALIDATED_TTL = 3600
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "cur_http_request_duration_seconds",
+    "Latency of rate API requests",
+    (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+HTTP_RESPONSES = REGISTRY.counter(
+    "cur_http_responses_total",
+    "Rate API responses by status code, or error when none arrived",
+    ("status",),
+)
+SERVED_RATE_AGE_SECONDS = REGISTRY.histogram(
+    "cur_served_rate_age_seconds",
+    "Age of the rates served, from their upstream update time",
+    (3600, 6 * 3600, 12 * 3600, 86400, 2 * 86400, 7 * 86400),
+)
+
+_shared_client: "Client | None" = None
+_shared_client_lock = threading.Lock()
 
 
 @dataclass
@@ -29,41 +71,299 @@ class LatestExchangeRateResponse:
         )
 
 
+def fresh_cached_tables(cache: ExchangeRateCache) -> list[LatestExchangeRateResponse]:
+    tables = []
+    for key in cache.keys():
+        cached_data = cache.get(key, record=False)
+        if cached_data is not None:
+            tables.append(LatestExchangeRateResponse.from_dict(cached_data))
+    return tables
+
+
+def http_client_options() -> dict:
+    from httpx import Limits
+
+    return {
+        "base_url": API_BASE_URL,
+        # Rate tables are plain JSON and shrink several times over gzip.
+        "headers": {"Accept-Encoding": "gzip, deflate"},
+        # Keep connections open across the requests of a multi-base refresh.
+        "limits": Limits(
+            max_connections=8, max_keepalive_connections=8, keepalive_expiry=30.0
+        ),
+    }
+
+
+def shared_http_client() -> "Client":
+    """One pooled client per process, shared by every ExchangeRateClient."""
+    global _shared_client
+
+    with _shared_client_lock:
+        if _shared_client is None:
+            from httpx import Client
+
+            _shared_client = Client(**http_client_options())
+        return _shared_client
+
+
+def record_request(started: float, response: "Response | None") -> None:
+    """Record a rate API request that began at perf_counter() `started`."""
+    HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started)
+    HTTP_RESPONSES.inc(str(response.status_code) if response is not None else "error")
+
+
+def record_served(resolved: ResolvedRate) -> ResolvedRate:
+    age = time.time() - resolved.time_last_update_unix
+    SERVED_RATE_AGE_SECONDS.observe(max(0.0, age))
+    return resolved
+
+
+def conditional_headers(cached: CachedData | None) -> dict[str, str]:
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+def store_response(
+    cache: ExchangeRateCache,
+    key: str,
+    response: "Response",
+    cached: CachedData | None,
+    history: "RateHistory | None" = None,
+) -> LatestExchangeRateResponse:
+    """Cache a fetched table, or extend the cached one's TTL on 304 Not Modified."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+
+    if response.status_code == 304 and cached is not None:
+        cache.set(
+            key,
+            cached.data,
+            _revalidated_ttl(response),
+            etag=etag or cached.etag,
+            last_modified=last_modified or cached.last_modified,
+        )
+        return LatestExchangeRateResponse.from_dict(cached.data)
+
+    response.raise_for_status()
+    api_response = LatestExchangeRateResponse.from_dict(response.json())
+
+    cache.set(
+        key,
+        api_response.to_dict(),
+        api_response.time_next_update_unix,
+        etag=etag,
+        last_modified=last_modified,
+    )
+    if history is not None:
+        history.append(api_response)
+
+    return api_response
+
+
+def _revalidated_ttl(response: "Response") -> int:
+    max_age = _MAX_AGE.search(response.headers.get("Cache-Control", ""))
+    return int(time.time()) + (int(max_age.group(1)) if max_age else REVALIDATED_TTL)
+
+
+def resolve_from_table(
+    latest_rates: LatestExchangeRateResponse,
+    target_code: str,
+    stale: bool = False,
+    source: str = "cache",
+) -> ResolvedRate:
+    if target_code not in latest_rates.rates:
+        raise RateNotFoundError(
+            f"Target currency {target_code} not found in {latest_rates.base_code} rates"
+        )
+
+    return ResolvedRate(
+        rate=latest_rates.rates[target_code],
+        base_code=latest_rates.base_code,
+        target_code=target_code,
+        tables=(latest_rates.base_code,),
+        time_last_update_unix=latest_rates.time_last_update_unix,
+        time_next_update_unix=latest_rates.time_next_update_unix,
+        stale=stale,
+        source=source,
+    )
+
+
 class ExchangeRateClient:
     def __init__(
         self,
         cache: ExchangeRateCache | None = None,
-        http_client: Client | None = None,
+        http_client: "Client | None" = None,
+        cross_rates: bool = True,
+        lock: KeyLock | None = None,
+        lock_timeout: float = 5.0,
+        stale_grace: int = 0,
+        refresher: BackgroundRefresher | None = None,
+        history: "RateHistory | None" = None,
     ) -> None:
-        self._client = http_client or Client(
-            base_url="https://open.er-api.com/v6/latest/"
-        )
+        self._http_client = http_client
         self._cache = cache if cache is not None else ExchangeRateCache()
+        self._resolver = CrossRateResolver() if cross_rates else None
+        self._lock = lock if lock is not None else NullKeyLock()
+        self._lock_timeout = lock_timeout
+        self._stale_grace = stale_grace
+        self._refresher = refresher if refresher is not None else ThreadRefresher()
+        self._history = history
+        self._matrix: "RateMatrix | None" = None
 
-    def _get_latest_rates(self, base_currency: Currency) -> LatestExchangeRateResponse:
-        cache_key = base_currency.code
+    @property
+    def _client(self) -> "Client":
+        # httpx is only imported once a cache miss needs the network.
+        if self._http_client is None:
+            self._http_client = shared_http_client()
+        return self._http_client
 
-        cached_data = self._cache.get(cache_key)
-        if cached_data is not None:
-            return LatestExchangeRateResponse.from_dict(cached_data)
+    def _refresh(
+        self, base_currency: Currency
+    ) -> tuple[LatestExchangeRateResponse, str]:
+        # Only one process refreshes a key at a time; the others wait for it
+        # and pick up its write. After a timeout we fetch regardless.
+        with (
+            tracing.span("refresh", base=base_currency.code),
+            self._lock.hold(base_currency.code, self._lock_timeout),
+        ):
+            cached_data = self._cache.get(base_currency.code, record=False)
+            if cached_data is not None:
+                return LatestExchangeRateResponse.from_dict(cached_data), "cache"
 
-        response = self._client.get(url=base_currency.code)
-        response.raise_for_status()
-        api_response_raw = response.json()
+            latest_rates = self._fetch_latest_rates(
+                base_currency, self._cache.get_entry(base_currency.code, record=False)
+            )
+            return latest_rates, "network"
 
-        api_response = LatestExchangeRateResponse.from_dict(api_response_raw)
+    def refresh(self, base_currency: Currency) -> LatestExchangeRateResponse:
+        return self._refresh(base_currency)[0]
 
-        self._cache.set(
-            cache_key, api_response.to_dict(), api_response.time_next_update_unix
+    def _fetch_latest_rates(
+        self, base_currency: Currency, cached: CachedData | None = None
+    ) -> LatestExchangeRateResponse:
+        # An expired entry still carries validators: revalidating it costs
+        # a 304 with no body instead of the full table.
+        with tracing.span("fetch", base=base_currency.code):
+            started = time.perf_counter()
+            try:
+                response = self._client.get(
+                    url=base_currency.code, headers=conditional_headers(cached)
+                )
+            except Exception:
+                record_request(started, None)
+                raise
+            record_request(started, response)
+            tracing.annotate(status=response.status_code)
+            tracing.record_cache("network")
+
+        latest_rates = store_response(
+            self._cache, base_currency.code, response, cached, self._history
         )
+        if self._matrix is not None:
+            self._update_matrix(self._matrix, base_currency.code)
+
+        return latest_rates
+
+    def rate_matrix(self) -> "RateMatrix":
+        """
+        Cross rates over the fresh cached tables, for bulk pair lookups.
 
-        return api_response
+        The matrix is kept and updated in place whenever this client fetches
+        a table; once any table behind it expires it is rebuilt from the cache.
+        """
+        from cur.adapters.rate_matrix import RateMatrix
+
+        if self._matrix is None or not self._matrix.is_fresh():
+            self._matrix = RateMatrix()
+            for key in self._cache.keys():
+                self._update_matrix(self._matrix, key)
+        return self._matrix
+
+    def _update_matrix(self, matrix: "RateMatrix", key: str) -> None:
+        cached = self._cache.get_entry(key, record=False)
+        if cached is not None and not cached.is_expired():
+            matrix.update(LatestExchangeRateResponse.from_dict(cached.data), cached.ttl)
+
+    def _cached_tables(self) -> list[LatestExchangeRateResponse]:
+        return fresh_cached_tables(self._cache)
+
+    def resolve_rate(
+        self, base_currency: Currency, target_currency: Currency
+    ) -> ResolvedRate:
+        with tracing.span(
+            "resolve_rate", pair=f"{base_currency.code}/{target_currency.code}"
+        ):
+            return record_served(self._resolve_rate(base_currency, target_currency))
+
+    def _resolve_rate(
+        self, base_currency: Currency, target_currency: Currency
+    ) -> ResolvedRate:
+        base_code = base_currency.code
+        target_code = target_currency.code
+
+        stale = False
+        source = "cache"
+        with tracing.span("latest_rates", base=base_code):
+            cached = self._cache.get_entry(base_code)
+            if cached is not None and not cached.is_expired():
+                latest_rates = LatestExchangeRateResponse.from_dict(cached.data)
+            else:
+                # Any fresh table that mentions both currencies can answer the
+                # pair without a round trip for the base's own table.
+                if self._resolver is not None:
+                    resolved = self._resolver.resolve(
+                        base_code, target_code, self._cached_tables()
+                    )
+                    if resolved is not None:
+                        tracing.annotate(via="cross_rate")
+                        return resolved
+
+                # Within the grace window an expired table is served as is and
+                # refreshed off the critical path.
+                if cached is not None and cached.is_within_grace(self._stale_grace):
+                    self._refresher.schedule(self, base_currency)
+                    latest_rates = LatestExchangeRateResponse.from_dict(cached.data)
+                    stale = True
+                else:
+                    latest_rates, source = self._refresh(base_currency)
+            tracing.annotate(via="stale" if stale else source)
+
+        return resolve_from_table(latest_rates, target_code, stale, source)
 
     def get_rate(self, base_currency: Currency, target_currency: Currency) -> float:
-        latest_rates = self._get_latest_rates(base_currency)
+        return self.resolve_rate(base_currency, target_currency).rate
+
+    def resolve_rate_at(
+        self, base_currency: Currency, target_currency: Currency, when: int
+    ) -> ResolvedRate:
+        """Resolve a pair from the recorded tables that were in effect at `when`."""
+        base_code = base_currency.code
         target_code = target_currency.code
 
-        if target_code not in latest_rates.rates:
-            raise ValueError(f"Target currency {target_code} not found in rates")
+        if self._history is not None:
+            table = self._history.at(base_code, when)
+            if table is not None and target_code in table.rates:
+                return resolve_from_table(table, target_code, source="history")
+
+            if self._resolver is not None:
+                resolved = self._resolver.resolve(
+                    base_code, target_code, self._history.tables_at(when)
+                )
+                if resolved is not None:
+                    return replace(resolved, source="history")
+
+        moment = datetime.fromtimestamp(when, timezone.utc)
+        raise RateNotFoundError(
+            f"No {base_code}/{target_code} rates recorded "
+            f"at {moment:%Y-%m-%d %H:%M} UTC"
+        )
 
-        return latest_rates.rates[target_code]
+    def get_rate_at(
+        self, base_currency: Currency, target_currency: Currency, when: int
+    ) -> float:
+        return self.resolve_rate_at(base_currency, target_currency, when).rate
@@ -0,0 +1,141 @@
+import bisect
+import mmap
+import struct
+from collections.abc import Sequence
+from pathlib import Path
+
+from cur.adapters.binary_cache import CANONICAL_CODES, CANONICAL_INDEX
+from cur.adapters.exchange_rate_client import LatestExchangeRateResponse
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# One index record per table: time_last_update_unix, time_next_update_unix.
+_INDEX_RECORD = struct.Struct("<qq")
+# One data row per table: a float64 per canonical code, NaN when absent.
+_ROW = struct.Struct(f"<{len(CANONICAL_CODES)}d")
+_NAN = float("nan")
+
+
+class _UpdateTimes(Sequence):
+    """The first column of a mapped index file, for bisecting without loading it."""
+
+    def __init__(self, index: mmap.mmap, count: int) -> None:
+        self._index = index
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position):
+        return _INDEX_RECORD.unpack_from(self._index, position * _INDEX_RECORD.size)[0]
+
+
+class RateHistory:
+    """
+    Append-only store of every rate table fetched, per base currency.
+
+    Each base has an index file of fixed-size (last update, next update)
+    records and a data file of fixed-width rows in CANONICAL_CODES order,
+    so the table in effect at a given time is found by bisecting the index
+    and reading a single row. Codes outside CANONICAL_CODES are not kept.
+    """
+
+    def __init__(self, history_dir: Path | None = None) -> None:
+        if history_dir is None:
+            from platformdirs import user_data_dir
+
+            history_dir = Path(user_data_dir("currency-translator")) / "history"
+
+        self._history_dir = history_dir
+
+    def _paths(self, base_code: str) -> tuple[Path, Path]:
+        return (
+            self._history_dir / f"{base_code}.idx",
+            self._history_dir / f"{base_code}.dat",
+        )
+
+    def append(self, table: LatestExchangeRateResponse) -> bool:
+        """Record a table; returns False when it is not newer than the last one."""
+        self._history_dir.mkdir(parents=True, exist_ok=True)
+        index_path, data_path = self._paths(table.base_code)
+
+        with index_path.open("a+b") as index_file:
+            if fcntl is not None:
+                fcntl.flock(index_file, fcntl.LOCK_EX)
+
+            count = index_file.seek(0, 2) // _INDEX_RECORD.size
+            if count:
+                index_file.seek((count - 1) * _INDEX_RECORD.size)
+                last_update, _ = _INDEX_RECORD.unpack(
+                    index_file.read(_INDEX_RECORD.size)
+                )
+                if last_update >= table.time_last_update_unix:
+                    return False
+
+            row = [float(table.rates.get(code, _NAN)) for code in CANONICAL_CODES]
+            if table.base_code in CANONICAL_INDEX:
+                row[CANONICAL_INDEX[table.base_code]] = 1.0
+
+            # The row goes in before its index record, and anything a crashed
+            # writer left past the last indexed row is dropped first.
+            with data_path.open("ab") as data_file:
+                data_file.truncate(count * _ROW.size)
+                data_file.write(_ROW.pack(*row))
+
+            index_file.truncate(count * _INDEX_RECORD.size)
+            index_file.write(
+                _INDEX_RECORD.pack(
+                    table.time_last_update_unix, table.time_next_update_unix
+                )
+            )
+        return True
+
+    def at(self, base_code: str, when: int) -> LatestExchangeRateResponse | None:
+        """The base's table in effect at `when`: the last one published by then."""
+        index_path, data_path = self._paths(base_code)
+        try:
+            with index_path.open("rb") as index_file:
+                index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            # Missing, or empty and so not mappable
+            return None
+
+        with index:
+            count = len(index) // _INDEX_RECORD.size
+            position = bisect.bisect_right(_UpdateTimes(index, count), when) - 1
+            if position < 0:
+                return None
+            last_update, next_update = _INDEX_RECORD.unpack_from(
+                index, position * _INDEX_RECORD.size
+            )
+
+        with data_path.open("rb") as data_file:
+            data_file.seek(position * _ROW.size)
+            row = _ROW.unpack(data_file.read(_ROW.size))
+
+        return LatestExchangeRateResponse(
+            result="success",
+            time_last_update_unix=last_update,
+            time_next_update_unix=next_update,
+            base_code=base_code,
+            rates={
+                code: rate for code, rate in zip(CANONICAL_CODES, row) if rate == rate
+            },
+        )
+
+    def bases(self) -> list[str]:
+        if not self._history_dir.exists():
+            return []
+        return sorted(path.stem for path in self._history_dir.glob("*.idx"))
+
+    def tables_at(self, when: int) -> list[LatestExchangeRateResponse]:
+        tables = []
+        for base_code in self.bases():
+            table = self.at(base_code, when)
+            if table is not None:
+                tables.append(table)
+        return tables
+
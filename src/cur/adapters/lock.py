@@ -0,0 +1,65 @@
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import ContextManager, Iterator, Protocol
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class KeyLock(Protocol):
+    def hold(self, key: str, timeout: float) -> ContextManager[bool]:
+        """Hold the lock for key while the block runs; yields False on timeout."""
+        ...
+
+
+class NullKeyLock(KeyLock):
+    @contextmanager
+    def hold(self, key: str, timeout: float) -> Iterator[bool]:
+        yield True
+
+
+class FileKeyLock(KeyLock):
+    """Advisory flock per key, shared by every process using the same directory."""
+
+    POLL_INTERVAL = 0.01
+
+    def __init__(self, lock_dir: Path | None = None) -> None:
+        self._lock_dir = lock_dir
+
+    def _get_lock_path(self, key: str) -> Path:
+        if self._lock_dir is None:
+            from platformdirs import user_cache_dir
+
+            self._lock_dir = Path(user_cache_dir("currency-translator")) / "locks"
+
+        self._lock_dir.mkdir(parents=True, exist_ok=True)
+        safe_key = key.replace("/", "_").replace("\\", "_")
+        return self._lock_dir / f"{safe_key}.lock"
+
+    @contextmanager
+    def hold(self, key: str, timeout: float) -> Iterator[bool]:
+        if fcntl is None:
+            yield True
+            return
+
+        with self._get_lock_path(key).open("a") as lock_file:
+            acquired = self._acquire(lock_file.fileno(), timeout)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _acquire(self, fd: int, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(self.POLL_INTERVAL)
@@ -0,0 +1,89 @@
+import time
+from array import array
+from typing import Iterable
+
+from cur.adapters.exchange_rate_client import LatestExchangeRateResponse
+from cur.core.entity import Currency
+from cur.core.exception import ParseError
+
+_NAN = float("nan")
+
+
+class RateMatrix:
+    """
+    Cross rates between every Currency in a flat NxN float64 array.
+
+    ``rate(base, target)`` is a single indexed read at
+    ``base.index * N + target.index``; NaN marks a pair no table covers.
+    Bases with a table of their own get their row straight from it. Every
+    other row is triangulated through a pivot table, the first one added.
+    Updating a table rewrites only the rows it feeds.
+    """
+
+    def __init__(self, tables: Iterable[LatestExchangeRateResponse] = ()) -> None:
+        self._currencies = list(Currency)
+        self._size = len(self._currencies)
+        self._values = array("d", [_NAN]) * (self._size * self._size)
+        self._tables: dict[int, LatestExchangeRateResponse] = {}
+        self._expires_at: dict[int, int] = {}
+        self._pivot: int | None = None
+
+        for index in range(self._size):
+            self._values[index * self._size + index] = 1.0
+        for table in tables:
+            self.update(table)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def expires_at_unix(self) -> int | None:
+        """When the first table behind the matrix expires; None while empty."""
+        if not self._expires_at:
+            return None
+        return min(self._expires_at.values())
+
+    def is_fresh(self) -> bool:
+        expires_at = self.expires_at_unix
+        return expires_at is not None and time.time() < expires_at
+
+    def rate(self, base_currency: Currency, target_currency: Currency) -> float:
+        return self._values[base_currency.index * self._size + target_currency.index]
+
+    def update(
+        self, table: LatestExchangeRateResponse, expires_at_unix: int | None = None
+    ) -> None:
+        """Add or replace a base's table, by default expiring at its next update."""
+        try:
+            base_index = Currency.from_string(table.base_code).index
+        except ParseError:
+            return
+
+        self._tables[base_index] = table
+        self._expires_at[base_index] = (
+            table.time_next_update_unix if expires_at_unix is None else expires_at_unix
+        )
+        self._fill_row(base_index, table.rates, 1.0)
+
+        if self._pivot is None:
+            self._pivot = base_index
+        if self._pivot != base_index:
+            return
+
+        # Rows triangulated through the pivot change with it.
+        for index, currency in enumerate(self._currencies):
+            if index in self._tables:
+                continue
+            from_rate = table.rates.get(currency.code)
+            if from_rate:
+                self._fill_row(index, table.rates, from_rate)
+
+    def _fill_row(self, row: int, rates, from_rate: float) -> None:
+        values = self._values
+        offset = row * self._size
+        for index, currency in enumerate(self._currencies):
+            if index == row:
+                continue
+            to_rate = rates.get(currency.code)
+            values[offset + index] = _NAN if to_rate is None else to_rate / from_rate
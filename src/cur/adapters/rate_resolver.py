@@ -0,0 +1,124 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from cur.adapters.exchange_rate_client import LatestExchangeRateResponse
+
+
+@dataclass(frozen=True)
+class ResolvedRate:
+    rate: float
+    base_code: str
+    target_code: str
+    # Base codes of the rate tables the rate was derived from, in hop order.
+    tables: tuple[str, ...]
+    time_last_update_unix: int
+    time_next_update_unix: int
+    # Served from an expired table while a refresh runs in the background.
+    stale: bool = False
+    # Where the tables came from: cache, network or history.
+    source: str = "cache"
+
+
+class CrossRateResolver:
+    """
+    Derive a pair's rate from whichever rate tables are at hand.
+
+    Any table that lists both currencies answers the pair directly
+    (plain lookup, inversion or triangulation through its base). When no
+    single table does, tables are chained through shared currencies,
+    preferring the answer that uses the fewest tables.
+    """
+
+    def __init__(self, max_hops: int = 3) -> None:
+        self._max_hops = max_hops
+
+    def resolve(
+        self,
+        base_code: str,
+        target_code: str,
+        tables: Iterable["LatestExchangeRateResponse"],
+    ) -> ResolvedRate | None:
+        containing = self._index(base_code, target_code, tables)
+        if base_code not in containing or target_code not in containing:
+            return None
+
+        queue: deque[tuple[str, float, tuple]] = deque([(base_code, 1.0, ())])
+        seen_codes = {base_code}
+        used_tables: set[str] = set()
+
+        while queue:
+            code, rate, path = queue.popleft()
+            if len(path) >= self._max_hops:
+                continue
+
+            for table in containing[code]:
+                if table.base_code in used_tables:
+                    continue
+                used_tables.add(table.base_code)
+
+                from_rate = _rate_in(table, code)
+                if not from_rate:
+                    continue
+
+                hop_path = path + (table,)
+                if target_code in table.rates or target_code == table.base_code:
+                    return _build_result(
+                        rate * _rate_in(table, target_code) / from_rate,
+                        base_code,
+                        target_code,
+                        hop_path,
+                    )
+
+                for other, other_rate in table.rates.items():
+                    if other not in seen_codes:
+                        seen_codes.add(other)
+                        queue.append((other, rate * other_rate / from_rate, hop_path))
+
+        return None
+
+    @staticmethod
+    def _index(
+        base_code: str,
+        target_code: str,
+        tables: Iterable["LatestExchangeRateResponse"],
+    ) -> dict[str, list["LatestExchangeRateResponse"]]:
+        # The base's own table, then the target's, then the rest: this makes
+        # a direct lookup win over inversion, and inversion over triangulation.
+        def preference(table: "LatestExchangeRateResponse") -> int:
+            if table.base_code == base_code:
+                return 0
+            if table.base_code == target_code:
+                return 1
+            return 2
+
+        containing: dict[str, list] = {}
+        for table in sorted(tables, key=preference):
+            containing.setdefault(table.base_code, []).append(table)
+            for code in table.rates:
+                if code != table.base_code:
+                    containing.setdefault(code, []).append(table)
+        return containing
+
+
+def _rate_in(table: "LatestExchangeRateResponse", code: str) -> float:
+    if code == table.base_code:
+        return 1.0
+    return table.rates[code]
+
+
+def _build_result(
+    rate: float,
+    base_code: str,
+    target_code: str,
+    path: tuple["LatestExchangeRateResponse", ...],
+) -> ResolvedRate:
+    return ResolvedRate(
+        rate=rate,
+        base_code=base_code,
+        target_code=target_code,
+        tables=tuple(table.base_code for table in path),
+        time_last_update_unix=min(table.time_last_update_unix for table in path),
+        time_next_update_unix=min(table.time_next_update_unix for table in path),
+    )
@@ -0,0 +1,67 @@
+import sys
+import threading
+from typing import TYPE_CHECKING, Protocol
+
+from cur.core.entity import Currency
+
+if TYPE_CHECKING:
+    from cur.adapters.exchange_rate_client import ExchangeRateClient
+
+
+class BackgroundRefresher(Protocol):
+    def schedule(
+        self, client: "ExchangeRateClient", base_currency: Currency
+    ) -> None: ...
+
+
+class ThreadRefresher(BackgroundRefresher):
+    """Refreshes on a daemon thread. For processes that outlive the refresh."""
+
+    def __init__(self) -> None:
+        self._in_flight: set[str] = set()
+        self._lock = threading.Lock()
+
+    def schedule(self, client: "ExchangeRateClient", base_currency: Currency) -> None:
+        with self._lock:
+            if base_currency.code in self._in_flight:
+                return
+            self._in_flight.add(base_currency.code)
+
+        threading.Thread(
+            target=self._refresh, args=(client, base_currency), daemon=True
+        ).start()
+
+    def _refresh(self, client: "ExchangeRateClient", base_currency: Currency) -> None:
+        try:
+            client.refresh(base_currency)
+        except Exception:
+            pass  # The stale table stays in place; the next lookup retries.
+        finally:
+            with self._lock:
+                self._in_flight.discard(base_currency.code)
+
+
+class ProcessRefresher(BackgroundRefresher):
+    """Refreshes in a detached process, so a short-lived CLI can exit at once."""
+
+    def __init__(self) -> None:
+        self._scheduled: set[str] = set()
+
+    def schedule(self, client: "ExchangeRateClient", base_currency: Currency) -> None:
+        if base_currency.code in self._scheduled:
+            return
+        self._scheduled.add(base_currency.code)
+
+        import subprocess
+
+        try:
+            subprocess.Popen(
+                [sys.executable, "-m", "cur.entrypoints.refresh", base_currency.code],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError:
+            # The stale table is still served; the next lookup retries.
+            self._scheduled.discard(base_currency.code)
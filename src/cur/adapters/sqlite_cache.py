@@ -0,0 +1,93 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+from cur.adapters.cache import CacheStorage, CorruptEntryError
+
+_CREATE_TABLE = "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+_SELECT = "SELECT value FROM cache WHERE key = ?"
+_UPSERT = (
+    "INSERT INTO cache (key, value) VALUES (?, ?) "
+    "ON CONFLICT (key) DO UPDATE SET value = excluded.value"
+)
+_DELETE = "DELETE FROM cache WHERE key = ?"
+_LIST_KEYS = "SELECT key FROM cache"
+_CLEAR = "DELETE FROM cache"
+
+
+class SqliteCacheStorage(CacheStorage):
+    """
+    Keeps every entry in one SQLite database in WAL mode.
+
+    Each write is a single atomic statement, so concurrent processes never
+    see a torn entry, and readers are not blocked by a writer. Statements
+    are parameterised and reused from sqlite3's per-connection cache.
+    """
+
+    def __init__(self, db_path: Path | None = None, timeout: float = 5.0) -> None:
+        if db_path is None:
+            from platformdirs import user_cache_dir
+
+            db_path = Path(user_cache_dir("currency-translator")) / "cache.sqlite3"
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db_path = db_path
+        self._timeout = timeout
+        # One connection per thread, all kept here so close() can reach them.
+        self._connections: dict[int, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        thread_id = threading.get_ident()
+        connection = self._connections.get(thread_id)
+        if connection is None:
+            # Only used on this thread; close() may run on another one.
+            connection = sqlite3.connect(
+                self._db_path,
+                timeout=self._timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_CREATE_TABLE)
+            with self._lock:
+                self._connections[thread_id] = connection
+        return connection
+
+    def close(self) -> None:
+        """Close every thread's connection. Later calls open new ones."""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+
+    def __enter__(self) -> "SqliteCacheStorage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def read(self, key: str) -> dict | None:
+        row = self._connection().execute(_SELECT, (key,)).fetchone()
+        if row is None:
+            return None
+
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError as e:
+            raise CorruptEntryError(key) from e
+
+    def write(self, key: str, data: dict) -> None:
+        self._connection().execute(_UPSERT, (key, json.dumps(data)))
+
+    def delete(self, key: str) -> None:
+        self._connection().execute(_DELETE, (key,))
+
+    def list_keys(self) -> list[str]:
+        return [row[0] for row in self._connection().execute(_LIST_KEYS)]
+
+    def clear(self) -> None:
+        self._connection().execute(_CLEAR)
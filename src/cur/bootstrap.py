@@ -1,18 +1,137 @@
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from cur.adapters.cache import ExchangeRateCache, FileCacheStorage
-from cur.adapters.exchange_rate_client import ExchangeRateClient
+from cur.adapters.cache import (
+    CacheStorage,
+    ExchangeRateCache,
+    FileCacheStorage,
+    MemoryCacheStorage,
+    TieredCacheStorage,
+)
+from cur.adapters.exchange_rate_client import (
+    ExchangeRateClient,
+    LatestExchangeRateResponse,
+)
+from cur.adapters.lock import FileKeyLock
+from cur.adapters.refresher import BackgroundRefresher, ProcessRefresher
+from cur.core.entity import Currency
 from cur.services.conversion import ConversionService
 
+if TYPE_CHECKING:
+    from cur.adapters.async_exchange_rate_client import AsyncExchangeRateClient
+    from cur.adapters.history import RateHistory
 
-def bootstrap() -> ConversionService:
+
+def _disk_storage(cache_dir: Path | None) -> CacheStorage:
+    cache_format = os.getenv("CURRENCY_TRANSLATOR_CACHE_FORMAT", "json").lower()
+
+    if cache_format == "binary":
+        from cur.adapters.binary_cache import BinaryFileCacheStorage
+
+        return BinaryFileCacheStorage(cache_dir)
+
+    if cache_format == "sqlite":
+        from cur.adapters.sqlite_cache import SqliteCacheStorage
+
+        return SqliteCacheStorage(cache_dir / "cache.sqlite3" if cache_dir else None)
+
+    return FileCacheStorage(cache_dir)
+
+
+def _cache_dir() -> Path | None:
     cache_dir_env = os.getenv("CURRENCY_TRANSLATOR_CACHE_DIR")
-    cache_dir = Path(cache_dir_env) if cache_dir_env else None
+    return Path(cache_dir_env) if cache_dir_env else None
+
+
+def _stale_grace() -> int:
+    # A malformed value turns the grace window off rather than breaking `cur`.
+    try:
+        grace = int(os.getenv("CURRENCY_TRANSLATOR_STALE_GRACE", "0"))
+    except ValueError:
+        return 0
+    return max(grace, 0)
+
+
+def configured_currencies() -> list[Currency]:
+    """The currencies commands such as `cur warm` and `cur matrix` cover by default."""
+    codes = os.getenv("CURRENCY_TRANSLATOR_CURRENCIES", "AUD,KRW,USD")
+    return [Currency.from_string(code) for code in codes.split(",") if code.strip()]
+
+
+def _history() -> "RateHistory":
+    from cur.adapters.history import RateHistory
+
+    history_dir_env = os.getenv("CURRENCY_TRANSLATOR_HISTORY_DIR")
+    return RateHistory(Path(history_dir_env) if history_dir_env else None)
+
+
+class _DeferredHistory:
+    """
+    Stands in for the RateHistory until a fetch appends to it or --at reads
+    it, so conversions served from the cache never import it.
+    """
+
+    def __init__(self) -> None:
+        self._history: "RateHistory | None" = None
+
+    def _get(self) -> "RateHistory":
+        if self._history is None:
+            self._history = _history()
+        return self._history
+
+    def append(self, table: LatestExchangeRateResponse) -> bool:
+        return self._get().append(table)
+
+    def at(self, base_code: str, when: int) -> LatestExchangeRateResponse | None:
+        return self._get().at(base_code, when)
+
+    def tables_at(self, when: int) -> list[LatestExchangeRateResponse]:
+        return self._get().tables_at(when)
+
+
+def _build_cache(cache_dir: Path | None) -> ExchangeRateCache:
+    # The memory tier keeps entries for the whole grace window, so stale
+    # reads in a long-lived process do not go to disk each time.
+    memory = MemoryCacheStorage(grace=_stale_grace())
+    storage = TieredCacheStorage(memory, _disk_storage(cache_dir))
+    return ExchangeRateCache(storage)
+
+
+def bootstrap_client(
+    refresher: BackgroundRefresher | None = None,
+) -> ExchangeRateClient:
+    cache_dir = _cache_dir()
+
+    cache = _build_cache(cache_dir)
+    lock = FileKeyLock(cache_dir / "locks" if cache_dir else None)
+    exchange_rate_client = ExchangeRateClient(
+        cache,
+        lock=lock,
+        stale_grace=_stale_grace(),
+        refresher=refresher,
+        history=_DeferredHistory(),  # type: ignore[arg-type]
+    )
+
+    return exchange_rate_client
+
+
+def bootstrap_async_client() -> "AsyncExchangeRateClient":
+    from cur.adapters.async_exchange_rate_client import AsyncExchangeRateClient
+
+    cache = _build_cache(_cache_dir())
+    return AsyncExchangeRateClient(
+        cache,
+        stale_grace=_stale_grace(),
+        history=_DeferredHistory(),  # type: ignore[arg-type]
+    )
+
+
+def bootstrap(refresher: BackgroundRefresher | None = None) -> ConversionService:
+    # A one-shot CLI exits before a refresh thread could finish.
+    if refresher is None:
+        refresher = ProcessRefresher()
 
-    storage = FileCacheStorage(cache_dir)
-    cache = ExchangeRateCache(storage)
-    exchange_rate_client = ExchangeRateClient(cache)
-    conversion_service = ConversionService(exchange_rate_client)
+    conversion_service = ConversionService(bootstrap_client(refresher))
 
     return conversion_service
@@ -1,34 +1,130 @@
+import threading
 from dataclasses import dataclass
-from enum import Enum
+from pathlib import Path
+from typing import ClassVar, Iterator
 
 from cur.core.exception import ParseError
 
+REGISTRY_PATH = Path(__file__).with_name("currencies.tsv")
+
 
 @dataclass(frozen=True)
 class CurrencyInfo:
     code: str
     korean_name: str
     subunit_name: str | None = None
+    minor_digits: int = 2
 
     def __str__(self) -> str:
         return self.code
 
 
-class Currency(Enum):
-    AUD = CurrencyInfo("AUD", "달러", "센트")
-    KRW = CurrencyInfo("KRW", "원", None)
-    USD = CurrencyInfo("USD", "달러", "센트")
+class _Registry:
+    """
+    The ISO 4217 table, read on the first lookup.
+
+    Loading only indexes the lines by code; a Currency object is built the
+    first time its code is asked for and reused afterwards.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lines: dict[str, tuple[int, str]] | None = None
+        self._currencies: dict[str, "Currency"] = {}
+        self._lock = threading.Lock()
+
+    def _index(self) -> dict[str, tuple[int, str]]:
+        if self._lines is None:
+            lines: dict[str, tuple[int, str]] = {}
+            for line in self._path.read_text(encoding="utf-8").splitlines():
+                if line and not line.startswith("#"):
+                    lines[line[:3]] = (len(lines), line)
+            self._lines = lines
+        return self._lines
+
+    def get(self, code: str) -> "Currency | None":
+        currency = self._currencies.get(code)
+        if currency is not None:
+            return currency
+
+        entry = self._index().get(code)
+        if entry is None:
+            return None
+
+        index, line = entry
+        fields = line.split("\t")
+        info = CurrencyInfo(
+            code=code,
+            korean_name=fields[2],
+            subunit_name=fields[3] if len(fields) > 3 else None,
+            minor_digits=int(fields[1]),
+        )
+        # Interned, so currencies compare and hash by identity like enum members.
+        with self._lock:
+            return self._currencies.setdefault(code, Currency(info, index))
+
+    def codes(self) -> list[str]:
+        return list(self._index())
+
+
+_registry = _Registry(REGISTRY_PATH)
+
+
+class _CurrencyType(type):
+    def __getattr__(cls, name: str) -> "Currency":
+        if len(name) == 3 and name.isupper():
+            currency = _registry.get(name)
+            if currency is not None:
+                return currency
+        raise AttributeError(name)
+
+    def __getitem__(cls, code: str) -> "Currency":
+        currency = _registry.get(code)
+        if currency is None:
+            raise KeyError(code)
+        return currency
+
+    def __iter__(cls) -> Iterator["Currency"]:
+        for code in _registry.codes():
+            yield cls[code]
+
+    def __len__(cls) -> int:
+        return len(_registry.codes())
+
+
+class Currency(metaclass=_CurrencyType):
+    """
+    An ISO 4217 currency, e.g. ``Currency.USD`` or ``Currency.from_string("eur")``.
+
+    Members are looked up in the registry on first use, so any code in it
+    is available as an attribute.
+    """
+
+    AUD: ClassVar["Currency"]
+    KRW: ClassVar["Currency"]
+    USD: ClassVar["Currency"]
+
+    __slots__ = ("value", "index")
+
+    def __init__(self, info: CurrencyInfo, index: int) -> None:
+        self.value = info
+        # Stable position of the currency, for array-backed lookups.
+        self.index = index
 
     @classmethod
     def from_string(cls, currency: str) -> "Currency":
         currency = currency.strip().upper()
-        try:
-            return cls[currency]
-        except KeyError:
-            supported = ", ".join(c.code for c in cls)
+        found = _registry.get(currency)
+        if found is None:
             raise ParseError(
-                f"Unsupported currency: {currency}. Supported: {supported}"
+                f"Unsupported currency: {currency}. "
+                "Use an ISO 4217 code such as USD, EUR or KRW"
             )
+        return found
+
+    @property
+    def name(self) -> str:
+        return self.value.code
 
     @property
     def code(self) -> str:
@@ -42,5 +138,15 @@ class Currency(Enum):
     def subunit_name(self) -> str | None:
         return self.value.subunit_name
 
+    @property
+    def minor_digits(self) -> int:
+        return self.value.minor_digits
+
+    def __reduce__(self):
+        return Currency.from_string, (self.code,)
+
+    def __repr__(self) -> str:
+        return f"<Currency.{self.code}>"
+
     def __str__(self) -> str:
         return self.code
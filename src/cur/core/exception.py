@@ -1,2 +1,6 @@
 class ParseError(Exception):
     pass
+
+
+class RateNotFoundError(Exception):
+    pass
@@ -0,0 +1,140 @@
+from array import array
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Callable, Iterable
+
+from cur.core.entity import Currency
+
+# Rates are kept as integers in units of 10**-RATE_DIGITS. Published rates
+# carry at most 6-8 significant digits, so even KRW->USD (~0.0007) is exact.
+RATE_DIGITS = 12
+
+
+class Rounding(Enum):
+    HALF_EVEN = "half_even"
+    HALF_UP = "half_up"  # halves away from zero
+    DOWN = "down"  # toward zero
+    UP = "up"  # away from zero
+    FLOOR = "floor"
+    CEILING = "ceiling"
+
+
+@dataclass(frozen=True)
+class FixedRate:
+    units: int
+
+    @classmethod
+    def from_float(cls, rate: float) -> "FixedRate":
+        # repr gives the shortest decimal that round-trips, i.e. the value as
+        # the API published it, not its binary approximation.
+        return cls(round(Decimal(repr(rate)).scaleb(RATE_DIGITS)))
+
+    def __float__(self) -> float:
+        return self.units / 10**RATE_DIGITS
+
+
+def to_minor(
+    amount: float | str | Decimal,
+    currency: Currency,
+    rounding: Rounding = Rounding.HALF_EVEN,
+) -> int:
+    """Amount in the currency's minor units, e.g. cents for USD, won for KRW."""
+    if isinstance(amount, float):
+        amount = repr(amount)
+    numerator, denominator = Decimal(amount).as_integer_ratio()
+    return _DIVIDERS[rounding](numerator * 10**currency.minor_digits, denominator)
+
+
+def from_minor(amount: int, currency: Currency) -> Decimal:
+    return Decimal(amount).scaleb(-currency.minor_digits)
+
+
+def convert_minor(
+    amount: int,
+    base_currency: Currency,
+    target_currency: Currency,
+    rate: FixedRate,
+    rounding: Rounding = Rounding.HALF_EVEN,
+) -> int:
+    multiplier, divisor = _scale(base_currency, target_currency, rate)
+    return _DIVIDERS[rounding](amount * multiplier, divisor)
+
+
+def convert_minor_many(
+    amounts: Iterable[int],
+    base_currency: Currency,
+    target_currency: Currency,
+    rate: FixedRate,
+    rounding: Rounding = Rounding.HALF_EVEN,
+) -> array:
+    """
+    Convert a column of minor-unit amounts into an int64 array.
+
+    Every value is rounded exactly once, so totals match converting the rows
+    one by one with convert_minor.
+    """
+    multiplier, divisor = _scale(base_currency, target_currency, rate)
+    if divisor == 1:
+        return array("q", [amount * multiplier for amount in amounts])
+    if rounding is Rounding.FLOOR:
+        return array("q", [amount * multiplier // divisor for amount in amounts])
+
+    divide = _DIVIDERS[rounding]
+    return array("q", [divide(amount * multiplier, divisor) for amount in amounts])
+
+
+def _scale(
+    base_currency: Currency, target_currency: Currency, rate: FixedRate
+) -> tuple[int, int]:
+    # target = amount * rate.units * 10**(target - base - RATE_DIGITS)
+    exponent = (
+        target_currency.minor_digits - base_currency.minor_digits - RATE_DIGITS
+    )
+    if exponent >= 0:
+        return rate.units * 10**exponent, 1
+    return rate.units, 10**-exponent
+
+
+# Each divider takes a positive denominator.
+def _half_even(numerator: int, denominator: int) -> int:
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient & 1):
+        return quotient + 1
+    return quotient
+
+
+def _half_up(numerator: int, denominator: int) -> int:
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if 2 * remainder >= denominator:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+
+def _down(numerator: int, denominator: int) -> int:
+    quotient = abs(numerator) // denominator
+    return quotient if numerator >= 0 else -quotient
+
+
+def _up(numerator: int, denominator: int) -> int:
+    quotient = -(-abs(numerator) // denominator)
+    return quotient if numerator >= 0 else -quotient
+
+
+def _floor(numerator: int, denominator: int) -> int:
+    return numerator // denominator
+
+
+def _ceiling(numerator: int, denominator: int) -> int:
+    return -(-numerator // denominator)
+
+
+_DIVIDERS: dict[Rounding, Callable[[int, int], int]] = {
+    Rounding.HALF_EVEN: _half_even,
+    Rounding.HALF_UP: _half_up,
+    Rounding.DOWN: _down,
+    Rounding.UP: _up,
+    Rounding.FLOOR: _floor,
+    Rounding.CEILING: _ceiling,
+}
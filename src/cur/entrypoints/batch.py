@@ -0,0 +1,63 @@
+import sys
+from enum import Enum
+from pathlib import Path
+from typing import Optional
+
+import typer
+from typing_extensions import Annotated
+
+from cur.bootstrap import bootstrap_client
+from cur.services.batch import (
+    BatchConverter,
+    read_csv_records,
+    read_jsonl_records,
+    write_csv_rows,
+    write_jsonl_rows,
+)
+
+app = typer.Typer(
+    help="Convert many amounts at once from CSV or JSON Lines",
+    add_completion=False,
+)
+
+
+class BatchFormat(str, Enum):
+    csv = "csv"
+    jsonl = "jsonl"
+
+
+@app.command()
+def batch(
+    input_file: Annotated[
+        Optional[Path],
+        typer.Argument(help="File with amount,from,to records. Reads stdin when omitted"),
+    ] = None,
+    batch_format: Annotated[
+        BatchFormat,
+        typer.Option("--format", "-f", help="Input and output format: csv or jsonl"),
+    ] = BatchFormat.csv,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", min=1, help="Concurrent rate fetches"),
+    ] = 4,
+):
+    """Convert a stream of amount,from,to records."""
+    source = input_file.open("r", newline="") if input_file else sys.stdin
+
+    try:
+        if batch_format == BatchFormat.jsonl:
+            records = read_jsonl_records(source)
+            write_rows = write_jsonl_rows
+        else:
+            records = read_csv_records(source)
+            write_rows = write_csv_rows
+
+        converter = BatchConverter(bootstrap_client(), max_workers=workers)
+        failed = write_rows(converter.convert(records), sys.stdout)
+    finally:
+        if input_file:
+            source.close()
+
+    if failed:
+        typer.echo(f"{failed} record(s) failed", err=True)
+        raise typer.Exit(code=1)
@@ -1,41 +1,61 @@
-from enum import Enum
+import importlib
+import sys
+from functools import cache
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
 from typing_extensions import Annotated
 
-from cur.adapters.clipboard import copy
+from cur.adapters.clipboard import ClipboardError, start_copy
 from cur.bootstrap import bootstrap
-from cur.core.exception import ParseError
-from cur.services.parser import parse_amount, parse_currency
-from cur.utils.formatters.korean_formatter import format_korean
-from cur.utils.formatters.number_formatter import (
-    format_plain,
-    format_short,
-    format_with_commas,
+from cur.core.exception import ParseError, RateNotFoundError
+from cur.entrypoints.subcommands import SUBCOMMANDS
+from cur.entrypoints.output import (
+    CopyFormat,
+    Line,
+    OutputFormat,
+    clipboard_value,
+    copied_line,
+    error_line,
+    render_error,
+    render_result,
+    result_lines,
+    to_ansi,
+    to_markup,
 )
+from cur.services.parser import parse_amount, parse_currency, parse_datetime
+from cur.utils import tracing
 
 app = typer.Typer(
-    help="Quick currency conversion tool for AUD, KRW, and USD",
+    help="Quick currency conversion tool for any ISO 4217 currency",
     add_completion=False,
 )
-console = Console(highlighter=None)  # Disable automatic highlighting
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-class CopyFormat(str, Enum):
-    default = "default"
-    plain = "plain"
-    short = "short"
 
+@cache
+def _console() -> "Console":
+    # Only the default output goes through Rich; the others never import it.
+    from rich.console import Console
 
-@app.command()
+    return Console(highlighter=None)  # Disable automatic highlighting
+
+
+@app.command(
+    epilog=(
+        f"Other commands: {', '.join(SUBCOMMANDS)}. "
+        "Run `cur <command> --help` for their options."
+    )
+)
 def convert(
     amount: Annotated[
         str,
         typer.Argument(help="Amount to convert. Supports commas and K/M/B units (e.g., 100, 1,000,000, 1.5K)"),
     ],
-    from_currency: Annotated[str, typer.Argument(help="Source currency (AUD/KRW/USD, case insensitive)")],
-    to_currency: Annotated[str, typer.Argument(help="Target currency (AUD/KRW/USD, case insensitive)")],
+    from_currency: Annotated[str, typer.Argument(help="Source currency (ISO 4217 code such as USD, KRW or EUR, case insensitive)")],
+    to_currency: Annotated[str, typer.Argument(help="Target currency (ISO 4217 code such as USD, KRW or EUR, case insensitive)")],
     copy_format: Annotated[
         CopyFormat,
         typer.Option(
@@ -44,59 +64,95 @@ def convert(
             help="Format for clipboard: default (with commas), plain (no commas), short (K/M/B)",
         ),
     ] = CopyFormat.default,
+    output: Annotated[
+        OutputFormat,
+        typer.Option(
+            "--output",
+            "-o",
+            help="default (colored), plain (no color), json or script-filter (Alfred). json and script-filter do not copy",
+        ),
+    ] = OutputFormat.default,
+    at: Annotated[
+        Optional[str],
+        typer.Option(
+            "--at",
+            help="Use the rates recorded at this time: YYYY-MM-DD (end of day) or ISO 8601, UTC unless an offset is given",
+        ),
+    ] = None,
+    trace: Annotated[
+        bool,
+        typer.Option(
+            "--trace",
+            help=f"Print how long each stage took to stderr (or set {tracing.ENV_VAR})",
+        ),
+    ] = False,
 ):
-    """Quick currency conversion tool for AUD, KRW, and USD."""
+    """Quick currency conversion tool for any ISO 4217 currency."""
+    if trace:
+        tracing.start()
+
     try:
         # Parse inputs
-        parsed_amount = parse_amount(amount)
-        from_cur = parse_currency(from_currency)
-        to_cur = parse_currency(to_currency)
+        with tracing.span("parse"):
+            parsed_amount = parse_amount(amount)
+            from_cur = parse_currency(from_currency)
+            to_cur = parse_currency(to_currency)
+            parsed_at = parse_datetime(at) if at is not None else None
 
         # Convert
-        service = bootstrap()
-        result = service.convert(parsed_amount, from_cur, to_cur)
-
-        # Format amounts for display
-        from_formatted = format_with_commas(result.base_amount)
-        to_formatted = format_with_commas(result.target_amount)
-        korean_formatted = format_korean(result.target_amount, to_cur)
-        short_formatted = format_short(result.target_amount)
-
-        # Display result
-        console.print(
-            f"[bold green]{from_formatted}[/bold green] [bold cyan]{result.base_currency}[/bold cyan] → "
-            f"[bold green]{to_formatted}[/bold green] [bold cyan]{result.target_currency}[/bold cyan]"
-        )
-        console.print(
-            f"[bold green]{korean_formatted}[/bold green] "
-            f"([bold green]{short_formatted}[/bold green])"
-        )
-        console.print(
-            f"Rate: 1 [bold cyan]{result.base_currency}[/bold cyan] = "
-            f"[bold green]{result.exchange_rate}[/bold green] [bold cyan]{result.target_currency}[/bold cyan]"
-        )
-
-        # Copy to clipboard based on format
-        if copy_format == CopyFormat.plain:
-            clipboard_value = format_plain(result.target_amount)
-        elif copy_format == CopyFormat.short:
-            clipboard_value = short_formatted
-        else:  # default
-            clipboard_value = to_formatted
-
-        copy(clipboard_value)
-        console.print(f"[green]✓[/green] Copied: [yellow]{clipboard_value}[/yellow]")
-
-    except ParseError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        with tracing.span("bootstrap"):
+            service = bootstrap()
+        with tracing.span("convert"):
+            result = service.convert(parsed_amount, from_cur, to_cur, at=parsed_at)
+
+        if not output.copies:
+            with tracing.span("render"):
+                typer.echo(render_result(result, to_cur, output, copy_format), nl=False)
+            return
+
+        # Copy to clipboard based on format, while the result is displayed
+        value = clipboard_value(result, copy_format)
+        pending_copy = start_copy(value)
+
+        with tracing.span("render"):
+            _print_lines(result_lines(result, to_cur), output)
+
+        with tracing.span("copy"):
+            pending_copy.wait()
+        _print_lines([copied_line(value)], output)
+
+    except (ParseError, RateNotFoundError, ClipboardError) as e:
+        if output == OutputFormat.default:
+            _console().print(to_markup(error_line(str(e))))
+        else:
+            typer.echo(render_error(str(e), output), nl=False)
         raise typer.Exit(code=1)
-    except Exception:
-        console.print_exception()
+    except Exception as e:
+        if output == OutputFormat.default:
+            _console().print_exception()
+        else:
+            typer.echo(render_error(f"{type(e).__name__}: {e}", output), nl=False)
         raise typer.Exit(code=1)
 
 
+def _print_lines(lines: list[Line], output: OutputFormat) -> None:
+    if output == OutputFormat.default:
+        for line in lines:
+            _console().print(to_markup(line))
+    else:
+        typer.echo("".join(to_ansi(line, False) + "\n" for line in lines), nl=False)
+
+
 def main():
-    app()
+    args = sys.argv[1:]
+
+    # `cur <amount> <from> <to>` stays the default command; subcommand names
+    # can never collide with an amount. Only the chosen subcommand is imported.
+    if args and args[0] in SUBCOMMANDS:
+        subcommand = importlib.import_module(SUBCOMMANDS[args[0]])
+        subcommand.app(args=args[1:], prog_name=f"cur {args[0]}")
+    else:
+        app()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,234 @@
+import json
+import os
+import socketserver
+import stat
+import subprocess
+import sys
+import threading
+import time
+
+import typer
+from typing_extensions import Annotated
+
+from cur.adapters.refresher import ThreadRefresher
+from cur.bootstrap import bootstrap
+from cur.core.exception import ParseError, RateNotFoundError
+from cur.entrypoints.daemon_client import send_request, socket_path
+from cur.entrypoints.output import (
+    CopyFormat,
+    Line,
+    OutputFormat,
+    clipboard_value,
+    copied_line,
+    render_error,
+    render_result,
+    to_ansi,
+)
+from cur.services.conversion import ConversionService
+from cur.services.parser import parse_amount, parse_currency
+from cur.utils.metrics import REGISTRY
+from cur.utils.runtime import InsecurePathError, check_private
+
+app = typer.Typer(
+    help="Keep a resident converter running so `cur` answers without startup cost",
+    add_completion=False,
+)
+
+
+def _render(lines: list[Line], color: bool) -> str:
+    return "".join(to_ansi(line, color) + "\n" for line in lines)
+
+
+def handle_request(service: ConversionService, request: dict) -> dict:
+    op = request.get("op")
+
+    if op == "ping":
+        return {"ok": True, "pid": os.getpid()}
+
+    if op == "metrics":
+        return {
+            "ok": True,
+            "prometheus": REGISTRY.render_prometheus(),
+            "snapshot": REGISTRY.snapshot(),
+        }
+
+    if op != "convert":
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+    color = bool(request.get("color"))
+    try:
+        copy_format = CopyFormat(request.get("copy", CopyFormat.default.value))
+        output = OutputFormat(request.get("output", OutputFormat.default.value))
+        parsed_amount = parse_amount(request["amount"])
+        from_cur = parse_currency(request["from"])
+        to_cur = parse_currency(request["to"])
+
+        result = service.convert(parsed_amount, from_cur, to_cur)
+    except (ParseError, RateNotFoundError) as e:
+        return {
+            "ok": False,
+            "output": render_error(str(e), output, color),
+        }
+    except Exception:
+        # Let the client redo the call in-process so it can show the traceback.
+        return {"ok": False, "fallback": True}
+
+    rendered = render_result(result, to_cur, output, copy_format, color)
+    if not output.copies:
+        return {"ok": True, "output": rendered, "clipboard": None}
+
+    value = clipboard_value(result, copy_format)
+    return {
+        "ok": True,
+        "output": rendered,
+        "clipboard": value,
+        "copied": _render(
+            [copied_line(value)], color and output == OutputFormat.default
+        ),
+    }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError:
+            response = {"ok": False, "error": "Malformed request"}
+        else:
+            if request.get("op") == "shutdown":
+                response = {"ok": True}
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                response = handle_request(self.server.service, request)
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, service: ConversionService) -> None:
+        self.service = service
+        if os.path.lexists(path):
+            # Only a stale socket of our own, left by a daemon that died, is
+            # removed; anything else at the path raises InsecurePathError.
+            check_private(path, stat.S_IFSOCK)
+            os.unlink(path)
+
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(path, _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.server_address)
+        except OSError:
+            pass
+
+
+def _checked_socket_path() -> str:
+    try:
+        return socket_path()
+    except InsecurePathError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def serve():
+    """Run the daemon in the foreground."""
+    path = _checked_socket_path()
+    if send_request({"op": "ping"}, path) is not None:
+        typer.echo(f"Daemon already running on {path}", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        server = DaemonServer(path, bootstrap(ThreadRefresher()))
+    except InsecurePathError as e:
+        typer.echo(f"Error: refusing to replace {path}: {e}", err=True)
+        raise typer.Exit(code=1)
+
+    with server:
+        typer.echo(f"Listening on {path}", err=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+@app.command()
+def start():
+    """Start the daemon in the background."""
+    _checked_socket_path()
+    if send_request({"op": "ping"}) is not None:
+        typer.echo("Daemon already running")
+        return
+
+    subprocess.Popen(
+        [sys.executable, "-m", "cur.entrypoints.daemon", "serve"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    for _ in range(50):
+        response = send_request({"op": "ping"})
+        if response is not None:
+            typer.echo(f"Daemon started (pid {response['pid']})")
+            return
+        time.sleep(0.1)
+
+    typer.echo("Daemon did not start", err=True)
+    raise typer.Exit(code=1)
+
+
+@app.command()
+def stop():
+    """Stop a running daemon."""
+    if send_request({"op": "shutdown"}) is None:
+        typer.echo("Daemon is not running")
+        return
+    typer.echo("Daemon stopped")
+
+
+@app.command("metrics")
+def show_metrics(
+    as_json: Annotated[
+        bool,
+        typer.Option("--json", help="Print a JSON snapshot instead of Prometheus text"),
+    ] = False,
+):
+    """Print the running daemon's cache, HTTP and rate-age metrics."""
+    response = send_request({"op": "metrics"})
+    if response is None:
+        typer.echo("Daemon is not running", err=True)
+        raise typer.Exit(code=1)
+
+    if as_json:
+        typer.echo(json.dumps(response["snapshot"], indent=2))
+    else:
+        typer.echo(response["prometheus"], nl=False)
+
+
+@app.command()
+def status():
+    """Show whether the daemon is running."""
+    response = send_request({"op": "ping"})
+    if response is None:
+        typer.echo("Daemon is not running")
+        raise typer.Exit(code=1)
+    typer.echo(f"Daemon running (pid {response['pid']}) on {socket_path()}")
+
+
+if __name__ == "__main__":
+    app()
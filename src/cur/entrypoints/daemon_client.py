@@ -0,0 +1,52 @@
+# Imported on every `cur` call: keep this module free of third-party imports.
+import json
+import os
+import socket
+import stat
+
+from cur.utils.runtime import check_private, private_runtime_dir
+
+CONNECT_TIMEOUT = 0.2
+RESPONSE_TIMEOUT = 30.0
+
+
+def socket_path() -> str:
+    """Raises InsecurePathError when the runtime dir is not private to us."""
+    path = os.environ.get("CURRENCY_TRANSLATOR_SOCKET")
+    if path:
+        return path
+
+    return os.path.join(
+        private_runtime_dir(), f"currency-translator-{os.getuid()}.sock"
+    )
+
+
+def send_request(payload: dict, path: str | None = None) -> dict | None:
+    """
+    Send one request to the daemon. Returns None when no daemon is listening
+    or its reply is not a JSON object with an ``ok`` field, e.g. because it
+    died mid-write or speaks another protocol version.
+
+    A socket that is not ours alone is never connected to: whoever planted
+    it could answer with made-up conversions and clipboard text.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    try:
+        path = path or socket_path()
+        check_private(path, stat.S_IFSOCK)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(path)
+            sock.settimeout(RESPONSE_TIMEOUT)
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+
+            with sock.makefile("rb") as reader:
+                response = json.loads(reader.readline())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(response, dict) or "ok" not in response:
+        return None
+    return response
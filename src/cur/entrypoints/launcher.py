@@ -0,0 +1,183 @@
+# Entry point for the `cur` script. Only the standard library is imported
+# until we know whether a running daemon can answer the request, and the
+# common convert form never imports Typer, Rich or (on a cache hit) httpx.
+import os
+import sys
+
+from cur.entrypoints.daemon_client import send_request
+from cur.entrypoints.subcommands import SUBCOMMANDS
+from cur.utils import metrics, tracing
+
+COPY_FORMATS = ("default", "plain", "short")
+OUTPUT_FORMATS = ("default", "plain", "json", "script-filter")
+
+
+def parse_convert_args(args: list[str]) -> dict | None:
+    """
+    Recognise the plain `cur <amount> <from> <to> [-c FORMAT] [-o OUTPUT]` form.
+
+    Returns None for anything else (help, subcommands, unusual flags), which
+    is then left to the full Typer CLI.
+    """
+    positionals = []
+    options = {"copy": "default", "output": "default"}
+
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg in ("-c", "--copy", "-o", "--output"):
+            if index + 1 >= len(args):
+                return None
+            options["copy" if arg in ("-c", "--copy") else "output"] = args[index + 1]
+            index += 2
+            continue
+
+        if arg.startswith(("--copy=", "--output=")):
+            name, _, value = arg[2:].partition("=")
+            options[name] = value
+        elif arg == "--trace":
+            pass
+        elif arg.startswith("-"):
+            return None
+        else:
+            positionals.append(arg)
+        index += 1
+
+    if len(positionals) != 3 or options["copy"] not in COPY_FORMATS:
+        return None
+    if options["output"] not in OUTPUT_FORMATS:
+        return None
+    if positionals[0] in SUBCOMMANDS:
+        return None
+
+    amount, from_currency, to_currency = positionals
+    return {
+        "amount": amount,
+        "from": from_currency,
+        "to": to_currency,
+        **options,
+    }
+
+
+def _color_enabled() -> bool:
+    return sys.stdout.isatty() and "NO_COLOR" not in os.environ
+
+
+def _convert_with_daemon(request: dict) -> int | None:
+    response = send_request({"op": "convert", "color": _color_enabled(), **request})
+    if response is None or response.get("fallback"):
+        return None
+    # Anything but a rendered conversion is redone in-process.
+    output = response.get("output")
+    if not isinstance(output, str):
+        return None
+
+    clipboard_text = response.get("clipboard")
+    if not response["ok"] or not isinstance(clipboard_text, str):
+        sys.stdout.write(output)
+        return 0 if response["ok"] else 1
+
+    from cur.adapters.clipboard import start_copy
+
+    pending_copy = start_copy(clipboard_text)
+    sys.stdout.write(output)
+    try:
+        pending_copy.wait()
+    except Exception as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    sys.stdout.write(response.get("copied", ""))
+    return 0
+
+
+def _convert_in_process(request: dict) -> int:
+    with tracing.span("imports"):
+        from cur.adapters.clipboard import ClipboardError, start_copy
+        from cur.bootstrap import bootstrap
+        from cur.core.exception import ParseError, RateNotFoundError
+        from cur.entrypoints.output import (
+            CopyFormat,
+            OutputFormat,
+            clipboard_value,
+            copied_line,
+            render_error,
+            render_result,
+            to_ansi,
+        )
+        from cur.services.parser import parse_amount, parse_currency
+
+    output = OutputFormat(request["output"])
+    copy_format = CopyFormat(request["copy"])
+    color = _color_enabled() and output == OutputFormat.default
+    write = sys.stdout.write
+    try:
+        with tracing.span("parse"):
+            parsed_amount = parse_amount(request["amount"])
+            from_cur = parse_currency(request["from"])
+            to_cur = parse_currency(request["to"])
+
+        with tracing.span("bootstrap"):
+            service = bootstrap()
+        with tracing.span("convert"):
+            result = service.convert(parsed_amount, from_cur, to_cur)
+
+        if not output.copies:
+            with tracing.span("render"):
+                write(render_result(result, to_cur, output, copy_format))
+            return 0
+
+        value = clipboard_value(result, copy_format)
+        pending_copy = start_copy(value)
+
+        with tracing.span("render"):
+            write(render_result(result, to_cur, output, copy_format, color))
+
+        with tracing.span("copy"):
+            pending_copy.wait()
+        write(to_ansi(copied_line(value), color) + "\n")
+
+    except (ParseError, RateNotFoundError, ClipboardError) as e:
+        write(render_error(str(e), output, color))
+        return 1
+    except Exception as e:
+        if output != OutputFormat.default:
+            write(render_error(f"{type(e).__name__}: {e}", output))
+            return 1
+
+        from rich.console import Console
+
+        sys.stdout.flush()
+        Console(highlighter=None).print_exception()
+        return 1
+
+    return 0
+
+
+def main():
+    args = sys.argv[1:]
+    if "--trace" in args and args[0] not in SUBCOMMANDS:
+        tracing.start()
+    else:
+        tracing.start_from_environment()
+
+    metrics_path = os.getenv(metrics.ENV_VAR)
+    if metrics_path:
+        metrics.write_snapshot_at_exit(metrics_path)
+
+    request = parse_convert_args(args)
+    if request is not None:
+        with tracing.span("daemon"):
+            exit_code = _convert_with_daemon(request)
+        if exit_code is None:
+            exit_code = _convert_in_process(request)
+        sys.stdout.flush()
+        sys.exit(exit_code)
+
+    with tracing.span("imports"):
+        from cur.entrypoints.cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
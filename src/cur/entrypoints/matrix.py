@@ -0,0 +1,66 @@
+from typing import List, Optional
+
+import typer
+from typing_extensions import Annotated
+
+from cur.adapters.rate_matrix import RateMatrix
+from cur.bootstrap import bootstrap_client, configured_currencies
+from cur.core.entity import Currency
+from cur.core.exception import ParseError
+from cur.services.parser import parse_currency
+
+app = typer.Typer(
+    help="Print the cross rates between currencies",
+    add_completion=False,
+)
+
+
+def format_matrix(matrix: RateMatrix, currencies: list[Currency]) -> list[str]:
+    """One row per base currency: how much of each column's currency 1 unit buys."""
+    cells = [
+        ["" if rate != rate else f"{rate:.6g}" for rate in row]
+        for row in (
+            [matrix.rate(base, target) for target in currencies]
+            for base in currencies
+        )
+    ]
+    width = max([len(cell) for row in cells for cell in row] + [3])
+
+    lines = ["    " + " ".join(c.code.rjust(width) for c in currencies)]
+    for base, row in zip(currencies, cells):
+        lines.append(f"{base.code} " + " ".join(cell.rjust(width) for cell in row))
+    return lines
+
+
+@app.command()
+def matrix(
+    currencies: Annotated[
+        Optional[List[str]],
+        typer.Argument(
+            help="Currencies to include. Defaults to CURRENCY_TRANSLATOR_CURRENCIES"
+        ),
+    ] = None,
+):
+    """Print the cross-rate table: 1 unit of the row currency in each column."""
+    try:
+        if currencies:
+            chosen = [parse_currency(code) for code in currencies]
+        else:
+            chosen = configured_currencies()
+    except ParseError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+    client = bootstrap_client()
+    rate_matrix = client.rate_matrix()
+    if not rate_matrix.is_fresh():
+        # One table is enough to triangulate every other row.
+        try:
+            client.refresh(chosen[0])
+        except Exception as e:
+            typer.echo(f"Error: Cannot fetch {chosen[0].code} rates: {e}", err=True)
+            raise typer.Exit(code=1)
+        rate_matrix = client.rate_matrix()
+
+    for line in format_matrix(rate_matrix, chosen):
+        typer.echo(line)
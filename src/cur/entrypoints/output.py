@@ -0,0 +1,190 @@
+# Shared by the Typer CLI, the daemon and the launcher's fast path, so it
+# must not import Rich or Typer.
+import json
+from enum import Enum
+
+from cur.core.entity import Currency
+from cur.services.conversion import ConversionResult
+from cur.utils.formatters.korean_formatter import format_korean
+from cur.utils.formatters.number_formatter import (
+    format_plain,
+    format_short,
+    format_with_commas,
+)
+
+# A line is a list of (text, style) segments; style is a Rich style name.
+Line = list[tuple[str, str | None]]
+
+_ANSI_CODES = {
+    "bold green": "1;32",
+    "bold cyan": "1;36",
+    "green": "32",
+    "yellow": "33",
+    "red": "31",
+}
+
+
+# Bump when a field of the json or script-filter output changes meaning or
+# goes away; new fields may be added without a bump.
+JSON_SCHEMA_VERSION = 1
+
+
+class CopyFormat(str, Enum):
+    default = "default"
+    plain = "plain"
+    short = "short"
+
+
+class OutputFormat(str, Enum):
+    # Colored lines, then the clipboard copy
+    default = "default"
+    # The same lines without color
+    plain = "plain"
+    # One JSON object; nothing is copied, the caller picks the value it wants
+    json = "json"
+    # Alfred Script Filter JSON, also read by Raycast-style launchers
+    script_filter = "script-filter"
+
+    @property
+    def copies(self) -> bool:
+        return self in (OutputFormat.default, OutputFormat.plain)
+
+
+def result_lines(result: ConversionResult, to_cur: Currency) -> list[Line]:
+    # Format amounts for display
+    from_formatted = format_with_commas(result.base_amount)
+    to_formatted = format_with_commas(result.target_amount)
+    korean_formatted = format_korean(result.target_amount, to_cur)
+    short_formatted = format_short(result.target_amount)
+
+    return [
+        [
+            (from_formatted, "bold green"),
+            (" ", None),
+            (result.base_currency, "bold cyan"),
+            (" → ", None),
+            (to_formatted, "bold green"),
+            (" ", None),
+            (result.target_currency, "bold cyan"),
+        ],
+        [
+            (korean_formatted, "bold green"),
+            (" (", None),
+            (short_formatted, "bold green"),
+            (")", None),
+        ],
+        [
+            ("Rate: 1 ", None),
+            (result.base_currency, "bold cyan"),
+            (" = ", None),
+            (str(result.exchange_rate), "bold green"),
+            (" ", None),
+            (result.target_currency, "bold cyan"),
+        ],
+    ]
+
+
+def clipboard_value(result: ConversionResult, copy_format: CopyFormat) -> str:
+    if copy_format == CopyFormat.plain:
+        return format_plain(result.target_amount)
+    elif copy_format == CopyFormat.short:
+        return format_short(result.target_amount)
+    else:  # default
+        return format_with_commas(result.target_amount)
+
+
+def copied_line(value: str) -> Line:
+    return [("✓", "green"), (" Copied: ", None), (value, "yellow")]
+
+
+def error_line(message: str) -> Line:
+    return [("Error:", "red"), (f" {message}", None)]
+
+
+def to_markup(line: Line) -> str:
+    return "".join(
+        f"[{style}]{text}[/{style}]" if style else text for text, style in line
+    )
+
+
+def to_ansi(line: Line, color: bool) -> str:
+    if not color:
+        return "".join(text for text, _ in line)
+
+    return "".join(
+        f"\x1b[{_ANSI_CODES[style]}m{text}\x1b[0m" if style else text
+        for text, style in line
+    )
+
+
+def result_fields(
+    result: ConversionResult, to_cur: Currency, copy_format: CopyFormat
+) -> dict:
+    """The stable machine-readable form of a result, as written by --output json."""
+    return {
+        "schema": JSON_SCHEMA_VERSION,
+        "base": {
+            "amount": result.base_amount,
+            "currency": result.base_currency,
+            "formatted": format_with_commas(result.base_amount),
+        },
+        "target": {
+            "amount": result.target_amount,
+            "currency": result.target_currency,
+            "formatted": format_with_commas(result.target_amount),
+            "plain": format_plain(result.target_amount),
+            "short": format_short(result.target_amount),
+            "korean": format_korean(result.target_amount, to_cur),
+        },
+        "rate": result.exchange_rate,
+        "rate_updated_unix": result.rate_updated_unix,
+        "rate_source": result.rate_source,
+        "copy": clipboard_value(result, copy_format),
+    }
+
+
+def render_result(
+    result: ConversionResult,
+    to_cur: Currency,
+    output: OutputFormat,
+    copy_format: CopyFormat,
+    color: bool = False,
+) -> str:
+    if output == OutputFormat.json:
+        fields = result_fields(result, to_cur, copy_format)
+        return json.dumps(fields, ensure_ascii=False) + "\n"
+
+    if output == OutputFormat.script_filter:
+        fields = result_fields(result, to_cur, copy_format)
+        target = fields["target"]
+        title = f"{target['formatted']} {result.target_currency}"
+        subtitle = (
+            f"{target['korean']} ({target['short']}) · "
+            f"1 {result.base_currency} = {result.exchange_rate} "
+            f"{result.target_currency}"
+        )
+        item = {
+            "uid": f"{result.base_currency}-{result.target_currency}",
+            "title": title,
+            "subtitle": subtitle,
+            "arg": fields["copy"],
+            "text": {"copy": fields["copy"], "largetype": title},
+            "variables": {"schema": str(JSON_SCHEMA_VERSION)},
+        }
+        return json.dumps({"items": [item]}, ensure_ascii=False) + "\n"
+
+    color = color and output == OutputFormat.default
+    return "".join(to_ansi(line, color) + "\n" for line in result_lines(result, to_cur))
+
+
+def render_error(message: str, output: OutputFormat, color: bool = False) -> str:
+    if output == OutputFormat.json:
+        fields = {"schema": JSON_SCHEMA_VERSION, "error": message}
+        return json.dumps(fields, ensure_ascii=False) + "\n"
+
+    if output == OutputFormat.script_filter:
+        item = {"title": message, "subtitle": "Error", "valid": False}
+        return json.dumps({"items": [item]}, ensure_ascii=False) + "\n"
+
+    color = color and output == OutputFormat.default
+    return to_ansi(error_line(message), color) + "\n"
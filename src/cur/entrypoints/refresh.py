@@ -0,0 +1,15 @@
+# Spawned by ProcessRefresher to refresh rate tables after the CLI has exited.
+import sys
+
+from cur.bootstrap import bootstrap_client
+from cur.core.entity import Currency
+
+
+def main():
+    client = bootstrap_client()
+    for code in sys.argv[1:]:
+        client.refresh(Currency.from_string(code))
+
+
+if __name__ == "__main__":
+    main()
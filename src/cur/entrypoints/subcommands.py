@@ -0,0 +1,10 @@
+# The `cur <name> ...` subcommands and the modules defining their Typer apps.
+# Read by the launcher on every call, so it must not import anything; only
+# the selected subcommand's module is ever imported.
+SUBCOMMANDS = {
+    "batch": "cur.entrypoints.batch",
+    "daemon": "cur.entrypoints.daemon",
+    "matrix": "cur.entrypoints.matrix",
+    "warm": "cur.entrypoints.warm",
+    "watch": "cur.entrypoints.watch",
+}
@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime
+from typing import List, Optional
+
+import typer
+from typing_extensions import Annotated
+
+from cur.bootstrap import bootstrap_async_client, configured_currencies
+from cur.core.exception import ParseError
+from cur.services.parser import parse_currency
+from cur.services.warm import WarmResult, warm_cache
+
+app = typer.Typer(
+    help="Prefetch rate tables so later conversions are answered from the cache",
+    add_completion=False,
+)
+
+
+def _format_result(result: WarmResult) -> str:
+    latency = f"{result.latency * 1000:6.0f} ms"
+    if result.error is not None:
+        return f"{result.base_code}  failed   {latency}  {result.error}"
+
+    status = "fetched" if result.fetched else "cached "
+    expires = datetime.fromtimestamp(result.expires_at_unix or 0)
+    return f"{result.base_code}  {status}  {latency}  expires {expires:%Y-%m-%d %H:%M}"
+
+
+async def _warm(bases, concurrency: int, force: bool) -> list[WarmResult]:
+    client = bootstrap_async_client()
+    try:
+        return await warm_cache(client, bases, concurrency=concurrency, force=force)
+    finally:
+        await client.aclose()
+
+
+@app.command()
+def warm(
+    currencies: Annotated[
+        Optional[List[str]],
+        typer.Argument(
+            help="Base currencies to prefetch. Defaults to CURRENCY_TRANSLATOR_CURRENCIES"
+        ),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-c", min=1, help="Concurrent fetches"),
+    ] = 8,
+    force: Annotated[
+        bool,
+        typer.Option("--force", help="Refetch tables that are still fresh"),
+    ] = False,
+):
+    """Fetch every base currency's rate table into the cache."""
+    try:
+        if currencies:
+            bases = [parse_currency(code) for code in currencies]
+        else:
+            bases = configured_currencies()
+    except ParseError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+    results = asyncio.run(_warm(bases, concurrency, force))
+    for result in results:
+        typer.echo(_format_result(result))
+
+    if any(result.error is not None for result in results):
+        raise typer.Exit(code=1)
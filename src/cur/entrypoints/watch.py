@@ -0,0 +1,161 @@
+import sys
+import time
+from datetime import datetime
+from typing import Callable, List, TextIO
+
+import typer
+from typing_extensions import Annotated
+
+from cur.adapters.refresher import ThreadRefresher
+from cur.bootstrap import bootstrap_client
+from cur.core.exception import ParseError
+from cur.entrypoints.output import Line, to_ansi
+from cur.services.parser import parse_amount, parse_currency
+from cur.services.watch import RateWatcher, WatchedConversion, WatchRow
+from cur.utils.formatters.korean_formatter import format_korean
+from cur.utils.formatters.number_formatter import format_short, format_with_commas
+
+# Long sleeps are split so a suspended laptop catches up soon after waking.
+MAX_SLEEP = 60.0
+
+app = typer.Typer(
+    help="Keep conversions on screen and update them when the rates change",
+    add_completion=False,
+)
+
+
+def row_line(row: WatchRow) -> Line:
+    conversion = row.conversion
+    line: Line = [
+        (format_with_commas(conversion.amount), "bold green"),
+        (" ", None),
+        (conversion.base_currency.code, "bold cyan"),
+        (" → ", None),
+    ]
+    if row.result is None:
+        return line + [
+            (conversion.target_currency.code, "bold cyan"),
+            ("  ", None),
+            ("Error:", "red"),
+            (f" {row.error}", None),
+        ]
+
+    result = row.result
+    line += [
+        (format_with_commas(result.target_amount), "bold green"),
+        (" ", None),
+        (result.target_currency, "bold cyan"),
+        ("  ", None),
+        (format_korean(result.target_amount, conversion.target_currency), None),
+        (f" ({format_short(result.target_amount)})", None),
+        (f"  @ {result.exchange_rate}", None),
+    ]
+    if row.stale:
+        line.append(("  stale", "yellow"))
+    return line
+
+
+class LiveTable:
+    """
+    Draws every row once, then rewrites only the rows that changed.
+
+    On a terminal the changed rows are redrawn in place with ANSI cursor
+    moves, below them a status line says when the next poll is due.
+    Elsewhere (a pipe or a log file) each change is appended as a new line.
+    """
+
+    def __init__(self, out: TextIO, color: bool, in_place: bool) -> None:
+        self._out = out
+        self._color = color
+        self._in_place = in_place
+        self._drawn = 0
+
+    def show(self, rows: list[WatchRow], changed: list[int], next_poll: float) -> None:
+        status = f"Next update {datetime.fromtimestamp(next_poll):%Y-%m-%d %H:%M}"
+        if not self._in_place:
+            for index in changed:
+                self._out.write(to_ansi(row_line(rows[index]), self._color) + "\n")
+        elif self._drawn != len(rows):
+            for row in rows:
+                self._out.write(to_ansi(row_line(row), self._color) + "\n")
+            self._out.write(f"{status} · Ctrl-C to quit\n")
+            self._drawn = len(rows)
+        else:
+            for index in changed:
+                self._rewrite(index, to_ansi(row_line(rows[index]), self._color))
+            self._rewrite(len(rows), f"{status} · Ctrl-C to quit")
+        self._out.flush()
+
+    def _rewrite(self, index: int, text: str) -> None:
+        # The cursor rests on the line below the status line.
+        up = self._drawn + 1 - index
+        self._out.write(f"\x1b[{up}A\r\x1b[2K{text}\x1b[{up}B\r")
+
+
+def watch_loop(
+    watcher: RateWatcher,
+    table: LiveTable,
+    clock: Callable[[], float] | None = None,
+    sleep: Callable[[float], None] | None = None,
+) -> None:
+    """Poll and redraw until interrupted."""
+    clock = clock or time.time
+    sleep = sleep or time.sleep
+
+    changed = watcher.poll()
+    while True:
+        next_poll = watcher.next_poll_at(clock())
+        table.show(watcher.rows, changed, next_poll)
+
+        while (remaining := next_poll - clock()) > 0:
+            sleep(min(remaining, MAX_SLEEP))
+        changed = watcher.poll()
+
+
+def parse_conversions(args: list[str]) -> list[WatchedConversion]:
+    if not args or len(args) % 3 != 0:
+        raise ParseError("Give conversions as <amount> <from> <to>, e.g. 100 usd krw")
+
+    return [
+        WatchedConversion(
+            parse_amount(amount), parse_currency(from_code), parse_currency(to_code)
+        )
+        for amount, from_code, to_code in zip(args[::3], args[1::3], args[2::3])
+    ]
+
+
+@app.command()
+def watch(
+    conversions: Annotated[
+        List[str],
+        typer.Argument(
+            help="One or more conversions as <amount> <from> <to>, e.g. 100 usd krw 1k krw usd"
+        ),
+    ],
+    interval: Annotated[
+        float,
+        typer.Option(
+            "--min-interval",
+            min=1,
+            help="Never poll more often than this many seconds, even if upstream is late",
+        ),
+    ] = 60.0,
+):
+    """Show the conversions and update them in place when their rates change."""
+    try:
+        watched = parse_conversions(conversions)
+    except ParseError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+    # One client for the whole session: its cache and HTTP connection are
+    # reused by every poll, and expired tables are refreshed on a thread.
+    client = bootstrap_client(ThreadRefresher())
+    watcher = RateWatcher(
+        client, watched, min_interval=interval, retry_interval=interval
+    )
+    terminal = sys.stdout.isatty()
+    try:
+        watch_loop(watcher, LiveTable(sys.stdout, color=terminal, in_place=terminal))
+    except KeyboardInterrupt:
+        pass
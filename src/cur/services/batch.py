@@ -0,0 +1,257 @@
+import csv
+import json
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Iterator, TextIO
+
+from cur.adapters.exchange_rate_client import ExchangeRateClient
+from cur.core.entity import Currency
+from cur.core.exception import ParseError
+from cur.services.conversion import ConversionResult
+from cur.services.parser import parse_amount, parse_currency
+from cur.utils.formatters.korean_formatter import format_korean
+from cur.utils.formatters.number_formatter import (
+    format_plain,
+    format_short,
+    format_with_commas,
+)
+
+OUTPUT_FIELDS = (
+    "amount",
+    "from",
+    "to",
+    "converted",
+    "formatted",
+    "korean",
+    "short",
+    "rate",
+    "error",
+)
+
+CSV_COLUMNS = ("amount", "from", "to")
+
+# A field that continues an amount split at its thousands separators.
+THOUSANDS_GROUP = re.compile(r"\d{3}(?!\d)")
+
+
+@dataclass(frozen=True)
+class BatchRecord:
+    amount: str
+    from_currency: str
+    to_currency: str
+
+
+@dataclass(frozen=True)
+class BatchRow:
+    record: BatchRecord
+    result: ConversionResult | None = None
+    error: str | None = None
+
+
+def read_csv_records(lines: Iterable[str]) -> Iterator[BatchRecord]:
+    """
+    Read ``amount,from,to`` rows.
+
+    When the first non-blank row is a header naming those columns, they are
+    picked by name and any other columns are ignored. Otherwise every row
+    must have exactly those three fields.
+
+    An amount with unquoted thousands separators spills into the fields
+    after it (``1,000,usd,krw``). They are joined back only when each one is
+    a three-digit group. Any other row with the wrong number of fields keeps
+    the whole row as its amount, so it is reported as invalid.
+    """
+    columns = (0, 1, 2)
+    width = 3
+    first = True
+    for row in csv.reader(lines):
+        if not row or not any(field.strip() for field in row):
+            continue
+
+        if first:
+            first = False
+            names = [field.strip().lower() for field in row]
+            if all(name in names for name in CSV_COLUMNS):
+                columns = tuple(names.index(name) for name in CSV_COLUMNS)
+                width = len(row)
+                continue
+
+        yield _csv_record(row, columns, width)
+
+
+def _csv_record(row: list[str], columns: tuple, width: int) -> BatchRecord:
+    amount = columns[0]
+    spill = row[amount + 1 : amount + 1 + len(row) - width]
+    if spill and all(THOUSANDS_GROUP.match(field) for field in spill):
+        end = amount + 1 + len(spill)
+        row = [*row[:amount], ",".join(row[amount:end]), *row[end:]]
+
+    if len(row) != width:
+        return BatchRecord(",".join(row), "", "")
+    return BatchRecord(*(row[index] for index in columns))
+
+
+def read_jsonl_records(lines: Iterable[str]) -> Iterator[BatchRecord]:
+    for line in lines:
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+            yield BatchRecord(
+                str(record["amount"]), str(record["from"]), str(record["to"])
+            )
+        except (json.JSONDecodeError, KeyError, TypeError):
+            yield BatchRecord(line.strip(), "", "")
+
+
+class BatchConverter:
+    """
+    Convert a stream of records with bounded memory.
+
+    Records are read up to ``window`` rows ahead of the output so that base
+    currencies seen for the first time are fetched concurrently, while rows
+    are still emitted in input order. Each pair's rate is resolved once.
+    """
+
+    def __init__(
+        self,
+        exchange_rate_client: ExchangeRateClient,
+        max_workers: int = 4,
+        window: int = 1024,
+    ) -> None:
+        self._client = exchange_rate_client
+        self._max_workers = max_workers
+        self._window = window
+        # Failed pairs keep their exception so a bad base is not retried per row.
+        self._rates: dict[tuple[Currency, Currency], float | Exception] = {}
+        self._pending: dict[Currency, tuple[Currency, Future]] = {}
+
+    def convert(self, records: Iterable[BatchRecord]) -> Iterator[BatchRow]:
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            in_flight: deque = deque()
+
+            for record in records:
+                in_flight.append(self._prepare(record, executor))
+                if len(in_flight) >= self._window:
+                    yield self._finish(*in_flight.popleft())
+
+            while in_flight:
+                yield self._finish(*in_flight.popleft())
+
+    def _prepare(self, record: BatchRecord, executor: ThreadPoolExecutor) -> tuple:
+        try:
+            amount = parse_amount(record.amount)
+            base_currency = parse_currency(record.from_currency)
+            target_currency = parse_currency(record.to_currency)
+        except ParseError as e:
+            return record, None, str(e)
+
+        pair = (base_currency, target_currency)
+        if pair not in self._rates and base_currency not in self._pending:
+            self._pending[base_currency] = (
+                target_currency,
+                executor.submit(self._client.get_rate, base_currency, target_currency),
+            )
+
+        return record, (amount, pair), None
+
+    def _finish(self, record: BatchRecord, parsed: tuple | None, error: str | None):
+        if parsed is None:
+            return BatchRow(record, error=error)
+
+        amount, pair = parsed
+        try:
+            exchange_rate = self._rate(pair)
+        except Exception as e:
+            return BatchRow(record, error=str(e))
+
+        base_currency, target_currency = pair
+        return BatchRow(
+            record,
+            result=ConversionResult(
+                base_amount=amount,
+                base_currency=base_currency.code,
+                target_amount=amount * exchange_rate,
+                target_currency=target_currency.code,
+                exchange_rate=exchange_rate,
+            ),
+        )
+
+    def _rate(self, pair: tuple[Currency, Currency]) -> float:
+        if pair not in self._rates:
+            base_currency, target_currency = pair
+            # The first pair seen for a base fetches its table; later pairs
+            # for the same base wait for it and are answered from the cache.
+            first_target, first_rate = self._pending[base_currency]
+            try:
+                if first_target is target_currency:
+                    self._rates[pair] = first_rate.result()
+                else:
+                    first_rate.exception()
+                    self._rates[pair] = self._client.get_rate(
+                        base_currency, target_currency
+                    )
+            except Exception as e:
+                self._rates[pair] = e
+
+        exchange_rate = self._rates[pair]
+        if isinstance(exchange_rate, Exception):
+            raise exchange_rate
+        return exchange_rate
+
+
+def _row_fields(row: BatchRow) -> dict:
+    record = row.record
+    result = row.result
+    if result is None:
+        return {
+            "amount": record.amount,
+            "from": record.from_currency,
+            "to": record.to_currency,
+            "converted": "",
+            "formatted": "",
+            "korean": "",
+            "short": "",
+            "rate": "",
+            "error": row.error or "",
+        }
+
+    return {
+        "amount": format_plain(result.base_amount),
+        "from": result.base_currency,
+        "to": result.target_currency,
+        "converted": format_plain(result.target_amount),
+        "formatted": format_with_commas(result.target_amount),
+        "korean": format_korean(
+            result.target_amount, Currency.from_string(result.target_currency)
+        ),
+        "short": format_short(result.target_amount),
+        "rate": result.exchange_rate,
+        "error": "",
+    }
+
+
+def write_csv_rows(rows: Iterable[BatchRow], out: TextIO) -> int:
+    writer = csv.DictWriter(out, fieldnames=OUTPUT_FIELDS)
+    writer.writeheader()
+
+    failed = 0
+    for row in rows:
+        failed += row.error is not None
+        writer.writerow(_row_fields(row))
+    return failed
+
+
+def write_jsonl_rows(rows: Iterable[BatchRow], out: TextIO) -> int:
+    failed = 0
+    for row in rows:
+        failed += row.error is not None
+        fields = _row_fields(row)
+        if not fields["error"]:
+            del fields["error"]
+        out.write(json.dumps(fields, ensure_ascii=False))
+        out.write("\n")
+    return failed
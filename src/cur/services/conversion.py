@@ -1,8 +1,16 @@
+from array import array
 from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable
 
 from cur.adapters.exchange_rate_client import ExchangeRateClient
+from cur.adapters.rate_resolver import ResolvedRate
 from cur.core.entity import Currency
 
+if TYPE_CHECKING:
+    from cur.adapters.async_exchange_rate_client import AsyncExchangeRateClient
+    from cur.core.money import Rounding
+
 
 @dataclass(frozen=True)
 class ConversionResult:
@@ -14,6 +22,11 @@ class ConversionResult:
 
     exchange_rate: float
 
+    # When upstream last updated the rate, and where it was read from
+    # (cache, network or history); None when the client does not say.
+    rate_updated_unix: int | None = None
+    rate_source: str | None = None
+
     def __str__(self) -> str:
         return (
             f"{self.base_amount:,.2f} {self.base_currency} = "
@@ -29,15 +42,90 @@ class ConversionService:
         self._client = exchange_rate_client
 
     def convert(
-        self, base_amount: float, base_currency: Currency, target_currency: Currency
+        self,
+        base_amount: float,
+        base_currency: Currency,
+        target_currency: Currency,
+        at: datetime | None = None,
+    ) -> ConversionResult:
+        """Convert at the current rate, or at the recorded rate in effect at `at`."""
+        if at is None:
+            resolved = self._client.resolve_rate(base_currency, target_currency)
+        else:
+            resolved = self._client.resolve_rate_at(
+                base_currency, target_currency, int(at.timestamp())
+            )
+
+        return _build_result(base_amount, base_currency, target_currency, resolved)
+
+    def convert_minor_many(
+        self,
+        amounts: Iterable[int],
+        base_currency: Currency,
+        target_currency: Currency,
+        rounding: "Rounding | None" = None,
+        at: datetime | None = None,
+    ) -> array:
+        """
+        Convert amounts given in minor units with exact integer arithmetic.
+
+        Returns an int64 array of target minor units, each rounded once with
+        `rounding` (half-even by default).
+        """
+        # Imported here: cur.core.money needs decimal, which plain conversions
+        # on the launcher's fast path never use.
+        from cur.core.money import FixedRate, Rounding, convert_minor_many
+
+        if rounding is None:
+            rounding = Rounding.HALF_EVEN
+        exchange_rate = self._get_rate(base_currency, target_currency, at)
+
+        return convert_minor_many(
+            amounts,
+            base_currency,
+            target_currency,
+            FixedRate.from_float(exchange_rate),
+            rounding,
+        )
+
+    def _get_rate(
+        self, base_currency: Currency, target_currency: Currency, at: datetime | None
     ) -> float:
-        exchange_rate = self._client.get_rate(base_currency, target_currency)
-        target_amount = base_amount * exchange_rate
-
-        return ConversionResult(
-            base_amount=base_amount,
-            base_currency=base_currency.code,
-            target_amount=target_amount,
-            target_currency=target_currency.code,
-            exchange_rate=exchange_rate,
+        if at is None:
+            return self._client.get_rate(base_currency, target_currency)
+        return self._client.get_rate_at(
+            base_currency, target_currency, int(at.timestamp())
         )
+
+
+class AsyncConversionService:
+    _client: "AsyncExchangeRateClient"
+
+    def __init__(self, exchange_rate_client: "AsyncExchangeRateClient") -> None:
+        self._client = exchange_rate_client
+
+    async def convert(
+        self, base_amount: float, base_currency: Currency, target_currency: Currency
+    ) -> ConversionResult:
+        resolved = await self._client.resolve_rate(base_currency, target_currency)
+
+        return _build_result(base_amount, base_currency, target_currency, resolved)
+
+
+def _build_result(
+    base_amount: float,
+    base_currency: Currency,
+    target_currency: Currency,
+    resolved: ResolvedRate,
+) -> ConversionResult:
+    target_amount = base_amount * resolved.rate
+
+    return ConversionResult(
+        base_amount=base_amount,
+        base_currency=base_currency.code,
+        target_amount=target_amount,
+        target_currency=target_currency.code,
+        exchange_rate=resolved.rate,
+        rate_updated_unix=resolved.time_last_update_unix,
+        rate_source=resolved.source,
+    )
@@ -1,6 +1,9 @@
 import re
+from array import array
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
 from enum import IntEnum
-from typing import Final
+from typing import Final, Iterable
 
 from cur.core.entity import Currency
 from cur.core.exception import ParseError
@@ -52,5 +55,115 @@ def parse_amount(amount: str) -> float:
     return number
 
 
+_UNIT_MULTIPLIERS: Final[dict[str, int]] = {
+    unit.name.lower(): unit.value for unit in UnitMultiplier
+} | {unit.name: unit.value for unit in UnitMultiplier}
+
+
+@dataclass
+class ParsedAmounts:
+    # NaN where the row failed.
+    values: array
+    # 1 where the row failed, 0 otherwise.
+    failed: bytearray
+    # Row index to the message parse_amount would have raised.
+    errors: dict[int, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def parse_amounts(amounts: Iterable[str]) -> ParsedAmounts:
+    """
+    Parse a column of amounts with the rules of parse_amount.
+
+    Columns of plain numbers (only digits and decimal points) are detected
+    with one scan over the joined column and converted in a single pass.
+    Anything else is parsed row by row without raising per row.
+    """
+    amounts = list(amounts)
+
+    if "".join(amounts).replace(".", "").isdecimal():
+        try:
+            values = array("d", map(float, amounts))
+        except ValueError:
+            # An empty row, or one like "1.2.3" that float() rejects.
+            pass
+        else:
+            parsed = ParsedAmounts(values, bytearray(len(amounts)))
+            if 0.0 in values:
+                for row, value in enumerate(values):
+                    if value == 0.0:
+                        _fail(parsed, row, amounts[row])
+            return parsed
+
+    return _parse_amounts_by_row(amounts)
+
+
+def _parse_amounts_by_row(amounts: list[str]) -> ParsedAmounts:
+    values = array("d", bytes(8 * len(amounts)))
+    parsed = ParsedAmounts(values, bytearray(len(amounts)))
+    match = AMOUNT_PATTERN.match
+    multipliers = _UNIT_MULTIPLIERS
+
+    for row, amount in enumerate(amounts):
+        # Plain numbers skip the regex, as in the column fast path.
+        if amount.replace(".", "", 1).isdecimal():
+            number = float(amount)
+            if number > 0:
+                values[row] = number
+                continue
+            _fail(parsed, row, amount)
+            continue
+
+        found = match(amount.strip().replace(",", "")) if amount else None
+        if found is not None:
+            number_str, unit = found.groups()
+            number = float(number_str)
+            if unit:
+                number *= multipliers[unit]
+            if number > 0:
+                values[row] = number
+                continue
+
+        _fail(parsed, row, amount)
+
+    return parsed
+
+
+def _fail(parsed: ParsedAmounts, row: int, amount: str) -> None:
+    parsed.values[row] = float("nan")
+    parsed.failed[row] = 1
+    try:
+        parse_amount(amount)
+    except ParseError as e:
+        parsed.errors[row] = str(e)
+
+
 def parse_currency(currency: str) -> Currency:
     return Currency.from_string(currency)
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD date or an ISO 8601 time; naive values are UTC.
+
+    A bare date means the end of that day, i.e. the rates that applied to it.
+    """
+    value = value.strip()
+    try:
+        if len(value) == 10:
+            return datetime.combine(
+                date.fromisoformat(value), time.max, tzinfo=timezone.utc
+            )
+        # Python 3.10's fromisoformat does not accept the Z suffix.
+        iso_value = value[:-1] + "+00:00" if value[-1:] in ("Z", "z") else value
+        moment = datetime.fromisoformat(iso_value)
+    except ValueError:
+        raise ParseError(
+            f"Invalid date: {value}. Use YYYY-MM-DD or an ISO 8601 date and time"
+        )
+
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+from cur.adapters.async_exchange_rate_client import AsyncExchangeRateClient
+from cur.core.entity import Currency
+
+
+@dataclass(frozen=True)
+class WarmResult:
+    base_code: str
+    # False when a fresh table was already cached and nothing was fetched.
+    fetched: bool
+    latency: float
+    expires_at_unix: int | None = None
+    error: str | None = None
+
+
+async def warm_cache(
+    client: AsyncExchangeRateClient,
+    base_currencies: Iterable[Currency],
+    concurrency: int = 8,
+    force: bool = False,
+) -> list[WarmResult]:
+    """
+    Fetch the rate table of every base into the client's cache.
+
+    Bases are fetched concurrently over the client's connection pool. A
+    failing base is reported in its result and does not stop the others.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def warm(base_currency: Currency) -> WarmResult:
+        if not force:
+            cached = client.cached_latest_rates(base_currency)
+            if cached is not None:
+                return WarmResult(
+                    base_currency.code, False, 0.0, cached.time_next_update_unix
+                )
+
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                latest_rates = await client.refresh(base_currency)
+            except Exception as e:
+                return WarmResult(
+                    base_currency.code,
+                    True,
+                    time.perf_counter() - started,
+                    error=str(e) or type(e).__name__,
+                )
+
+        return WarmResult(
+            base_currency.code,
+            True,
+            time.perf_counter() - started,
+            latest_rates.time_next_update_unix,
+        )
+
+    bases = list(dict.fromkeys(base_currencies))
+    return list(await asyncio.gather(*(warm(base) for base in bases)))
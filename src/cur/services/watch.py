@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from typing import Iterable
+
+from cur.adapters.exchange_rate_client import ExchangeRateClient
+from cur.core.entity import Currency
+from cur.services.conversion import ConversionResult
+
+
+@dataclass(frozen=True)
+class WatchedConversion:
+    amount: float
+    base_currency: Currency
+    target_currency: Currency
+
+
+@dataclass(frozen=True)
+class WatchRow:
+    conversion: WatchedConversion
+    result: ConversionResult | None = None
+    error: str | None = None
+    # When upstream publishes the rate tables behind this row next.
+    next_update_unix: int | None = None
+    # Served from an expired table while a refresh runs in the background.
+    stale: bool = False
+
+    def shows_same(self, other: "WatchRow") -> bool:
+        """Whether other would be drawn exactly like this row."""
+        rate = self.result.exchange_rate if self.result else None
+        other_rate = other.result.exchange_rate if other.result else None
+        return (rate, self.error) == (other_rate, other.error)
+
+
+class RateWatcher:
+    """
+    Keep a set of conversions current through one long-lived client.
+
+    Rate tables only change when upstream publishes, so instead of polling
+    at a fixed interval the next poll is due at the earliest
+    `time_next_update_unix` of the tables behind the rows. Between polls
+    every lookup would be a cache hit anyway.
+    """
+
+    def __init__(
+        self,
+        client: ExchangeRateClient,
+        conversions: Iterable[WatchedConversion],
+        min_interval: float = 60.0,
+        retry_interval: float = 60.0,
+    ) -> None:
+        self._client = client
+        self._conversions = list(conversions)
+        # Upstream often publishes a little late; never poll more often.
+        self._min_interval = min_interval
+        self._retry_interval = retry_interval
+        self.rows: list[WatchRow] = []
+
+    def poll(self) -> list[int]:
+        """Refresh every row; returns the indexes of the rows that changed."""
+        changed = []
+        rows = []
+        for index, conversion in enumerate(self._conversions):
+            row = self._resolve(conversion)
+            if index >= len(self.rows) or not row.shows_same(self.rows[index]):
+                changed.append(index)
+            rows.append(row)
+
+        self.rows = rows
+        return changed
+
+    def _resolve(self, conversion: WatchedConversion) -> WatchRow:
+        try:
+            resolved = self._client.resolve_rate(
+                conversion.base_currency, conversion.target_currency
+            )
+        except Exception as e:
+            return WatchRow(conversion, error=str(e))
+
+        result = ConversionResult(
+            base_amount=conversion.amount,
+            base_currency=conversion.base_currency.code,
+            target_amount=conversion.amount * resolved.rate,
+            target_currency=conversion.target_currency.code,
+            exchange_rate=resolved.rate,
+            rate_updated_unix=resolved.time_last_update_unix,
+            rate_source=resolved.source,
+        )
+        return WatchRow(
+            conversion,
+            result=result,
+            next_update_unix=resolved.time_next_update_unix,
+            stale=resolved.stale,
+        )
+
+    def next_poll_at(self, now: float) -> float:
+        """The unix time the next poll is due, given the rows of the last one."""
+        due = [
+            row.next_update_unix
+            for row in self.rows
+            if row.next_update_unix is not None and not row.stale
+        ]
+        # A failed or stale row is retried soon: its refresh may be running
+        # in the background, or the network may be back.
+        if len(due) < len(self.rows):
+            due.append(now + self._retry_interval)
+        if not due:
+            return now + self._retry_interval
+
+        return max(min(due), now + self._min_interval)
@@ -1,95 +1,160 @@
-from cur.core.entity import Currency
-
-
-def format_korean(amount: float, currency: Currency) -> str:
-    if currency.subunit_name:
-        return _format_with_subunit(amount, currency)
-    else:
-        return _format_only_main_unit(amount, currency)
+from functools import cache
+from typing import Sequence
 
+from cur.core.entity import Currency
 
-def _format_only_main_unit(amount: float, currency: Currency) -> str:
-    unit = currency.korean_name
+# Korean myriad units, largest first. Each one is 10,000 times the next.
+KOREAN_UNITS: tuple[tuple[int, str], ...] = (
+    (10**24, "자"),
+    (10**20, "해"),
+    (10**16, "경"),
+    (10**12, "조"),
+    (10**8, "억"),
+    (10**4, "만"),
+)
+_GROUP = 10_000
 
-    if amount == 0:
-        return f"0{unit}"
 
-    if amount < 1000:
-        return f"{int(round(amount)):,d}{unit}"
+@cache
+def _group_strings(suffix: str = "") -> tuple[str, ...]:
+    """'0' .. '9,999' followed by suffix, built once per unit on first use."""
+    return tuple(f"{group:,d}{suffix}" for group in range(_GROUP))
 
-    parts = []
 
-    num = int(round(amount))
+def _group_string(group: int, suffix: str) -> str:
+    # Only the largest unit can hold more than four digits.
+    if group < _GROUP:
+        return _group_strings(suffix)[group]
+    return f"{group:,d}{suffix}"
 
-    if num >= 1_000_000_000_000:
-        jo = num // 1_000_000_000_000
-        rest = num % 1_000_000_000_000
-        parts.append(f"{jo:,d}조")
-        num = rest
 
-    if num >= 100_000_000:
-        eok = num // 100_000_000
-        rest = num % 100_000_000
-        parts.append(f"{eok:,d}억")
-        num = rest
+def korean_number(number: int) -> str:
+    """Split a non-negative integer into myriad groups: 1385000 -> '138만 5,000'."""
+    if number < _GROUP:
+        return f"{number:,d}"
 
-    if num >= 10_000:
-        man = num // 10_000
-        rest = num % 10_000
-        parts.append(f"{man:,d}만")
-        num = rest
+    parts = []
+    for size, name in KOREAN_UNITS:
+        if number >= size:
+            group, number = divmod(number, size)
+            parts.append(_group_string(group, name))
+    if number:
+        parts.append(_group_strings()[number])
+    return " ".join(parts)
 
-    if num > 0:
-        parts.append(f"{num:,d}")
 
-    korean_formatted = " ".join(parts)
+def korean_numbers(numbers: Sequence[int]) -> list[str]:
+    """
+    korean_number for a whole column of non-negative integers.
+
+    The numbers are split one unit at a time across the column, skipping
+    units no number reaches, and strings are only built once every group
+    is known.
+    """
+    rest = list(numbers)
+    if not rest:
+        return []
+
+    # Each unit column appends "<group><unit> " to the rows it is non-zero in.
+    texts = [""] * len(rest)
+    largest = max(rest)
+    for index, (size, name) in enumerate(KOREAN_UNITS):
+        if largest < size:
+            continue
+        groups = [number // size for number in rest]
+        rest = [number % size for number in rest]
+        if index or largest < size * _GROUP:
+            table = _group_strings(name + " ")
+            texts = [
+                text + table[group] if group else text
+                for text, group in zip(texts, groups)
+            ]
+        else:
+            # Groups of the largest unit can overflow the four-digit table.
+            texts = [
+                text + _group_string(group, name + " ") if group else text
+                for text, group in zip(texts, groups)
+            ]
+        largest = max(rest)
 
-    return f"{korean_formatted}{unit}"
+    plain = _group_strings()
+    return [
+        text + plain[number] if number else text[:-1] or "0"
+        for text, number in zip(texts, rest)
+    ]
 
 
-def _format_with_subunit(amount: float, currency: Currency) -> str:
-    main_unit = currency.korean_name
-    subunit = currency.subunit_name
+def format_korean(amount: float, currency: Currency) -> str:
+    if currency.subunit_name:
+        integer_part = int(amount)
+        decimal_part = round((amount - integer_part) * 10**currency.minor_digits)
+        return _join_with_subunit(
+            integer_part,
+            korean_number(integer_part) if integer_part > 0 else "",
+            decimal_part,
+            currency,
+        )
+
+    number = int(round(amount))
+    # Negative amounts are not split into units.
+    text = f"{number:,d}" if number < 0 else korean_number(number)
+    return f"{text}{currency.korean_name}"
+
+
+def format_korean_many(amounts: Sequence[float], currency: Currency) -> list[str]:
+    """format_korean over a column of amounts, e.g. an array('d') or array('q')."""
+    if currency.subunit_name:
+        return _format_with_subunit(amounts, currency)
+    return _format_only_main_unit(amounts, currency)
 
-    integer_part = int(amount)
-    decimal_part = round((amount - integer_part) * 100)
 
+def _format_only_main_unit(amounts: Sequence[float], currency: Currency) -> list[str]:
+    unit = currency.korean_name
+    numbers = [int(round(amount)) for amount in amounts]
+
+    if min(numbers, default=0) < 0:
+        return [format_korean(amount, currency) for amount in amounts]
+
+    return [f"{text}{unit}" for text in korean_numbers(numbers)]
+
+
+def _format_with_subunit(amounts: Sequence[float], currency: Currency) -> list[str]:
+    scale = 10**currency.minor_digits
+
+    integer_parts = [int(amount) for amount in amounts]
+    decimal_parts = [
+        round((amount - integer_part) * scale)
+        for amount, integer_part in zip(amounts, integer_parts)
+    ]
+    integer_texts = korean_numbers([max(part, 0) for part in integer_parts])
+
+    # _join_with_subunit, inlined for the column.
+    main_unit = f" {currency.korean_name}"
+    subunit = f" {currency.subunit_name}"
+    zero = f"0{main_unit}"
+    return [
+        (
+            (
+                f"{text}{main_unit} {decimal}{subunit}"
+                if decimal > 0
+                else text + main_unit
+            )
+            if integer > 0
+            else (f"{decimal}{subunit}" if decimal > 0 else zero)
+        )
+        for integer, text, decimal in zip(integer_parts, integer_texts, decimal_parts)
+    ]
+
+
+def _join_with_subunit(
+    integer_part: int, integer_text: str, decimal_part: int, currency: Currency
+) -> str:
     parts = []
-
     if integer_part > 0:
-        if integer_part < 1000:
-            parts.append(f"{integer_part:,d} {main_unit}")
-        else:
-            korean_parts = []
-            num = integer_part
-
-            if num >= 1_000_000_000_000:
-                jo = num // 1_000_000_000_000
-                rest = num % 1_000_000_000_000
-                korean_parts.append(f"{jo:,d}조")
-                num = rest
-
-            if num >= 100_000_000:
-                eok = num // 100_000_000
-                rest = num % 100_000_000
-                korean_parts.append(f"{eok:,d}억")
-                num = rest
-
-            if num >= 10_000:
-                man = num // 10_000
-                rest = num % 10_000
-                korean_parts.append(f"{man:,d}만")
-                num = rest
-
-            if num > 0:
-                korean_parts.append(f"{num:,d}")
-
-            parts.append(f"{' '.join(korean_parts)} {main_unit}")
-
+        parts.append(f"{integer_text} {currency.korean_name}")
     if decimal_part > 0:
-        parts.append(f"{decimal_part} {subunit}")
+        parts.append(f"{decimal_part} {currency.subunit_name}")
 
     if not parts:
-        return f"0 {main_unit}"
-
+        return f"0 {currency.korean_name}"
     return " ".join(parts)
@@ -1,3 +1,9 @@
+from itertools import islice
+from typing import Callable, Iterable, TextIO
+
+_CHUNK = 65_536
+
+
 def format_with_commas(number: float) -> str:
     return _remove_trailing_zeros(f"{number:,.2f}")
 
@@ -52,3 +58,51 @@ def _remove_trailing_zeros(formatted: str) -> str:
         return formatted.rstrip("0").rstrip(".")
 
     return formatted
+
+
+def _write_many(
+    numbers: Iterable[float],
+    out: TextIO,
+    format_chunk: Callable[[list[float]], list[str]],
+) -> None:
+    numbers = iter(numbers)
+    while chunk := list(islice(numbers, _CHUNK)):
+        out.write("".join(format_chunk(chunk)))
+
+
+# The chunk formatters inline format_* and _remove_trailing_zeros into one
+# comprehension each: per-value function calls dominate the scalar path.
+def _with_commas_chunk(chunk: list[float]) -> list[str]:
+    return [f"{number:,.2f}".rstrip("0").rstrip(".") + "\n" for number in chunk]
+
+
+def _plain_chunk(chunk: list[float]) -> list[str]:
+    return [f"{number:.2f}".rstrip("0").rstrip(".") + "\n" for number in chunk]
+
+
+def _short_chunk(chunk: list[float]) -> list[str]:
+    return [
+        f"{number / 1_000_000_000:.1f}".rstrip("0").rstrip(".") + "B\n"
+        if number >= 1_000_000_000
+        else f"{number / 1_000_000:.1f}".rstrip("0").rstrip(".") + "M\n"
+        if number >= 1_000_000
+        else f"{number / 1_000:.1f}".rstrip("0").rstrip(".") + "K\n"
+        if number >= 1_000
+        else f"{number:.2f}".rstrip("0").rstrip(".") + "\n"
+        for number in chunk
+    ]
+
+
+def write_with_commas(numbers: Iterable[float], out: TextIO) -> None:
+    """Write format_with_commas of every number to out, one per line."""
+    _write_many(numbers, out, _with_commas_chunk)
+
+
+def write_plain(numbers: Iterable[float], out: TextIO) -> None:
+    """Write format_plain of every number to out, one per line."""
+    _write_many(numbers, out, _plain_chunk)
+
+
+def write_short(numbers: Iterable[float], out: TextIO) -> None:
+    """Write format_short of every number to out, one per line."""
+    _write_many(numbers, out, _short_chunk)
@@ -0,0 +1,170 @@
+# In-process counters and histograms. Imported from the cache and the HTTP
+# client on every `cur` call, so it must only use the standard library.
+import atexit
+import json
+import threading
+import time
+from bisect import bisect_left
+from typing import Iterable
+
+ENV_VAR = "CURRENCY_TRANSLATOR_METRICS"
+
+
+class Counter:
+    def __init__(
+        self, name: str, description: str, labels: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self._values: dict[tuple[str, ...], int] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: int = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> int:
+        return self._values.get(label_values, 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _samples(self) -> list[tuple[dict[str, str], int]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(dict(zip(self.labels, key)), value) for key, value in items]
+
+
+class Histogram:
+    """Fixed upper bucket bounds, plus the implicit +Inf bucket."""
+
+    def __init__(self, name: str, description: str, buckets: Iterable[float]) -> None:
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0.0
+
+    def _cumulative(self) -> tuple[list[tuple[float, int]], float, int]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative, total, running
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram] = {}
+
+    def counter(
+        self, name: str, description: str, labels: tuple[str, ...] = ()
+    ) -> Counter:
+        return self._register(Counter(name, description, labels))
+
+    def histogram(
+        self, name: str, description: str, buckets: Iterable[float]
+    ) -> Histogram:
+        return self._register(Histogram(name, description, buckets))
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def render_prometheus(self) -> str:
+        """The Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            if isinstance(metric, Counter):
+                lines.append(f"# TYPE {metric.name} counter")
+                for labels, value in metric._samples():
+                    lines.append(f"{metric.name}{_label_text(labels)} {value}")
+                continue
+
+            lines.append(f"# TYPE {metric.name} histogram")
+            cumulative, total, count = metric._cumulative()
+            for bound, bucket_count in cumulative:
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                lines.append(f'{metric.name}_bucket{{le="{le}"}} {bucket_count}')
+            lines.append(f"{metric.name}_sum {_number(total)}")
+            lines.append(f"{metric.name}_count {count}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict:
+        metrics: dict[str, dict] = {}
+        for metric in self._metrics.values():
+            if isinstance(metric, Counter):
+                metrics[metric.name] = {
+                    "type": "counter",
+                    "samples": [
+                        {"labels": labels, "value": value}
+                        for labels, value in metric._samples()
+                    ],
+                }
+                continue
+
+            cumulative, total, count = metric._cumulative()
+            metrics[metric.name] = {
+                "type": "histogram",
+                # Cumulative counts keyed by upper bound, as in Prometheus.
+                "buckets": {
+                    "+Inf" if bound == float("inf") else _number(bound): bucket_count
+                    for bound, bucket_count in cumulative
+                },
+                "sum": total,
+                "count": count,
+            }
+        return {"time_unix": time.time(), "metrics": metrics}
+
+
+def _label_text(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    return f"{{{pairs}}}"
+
+
+def _number(value: float) -> str:
+    return repr(int(value)) if float(value).is_integer() else repr(value)
+
+
+REGISTRY = MetricsRegistry()
+
+
+def write_snapshot_at_exit(path: str, registry: MetricsRegistry = REGISTRY) -> None:
+    """Append a snapshot to path as one JSON line when the process exits."""
+
+    def write() -> None:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(registry.snapshot()) + "\n")
+
+    atexit.register(write)
@@ -0,0 +1,57 @@
+# Per-user runtime files such as the daemon socket. Imported on the
+# launcher's fast path, so it must only use the standard library.
+#
+# $XDG_RUNTIME_DIR is private to the user by spec. The fallback under
+# $TMPDIR or /tmp is shared with every other user, so our files live in a
+# directory of our own there, and anything we find is checked before use.
+import os
+import stat
+
+
+class InsecurePathError(PermissionError):
+    pass
+
+
+def check_private(path: str, file_type: int) -> None:
+    """
+    Raise InsecurePathError unless path is a file_type (e.g. stat.S_IFSOCK)
+    owned by this user that no one else can read or write.
+
+    Symlinks are not followed, so a planted link is rejected as well.
+    """
+    st = os.lstat(path)
+    if stat.S_IFMT(st.st_mode) != file_type:
+        raise InsecurePathError(f"{path} has an unexpected file type")
+    # Windows has neither uids nor meaningful mode bits.
+    if not hasattr(os, "getuid"):
+        return
+    if st.st_uid != os.getuid():
+        raise InsecurePathError(f"{path} is owned by another user")
+    if st.st_mode & 0o077:
+        raise InsecurePathError(f"{path} is accessible to other users")
+
+
+def private_runtime_dir() -> str:
+    """
+    A directory only this user can use, created with mode 0700 if needed.
+
+    Raises InsecurePathError when the fallback directory already exists but
+    is not ours alone.
+    """
+    xdg_runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg_runtime_dir:
+        try:
+            check_private(xdg_runtime_dir, stat.S_IFDIR)
+            return xdg_runtime_dir
+        except OSError:
+            pass  # Misconfigured; use our own directory instead
+
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    base = os.environ.get("TMPDIR") or "/tmp"
+    path = os.path.join(base, f"currency-translator-{uid}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    check_private(path, stat.S_IFDIR)
+    return path
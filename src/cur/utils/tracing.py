@@ -0,0 +1,182 @@
+# Stage timings for a single `cur` call. Imported by the launcher before
+# anything else, so it must only use the standard library.
+#
+# Disabled (the default), span() returns a shared no-op context manager after
+# one global lookup, so instrumented code costs next to nothing.
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+
+ENV_VAR = "CURRENCY_TRANSLATOR_TRACE"
+
+# Where rates came from, cheapest first. A trace reports the costliest seen.
+CACHE_SOURCES = ("memory", "file", "network")
+
+
+@dataclass
+class Span:
+    name: str
+    depth: int
+    start_ns: int
+    duration_ns: int = 0
+    attributes: dict = field(default_factory=dict)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan:
+    __slots__ = ("_tracer", "_span")
+
+    def __init__(self, tracer: "Tracer", span: Span) -> None:
+        self._tracer = tracer
+        self._span = span
+
+    def __enter__(self) -> "_ActiveSpan":
+        self._tracer._stack.append(self._span)
+        self._span.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._span.duration_ns = time.perf_counter_ns() - self._span.start_ns
+        self._tracer._stack.pop()
+
+
+class Tracer:
+    """Collects spans opened on the thread that started it; others are ignored."""
+
+    def __init__(self, destination: str) -> None:
+        self.destination = destination
+        self.spans: list[Span] = []
+        self.cache_source: str | None = None
+        self._stack: list[Span] = []
+        self._thread = threading.get_ident()
+        self._started_ns = time.perf_counter_ns()
+        self._started_unix = time.time()
+
+    def span(self, name: str, attributes: dict) -> "_ActiveSpan | _NullSpan":
+        if threading.get_ident() != self._thread:
+            return _NULL_SPAN
+        span = Span(name, len(self._stack), 0, attributes=attributes)
+        self.spans.append(span)
+        return _ActiveSpan(self, span)
+
+    def annotate(self, attributes: dict) -> None:
+        if self._stack and threading.get_ident() == self._thread:
+            self._stack[-1].attributes.update(attributes)
+
+    def record_cache(self, source: str) -> None:
+        if threading.get_ident() != self._thread:
+            return
+        if self.cache_source is None or CACHE_SOURCES.index(
+            source
+        ) > CACHE_SOURCES.index(self.cache_source):
+            self.cache_source = source
+
+    def to_dict(self) -> dict:
+        return {
+            "started_unix": self._started_unix,
+            "argv": sys.argv[1:],
+            "total_ms": (time.perf_counter_ns() - self._started_ns) / 1e6,
+            "cache": self.cache_source,
+            "spans": [
+                {
+                    "name": span.name,
+                    "depth": span.depth,
+                    "start_ms": (span.start_ns - self._started_ns) / 1e6,
+                    "duration_ms": span.duration_ns / 1e6,
+                    **span.attributes,
+                }
+                for span in self.spans
+            ],
+        }
+
+
+_tracer: Tracer | None = None
+
+
+def span(name: str, **attributes) -> "_ActiveSpan | _NullSpan":
+    """Time the enclosed block as a stage of the current trace."""
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, attributes)
+
+
+def annotate(**attributes) -> None:
+    """Attach attributes to the innermost open span."""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.annotate(attributes)
+
+
+def record_cache(source: str) -> None:
+    """Note where rates were served from: memory, file or network."""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.record_cache(source)
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def start(destination: str = "-") -> None:
+    """
+    Start tracing this process.
+
+    The trace is reported at exit: as a breakdown on stderr when destination
+    is "-", otherwise appended as one JSON line to the file at that path.
+    """
+    global _tracer
+
+    if _tracer is None:
+        _tracer = Tracer(destination)
+        atexit.register(finish)
+
+
+def start_from_environment() -> None:
+    destination = os.getenv(ENV_VAR)
+    if destination:
+        start("-" if destination.lower() in ("1", "true", "stderr") else destination)
+
+
+def finish() -> None:
+    global _tracer
+
+    tracer, _tracer = _tracer, None
+    if tracer is None:
+        return
+
+    if tracer.destination == "-":
+        sys.stderr.write(format_breakdown(tracer.to_dict()))
+    else:
+        with open(tracer.destination, "a", encoding="utf-8") as f:
+            f.write(json.dumps(tracer.to_dict()) + "\n")
+
+
+def format_breakdown(trace: dict) -> str:
+    lines = [f"trace: {trace['total_ms']:.2f} ms total, cache: {trace['cache'] or '-'}"]
+    for span in trace["spans"]:
+        label = "  " * (span["depth"] + 1) + span["name"]
+        details = " ".join(
+            f"{key}={value}"
+            for key, value in span.items()
+            if key not in ("name", "depth", "start_ms", "duration_ms")
+        )
+        lines.append(f"{label:<28}{span['duration_ms']:>9.2f} ms  {details}".rstrip())
+    return "\n".join(lines) + "\n"
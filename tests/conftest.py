@@ -0,0 +1,72 @@
+import time
+from typing import Callable
+
+import pytest
+
+from cur.adapters import clipboard
+from cur.adapters.cache import CacheStorage
+from cur.adapters.exchange_rate_client import LatestExchangeRateResponse
+
+RateTableFactory = Callable[..., LatestExchangeRateResponse]
+
+
+@pytest.fixture(autouse=True)
+def fake_clipboard(monkeypatch: pytest.MonkeyPatch) -> clipboard.MemoryClipboard:
+    """Keep every copy in memory, so tests never depend on xclip/pbcopy."""
+    fake = clipboard.MemoryClipboard()
+    clipboard.set_backend(fake)
+    # Subprocesses started by a test (the startup checks) use no clipboard.
+    monkeypatch.setenv(clipboard.ENV_VAR, "none")
+    yield fake
+    clipboard.set_backend(None)
+
+
+@pytest.fixture
+def rate_table() -> RateTableFactory:
+    """
+    Build a rate table: rate_table("USD", {"KRW": 1300.0}).
+
+    The base is added at 1.0. By default the table was updated an hour ago
+    and is next updated in 23 hours; pass last_update/next_update to pin them.
+    """
+
+    def make(
+        base_code: str,
+        rates: dict[str, float],
+        last_update: int | None = None,
+        next_update: int | None = None,
+    ) -> LatestExchangeRateResponse:
+        now = int(time.time())
+        return LatestExchangeRateResponse(
+            result="success",
+            time_last_update_unix=now - 3600 if last_update is None else last_update,
+            time_next_update_unix=now + 82800 if next_update is None else next_update,
+            base_code=base_code,
+            rates={base_code: 1.0, **rates},
+        )
+
+    return make
+
+
+class InMemoryStorage(CacheStorage):
+    """Keeps expired entries, unlike MemoryCacheStorage."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, dict] = {}
+
+    def read(self, key: str) -> dict | None:
+        return self._data.get(key)
+
+    def write(self, key: str, data: dict) -> None:
+        self._data[key] = data
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def list_keys(self) -> list[str]:
+        return list(self._data.keys())
+
+
+@pytest.fixture
+def storage_keeping_expired() -> CacheStorage:
+    return InMemoryStorage()
@@ -0,0 +1,57 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from cur.entrypoints.batch import app
+
+
+@pytest.fixture
+def runner():
+    """Create a CLI test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock ExchangeRateClient."""
+    client = Mock()
+    client.get_rate.return_value = 1385.0
+    return client
+
+
+def test_batch_reads_csv_from_stdin(runner, mock_client):
+    """Test converting CSV records piped through stdin."""
+    with patch("cur.entrypoints.batch.bootstrap_client", return_value=mock_client):
+        result = runner.invoke(app, [], input="amount,from,to\n1k,usd,krw\n2k,usd,krw\n")
+
+    assert result.exit_code == 0
+    lines = result.stdout.strip().split("\n")
+    assert lines[0].startswith("amount,from,to,converted")
+    assert lines[1].startswith("1000,USD,KRW,1385000,")
+    assert lines[2].startswith("2000,USD,KRW,2770000,")
+    assert mock_client.get_rate.call_count == 1
+
+
+def test_batch_reads_jsonl_file(runner, mock_client, tmp_path):
+    """Test converting a JSON Lines file."""
+    input_file = tmp_path / "ledger.jsonl"
+    input_file.write_text('{"amount": "1,000", "from": "usd", "to": "krw"}\n')
+
+    with patch("cur.entrypoints.batch.bootstrap_client", return_value=mock_client):
+        result = runner.invoke(app, [str(input_file), "--format", "jsonl"])
+
+    assert result.exit_code == 0
+    row = json.loads(result.stdout)
+    assert row["converted"] == "1385000"
+    assert row["korean"] == "138만 5,000원"
+
+
+def test_batch_exits_with_error_when_rows_fail(runner, mock_client):
+    """Test that failed rows are reported and set the exit code."""
+    with patch("cur.entrypoints.batch.bootstrap_client", return_value=mock_client):
+        result = runner.invoke(app, [], input="abc,usd,krw\n")
+
+    assert result.exit_code == 1
+    assert "Invalid amount format" in result.stdout
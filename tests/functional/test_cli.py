@@ -1,8 +1,10 @@
+import json
 from unittest.mock import Mock, patch
 
 import pytest
 from typer.testing import CliRunner
 
+from cur.core.exception import RateNotFoundError
 from cur.entrypoints.cli import app
 from cur.services.conversion import ConversionResult
 
@@ -170,7 +172,7 @@ def test_invalid_amount(runner):
 
 def test_invalid_currency(runner):
     """Test invalid currency input."""
-    result = runner.invoke(app, ["1000", "usd", "eur"])
+    result = runner.invoke(app, ["1000", "usd", "xyz"])
 
     assert result.exit_code == 1
     assert "Error:" in result.stdout
@@ -261,3 +263,73 @@ def test_service_called_with_correct_parameters(runner, mock_service):
     assert call_args[0] == 1000.0  # parsed amount
     assert call_args[1].code == "USD"  # from_currency
     assert call_args[2].code == "KRW"  # to_currency
+
+
+def test_convert_at_passes_the_time_to_the_service(runner, mock_service):
+    """Test that --at converts with the rates recorded at that time."""
+    mock_service.convert.return_value = ConversionResult(
+        base_amount=1000.0,
+        base_currency="USD",
+        target_amount=1380000.0,
+        target_currency="KRW",
+        exchange_rate=1380.0,
+    )
+
+    with patch("cur.entrypoints.cli.bootstrap", return_value=mock_service):
+        result = runner.invoke(app, ["1000", "usd", "krw", "--at", "2026-09-30"])
+
+    assert result.exit_code == 0
+    at = mock_service.convert.call_args.kwargs["at"]
+    assert at.isoformat() == "2026-09-30T23:59:59.999999+00:00"
+
+
+def test_convert_at_without_recorded_rates(runner, mock_service):
+    """Test that a time with no recorded rates is reported as an error."""
+    mock_service.convert.side_effect = RateNotFoundError(
+        "No USD/KRW rates recorded at 2020-01-01 23:59 UTC"
+    )
+
+    with patch("cur.entrypoints.cli.bootstrap", return_value=mock_service):
+        result = runner.invoke(app, ["1000", "usd", "krw", "--at", "2020-01-01"])
+
+    assert result.exit_code == 1
+    assert "No USD/KRW rates recorded" in result.stdout
+
+
+def test_convert_at_invalid_date(runner):
+    """Test that an unparseable --at value is rejected."""
+    result = runner.invoke(app, ["1000", "usd", "krw", "--at", "last month"])
+
+    assert result.exit_code == 1
+    assert "Invalid date" in result.stdout
+
+
+def test_json_output_skips_rich_and_the_clipboard(runner, mock_service, fake_clipboard):
+    """Test that --output json prints one JSON object and copies nothing."""
+    mock_service.convert.return_value = ConversionResult(
+        base_amount=1000.0,
+        base_currency="USD",
+        target_amount=1385000.0,
+        target_currency="KRW",
+        exchange_rate=1385.0,
+        rate_updated_unix=1_790_000_000,
+        rate_source="cache",
+    )
+
+    with patch("cur.entrypoints.cli.bootstrap", return_value=mock_service):
+        result = runner.invoke(app, ["1000", "usd", "krw", "-o", "json", "-c", "plain"])
+
+    assert result.exit_code == 0
+    output = json.loads(result.stdout)
+    assert output["target"]["formatted"] == "1,385,000"
+    assert output["copy"] == "1385000"
+    assert output["rate_source"] == "cache"
+    assert fake_clipboard.copies == []
+
+
+def test_json_output_reports_errors_as_json(runner):
+    """Test that a parse error under --output json is a JSON error object."""
+    result = runner.invoke(app, ["abc", "usd", "krw", "--output", "json"])
+
+    assert result.exit_code == 1
+    assert json.loads(result.stdout)["error"].startswith("Invalid amount format")
@@ -0,0 +1,63 @@
+from unittest.mock import Mock, patch
+
+from typer.testing import CliRunner
+
+from cur.adapters.exchange_rate_client import LatestExchangeRateResponse
+from cur.adapters.rate_matrix import RateMatrix
+from cur.core.entity import Currency
+from cur.entrypoints.matrix import app
+
+USD_TABLE = LatestExchangeRateResponse(
+    result="success",
+    time_last_update_unix=0,
+    time_next_update_unix=2_000_000_000,
+    base_code="USD",
+    rates={"USD": 1.0, "KRW": 1300.0, "AUD": 1.5},
+)
+
+
+def test_matrix_prints_chosen_currencies():
+    client = Mock()
+    client.rate_matrix.return_value = RateMatrix([USD_TABLE])
+
+    with patch("cur.entrypoints.matrix.bootstrap_client", return_value=client):
+        result = CliRunner().invoke(app, ["usd", "krw"])
+
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == [
+        "            USD         KRW",
+        "USD           1        1300",
+        "KRW 0.000769231           1",
+    ]
+    client.refresh.assert_not_called()
+
+
+def test_matrix_fetches_a_table_when_none_is_fresh():
+    client = Mock()
+    client.rate_matrix.side_effect = [RateMatrix(), RateMatrix([USD_TABLE])]
+
+    with (
+        patch("cur.entrypoints.matrix.bootstrap_client", return_value=client),
+        patch.dict("os.environ", {"CURRENCY_TRANSLATOR_CURRENCIES": "eur,usd,krw"}),
+    ):
+        result = CliRunner().invoke(app, [])
+
+    assert result.exit_code == 0
+    client.refresh.assert_called_once_with(Currency.EUR)
+    assert [line[:3] for line in result.stdout.splitlines()[1:]] == [
+        "EUR",
+        "USD",
+        "KRW",
+    ]
+
+
+def test_matrix_reports_a_failed_fetch_without_a_traceback():
+    client = Mock()
+    client.rate_matrix.return_value = RateMatrix()
+    client.refresh.side_effect = OSError("network is unreachable")
+
+    with patch("cur.entrypoints.matrix.bootstrap_client", return_value=client):
+        result = CliRunner().invoke(app, ["usd", "krw"])
+
+    assert result.exit_code == 1
+    assert result.stderr == "Error: Cannot fetch USD rates: network is unreachable\n"
@@ -0,0 +1,138 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import cur
+
+# Generous enough for a slow CI machine; a regression that pulls the network
+# or UI stack back into the fast path blows well past them.
+IMPORT_BUDGET_MS = 150
+STARTUP_BUDGET_S = 1.5
+
+# Wall-time budgets depend on machine load, so they only run when asked for.
+timing = pytest.mark.skipif(
+    not os.getenv("CURRENCY_TRANSLATOR_TIMING_TESTS"),
+    reason="set CURRENCY_TRANSLATOR_TIMING_TESTS=1 to check time budgets",
+)
+
+FAST_PATH_SCRIPT = """
+import sys
+sys.argv = ["cur", "100", "usd", "krw"]
+from cur.entrypoints.launcher import main
+main()
+"""
+
+HELP_SCRIPT = """
+import sys
+sys.argv = ["cur", "--help"]
+from cur.entrypoints.launcher import main
+main()
+"""
+
+
+@pytest.fixture
+def env(tmp_path: Path) -> dict:
+    """Environment with a fresh USD table cached and no daemon running."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    now = int(time.time())
+    (cache_dir / "USD.json").write_text(
+        json.dumps(
+            {
+                "data": {
+                    "result": "success",
+                    "time_last_update_unix": now - 3600,
+                    "time_next_update_unix": now + 3600,
+                    "base_code": "USD",
+                    "rates": {"USD": 1.0, "KRW": 1385.0, "AUD": 1.5},
+                },
+                "ttl": now + 3600,
+            }
+        )
+    )
+
+    src_dir = str(Path(cur.__file__).parents[1])
+    return {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [src_dir, os.getenv("PYTHONPATH")])),
+        "CURRENCY_TRANSLATOR_CACHE_DIR": str(cache_dir),
+        "CURRENCY_TRANSLATOR_SOCKET": str(tmp_path / "no-daemon.sock"),
+        # The run must not depend on xclip/pbcopy.
+        "CURRENCY_TRANSLATOR_CLIPBOARD": "none",
+    }
+
+
+def _run_fast_path(
+    env: dict, *flags: str, script: str = FAST_PATH_SCRIPT
+) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", script],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+
+def _parse_importtime(stderr: str) -> dict[str, int]:
+    """Map each top-level import to its cumulative time in microseconds."""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total, name = line.split("|")
+        if not name.startswith("  "):
+            cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+def test_fast_path_skips_network_and_ui_imports(env: dict):
+    """Test that a cache hit never imports httpx, Typer, Rich or decimal."""
+    result = _run_fast_path(env, "-X", "importtime")
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith("100 USD → 138,500 KRW")
+
+    imported = result.stderr
+    heavy = ("httpx", "typer", "rich", "click", "cur.adapters.history", "decimal")
+    for module in heavy:
+        assert f" {module}\n" not in imported, f"{module} imported on fast path"
+
+
+def test_cli_help_imports_no_subcommand(env: dict):
+    """Test that the Typer path leaves subcommand modules and asyncio unloaded."""
+    result = _run_fast_path(env, "-X", "importtime", script=HELP_SCRIPT)
+
+    assert result.returncode == 0, result.stderr
+    assert "Other commands: batch, daemon, matrix, warm, watch" in result.stdout
+
+    imported = result.stderr
+    for module in ("asyncio", "socketserver", "cur.entrypoints.warm"):
+        assert f" {module}\n" not in imported, f"{module} imported for --help"
+
+
+@timing
+def test_fast_path_import_time_within_budget(env: dict):
+    """Test that importing the project's fast path stays within budget."""
+    result = _run_fast_path(env, "-X", "importtime")
+
+    cumulative = _parse_importtime(result.stderr)
+    project_us = sum(t for name, t in cumulative.items() if name.startswith("cur"))
+
+    assert project_us / 1000 < IMPORT_BUDGET_MS, cumulative
+
+
+@timing
+def test_fast_path_startup_within_budget(env: dict):
+    """Test the end-to-end wall time of `cur 100 usd krw` on a cache hit."""
+    started = time.perf_counter()
+    result = _run_fast_path(env)
+    elapsed = time.perf_counter() - started
+
+    assert result.returncode == 0, result.stderr
+    assert elapsed < STARTUP_BUDGET_S
@@ -0,0 +1,41 @@
+from unittest.mock import AsyncMock, patch
+
+from typer.testing import CliRunner
+
+from cur.entrypoints.warm import app
+from cur.services.warm import WarmResult
+
+
+def test_warm_prints_a_line_per_base() -> None:
+    results = [
+        WarmResult("USD", True, 0.123, 1_900_000_000),
+        WarmResult("KRW", False, 0.0, 1_900_000_000),
+    ]
+    with (
+        patch("cur.entrypoints.warm.bootstrap_async_client", return_value=AsyncMock()),
+        patch("cur.entrypoints.warm.warm_cache", AsyncMock(return_value=results)),
+    ):
+        result = CliRunner().invoke(app, ["usd", "krw"])
+
+    assert result.exit_code == 0, result.output
+    lines = result.stdout.strip().split("\n")
+    assert lines[0].startswith("USD  fetched     123 ms  expires ")
+    assert lines[1].startswith("KRW  cached        0 ms  expires ")
+
+
+def test_warm_exits_nonzero_when_a_base_fails() -> None:
+    results = [WarmResult("USD", True, 0.5, error="503 Service Unavailable")]
+    with (
+        patch("cur.entrypoints.warm.bootstrap_async_client", return_value=AsyncMock()),
+        patch("cur.entrypoints.warm.warm_cache", AsyncMock(return_value=results)),
+    ):
+        result = CliRunner().invoke(app, [])
+
+    assert result.exit_code == 1
+    assert "USD  failed" in result.stdout
+
+
+def test_warm_rejects_unknown_currency() -> None:
+    result = CliRunner().invoke(app, ["xyz"])
+
+    assert result.exit_code == 1
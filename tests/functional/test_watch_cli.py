@@ -0,0 +1,37 @@
+import time
+from unittest.mock import Mock, patch
+
+from typer.testing import CliRunner
+
+from cur.adapters.rate_resolver import ResolvedRate
+from cur.core.entity import Currency
+from cur.entrypoints.watch import app
+
+
+def _resolve_rate(base: Currency, target: Currency) -> ResolvedRate:
+    now = int(time.time())
+    return ResolvedRate(1385.0, base.code, target.code, ("USD",), now, now + 3600)
+
+
+def test_watch_draws_every_conversion_and_stops_on_interrupt():
+    client = Mock()
+    client.resolve_rate.side_effect = _resolve_rate
+
+    with (
+        patch("cur.entrypoints.watch.bootstrap_client", return_value=client),
+        patch("cur.entrypoints.watch.time.sleep", side_effect=KeyboardInterrupt),
+    ):
+        result = CliRunner().invoke(app, ["100", "usd", "krw", "2k", "usd", "krw"])
+
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert lines[0].startswith("100 USD → 138,500 KRW")
+    assert lines[1].startswith("2,000 USD → 2,770,000 KRW")
+    assert client.resolve_rate.call_count == 2
+
+
+def test_watch_rejects_incomplete_conversions():
+    result = CliRunner().invoke(app, ["100", "usd"])
+
+    assert result.exit_code == 1
+    assert "<amount> <from> <to>" in result.stderr
@@ -0,0 +1,156 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from cur.adapters.async_exchange_rate_client import AsyncExchangeRateClient
+from cur.adapters.cache import CacheStorage, ExchangeRateCache, MemoryCacheStorage
+from cur.core.entity import Currency
+from cur.services.conversion import AsyncConversionService
+
+
+@pytest.fixture
+def tables(rate_table) -> dict[str, dict]:
+    """What the mock API serves for each base."""
+    return {
+        "USD": rate_table("USD", {"KRW": 1300.0, "AUD": 1.5}).to_dict(),
+        "KRW": rate_table("KRW", {"USD": 1 / 1300.0, "AUD": 1.5 / 1300.0}).to_dict(),
+        "AUD": rate_table("AUD", {"USD": 1 / 1.5, "KRW": 1300.0 / 1.5}).to_dict(),
+    }
+
+
+class CountingTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self, tables: dict[str, dict], delay: float = 0.0, status_code: int = 200
+    ) -> None:
+        self.requests: list[str] = []
+        self._tables = tables
+        self._status_code = status_code
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._delay = delay
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        code = request.url.path.rsplit("/", 1)[-1]
+        self.requests.append(code)
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            await asyncio.sleep(self._delay)
+        finally:
+            self._in_flight -= 1
+
+        if self._status_code != 200:
+            return httpx.Response(self._status_code, request=request)
+        return httpx.Response(200, json=self._tables[code], request=request)
+
+
+def _client(transport: CountingTransport, **kwargs) -> AsyncExchangeRateClient:
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://test/")
+    cache = ExchangeRateCache(MemoryCacheStorage())
+    return AsyncExchangeRateClient(cache, http_client=http_client, **kwargs)
+
+
+def test_get_rate_fetches_and_caches(tables: dict) -> None:
+    transport = CountingTransport(tables)
+
+    async def scenario() -> tuple[float, float]:
+        async with _client(transport) as client:
+            first = await client.get_rate(Currency.USD, Currency.KRW)
+            second = await client.get_rate(Currency.USD, Currency.AUD)
+            return first, second
+
+    assert asyncio.run(scenario()) == (1300.0, 1.5)
+    assert transport.requests == ["USD"]
+
+
+def test_concurrent_requests_for_one_base_share_a_fetch(tables: dict) -> None:
+    transport = CountingTransport(tables, delay=0.01)
+
+    async def scenario() -> list[float]:
+        async with _client(transport) as client:
+            return await asyncio.gather(
+                *(client.get_rate(Currency.USD, Currency.KRW) for _ in range(10))
+            )
+
+    assert asyncio.run(scenario()) == [1300.0] * 10
+    assert transport.requests == ["USD"]
+
+
+def test_get_latest_rates_many_bounds_concurrency(tables: dict) -> None:
+    transport = CountingTransport(tables, delay=0.01)
+    bases = [Currency.USD, Currency.KRW, Currency.AUD, Currency.USD]
+
+    async def scenario() -> dict:
+        async with _client(transport) as client:
+            return await client.get_latest_rates_many(bases, concurrency=2)
+
+    tables = asyncio.run(scenario())
+
+    assert list(tables) == [Currency.USD, Currency.KRW, Currency.AUD]
+    assert sorted(transport.requests) == ["AUD", "KRW", "USD"]
+    assert transport.max_in_flight == 2
+
+
+def test_cross_rates_avoid_fetching_another_base(tables: dict) -> None:
+    transport = CountingTransport(tables)
+
+    async def scenario() -> float:
+        async with _client(transport) as client:
+            await client.get_rate(Currency.USD, Currency.KRW)
+            return await client.get_rate(Currency.KRW, Currency.USD)
+
+    assert asyncio.run(scenario()) == pytest.approx(1 / 1300.0)
+    assert transport.requests == ["USD"]
+
+
+def test_stale_table_is_served_while_refreshing(
+    tables: dict, rate_table, storage_keeping_expired: CacheStorage
+) -> None:
+    transport = CountingTransport(tables)
+    cache = ExchangeRateCache(storage_keeping_expired)
+    stale = rate_table("USD", {"KRW": 1200.0}).to_dict()
+    cache.set("USD", stale, int(time.time()) - 10)
+
+    async def scenario():
+        http_client = httpx.AsyncClient(transport=transport, base_url="https://test/")
+        async with AsyncExchangeRateClient(
+            cache, http_client=http_client, stale_grace=60
+        ) as client:
+            resolved = await client.resolve_rate(Currency.USD, Currency.KRW)
+            await asyncio.sleep(0.01)
+            return resolved, await client.get_rate(Currency.USD, Currency.KRW)
+
+    resolved, refreshed_rate = asyncio.run(scenario())
+
+    assert resolved.stale
+    assert resolved.rate == 1200.0
+    assert refreshed_rate == 1300.0
+    assert transport.requests == ["USD"]
+
+
+def test_http_errors_propagate(tables: dict) -> None:
+    transport = CountingTransport(tables, status_code=503)
+
+    async def scenario() -> None:
+        async with _client(transport) as client:
+            await client.get_rate(Currency.USD, Currency.KRW)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(scenario())
+
+
+def test_async_conversion_service(tables: dict) -> None:
+    transport = CountingTransport(tables)
+
+    async def scenario():
+        async with _client(transport) as client:
+            service = AsyncConversionService(client)
+            return await service.convert(10, Currency.USD, Currency.KRW)
+
+    result = asyncio.run(scenario())
+
+    assert result.target_amount == 13000.0
+    assert result.base_currency == "USD"
+    assert result.target_currency == "KRW"
@@ -0,0 +1,156 @@
+import io
+import json
+import threading
+
+import pytest
+
+from cur.core.entity import Currency
+from cur.services.batch import (
+    BatchConverter,
+    BatchRecord,
+    read_csv_records,
+    read_jsonl_records,
+    write_csv_rows,
+    write_jsonl_rows,
+)
+
+RATES = {
+    (Currency.USD, Currency.KRW): 1385.0,
+    (Currency.USD, Currency.AUD): 1.5,
+    (Currency.AUD, Currency.KRW): 920.0,
+}
+
+
+class CountingExchangeRateClient:
+    def __init__(self) -> None:
+        self.calls: list[tuple[Currency, Currency]] = []
+        self._lock = threading.Lock()
+
+    def get_rate(self, base_currency: Currency, target_currency: Currency) -> float:
+        with self._lock:
+            self.calls.append((base_currency, target_currency))
+        return RATES[(base_currency, target_currency)]
+
+
+@pytest.fixture
+def client() -> CountingExchangeRateClient:
+    return CountingExchangeRateClient()
+
+
+class TestReadRecords:
+    def test_read_csv_records_skips_header_and_blank_lines(self):
+        lines = ["amount,from,to\n", "100,usd,krw\n", "\n", '"1,000",aud,krw\n']
+
+        records = list(read_csv_records(lines))
+
+        assert records == [
+            BatchRecord("100", "usd", "krw"),
+            BatchRecord("1,000", "aud", "krw"),
+        ]
+
+    def test_read_csv_records_joins_unquoted_thousands_separators(self):
+        records = list(read_csv_records(["1,000,000,usd,krw\n"]))
+
+        assert records == [BatchRecord("1,000,000", "usd", "krw")]
+
+    def test_read_csv_records_picks_header_columns_by_name(self):
+        lines = ["\n", "ID,To,From,Amount\n", "7,krw,usd,100\n", "8,krw,aud,1,000\n"]
+
+        records = list(read_csv_records(lines))
+
+        assert records == [
+            BatchRecord("100", "usd", "krw"),
+            BatchRecord("1,000", "aud", "krw"),
+        ]
+
+    def test_read_csv_records_rejects_extra_fields_without_header(self):
+        records = list(read_csv_records(["7,1.5k,usd,krw\n", "100,usd,krw,note\n"]))
+
+        assert records == [
+            BatchRecord("7,1.5k,usd,krw", "", ""),
+            BatchRecord("100,usd,krw,note", "", ""),
+        ]
+
+    def test_read_jsonl_records(self):
+        lines = ['{"amount": 1.5, "from": "usd", "to": "krw"}\n', "not json\n"]
+
+        records = list(read_jsonl_records(lines))
+
+        assert records[0] == BatchRecord("1.5", "usd", "krw")
+        assert records[1] == BatchRecord("not json", "", "")
+
+
+class TestBatchConverter:
+    def test_converts_rows_in_input_order(self, client: CountingExchangeRateClient):
+        records = [
+            BatchRecord("1k", "usd", "krw"),
+            BatchRecord("10", "aud", "krw"),
+            BatchRecord("2", "usd", "aud"),
+        ]
+
+        rows = list(BatchConverter(client, window=2).convert(records))
+
+        assert [row.result.target_amount for row in rows] == [
+            1_385_000.0,
+            9_200.0,
+            3.0,
+        ]
+
+    def test_resolves_each_pair_once(self, client: CountingExchangeRateClient):
+        records = [BatchRecord(str(n), "usd", "krw") for n in range(1, 101)]
+
+        rows = list(BatchConverter(client).convert(records))
+
+        assert len(rows) == 100
+        assert client.calls == [(Currency.USD, Currency.KRW)]
+
+    def test_invalid_rows_become_errors(self, client: CountingExchangeRateClient):
+        records = [BatchRecord("abc", "usd", "krw"), BatchRecord("1", "usd", "xyz")]
+
+        rows = list(BatchConverter(client).convert(records))
+
+        assert "Invalid amount format" in rows[0].error
+        assert "Unsupported currency" in rows[1].error
+        assert client.calls == []
+
+    def test_failed_rate_is_reported_once_per_pair(self):
+        class FailingClient:
+            calls = 0
+
+            def get_rate(self, base_currency, target_currency):
+                FailingClient.calls += 1
+                raise ValueError("network down")
+
+        records = [BatchRecord("1", "usd", "krw")] * 3
+
+        rows = list(BatchConverter(FailingClient()).convert(records))
+
+        assert [row.error for row in rows] == ["network down"] * 3
+        assert FailingClient.calls == 1
+
+
+class TestWriteRows:
+    def test_write_csv_rows(self, client: CountingExchangeRateClient):
+        rows = BatchConverter(client).convert([BatchRecord("1000", "usd", "krw")])
+        out = io.StringIO()
+
+        failed = write_csv_rows(rows, out)
+
+        assert failed == 0
+        assert out.getvalue().splitlines() == [
+            "amount,from,to,converted,formatted,korean,short,rate,error",
+            '1000,USD,KRW,1385000,"1,385,000","138만 5,000원",1.4M,1385.0,',
+        ]
+
+    def test_write_jsonl_rows(self, client: CountingExchangeRateClient):
+        records = [BatchRecord("1000", "usd", "krw"), BatchRecord("0", "usd", "krw")]
+        rows = BatchConverter(client).convert(records)
+        out = io.StringIO()
+
+        failed = write_jsonl_rows(rows, out)
+
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert failed == 1
+        assert lines[0]["formatted"] == "1,385,000"
+        assert "error" not in lines[0]
+        assert lines[1]["error"] == "Amount must be greater than zero"
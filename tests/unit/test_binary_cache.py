@@ -0,0 +1,155 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from cur.adapters.binary_cache import BinaryFileCacheStorage, PackedRates
+from cur.adapters.cache import CorruptEntryError, ExchangeRateCache, FileCacheStorage
+from cur.adapters.exchange_rate_client import ExchangeRateClient
+from cur.core.entity import Currency
+
+
+@pytest.fixture
+def cache_entry(rate_table) -> dict:
+    now = int(time.time())
+    table = rate_table(
+        "USD", {"KRW": 1385.25, "AUD": 1.5, "XYZ": 42.0}, next_update=now + 3600
+    )
+    return {"data": table.to_dict(), "ttl": now + 3600}
+
+
+@pytest.fixture
+def temp_cache_dir(tmp_path: Path) -> Path:
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def storage(temp_cache_dir: Path) -> BinaryFileCacheStorage:
+    return BinaryFileCacheStorage(cache_dir=temp_cache_dir)
+
+
+def test_write_and_read_rate_table(storage: BinaryFileCacheStorage, cache_entry: dict):
+    storage.write("USD", cache_entry)
+    result = storage.read("USD")
+
+    assert result is not None
+    rates = result["data"]["rates"]
+    assert isinstance(rates, PackedRates)
+    assert dict(rates) == cache_entry["data"]["rates"]
+    assert {**result, "data": {**result["data"], "rates": dict(rates)}} == cache_entry
+
+
+def test_packed_rates_treat_absent_codes_as_missing(
+    storage: BinaryFileCacheStorage, cache_entry: dict
+):
+    storage.write("USD", cache_entry)
+    rates = storage.read("USD")["data"]["rates"]
+
+    assert "EUR" not in rates
+    assert "QQQ" not in rates
+    with pytest.raises(KeyError):
+        rates["EUR"]
+    assert len(rates) == 4
+
+
+def test_write_creates_compact_binary_file(
+    storage: BinaryFileCacheStorage, cache_entry: dict, temp_cache_dir: Path
+):
+    storage.write("USD", cache_entry)
+
+    assert [f.name for f in temp_cache_dir.iterdir()] == ["USD.bin"]
+
+
+def test_other_entries_are_kept_as_json(
+    storage: BinaryFileCacheStorage, temp_cache_dir: Path
+):
+    storage.write("settings", {"rate": 1.23})
+
+    assert storage.read("settings") == {"rate": 1.23}
+    assert (temp_cache_dir / "settings.json").exists()
+
+
+def test_json_rate_table_is_upgraded_on_read(
+    storage: BinaryFileCacheStorage, cache_entry: dict, temp_cache_dir: Path
+):
+    FileCacheStorage(cache_dir=temp_cache_dir).write("USD", cache_entry)
+
+    result = storage.read("USD")
+
+    assert result == cache_entry
+    assert not (temp_cache_dir / "USD.json").exists()
+    assert (temp_cache_dir / "USD.bin").exists()
+    assert dict(storage.read("USD")["data"]["rates"]) == cache_entry["data"]["rates"]
+
+
+def test_validators_are_stored_with_the_table(
+    storage: BinaryFileCacheStorage, cache_entry: dict
+):
+    cache_entry["etag"] = 'W/"abc123"'
+    cache_entry["last_modified"] = "Sat, 17 Oct 2026 00:02:31 GMT"
+    storage.write("USD", cache_entry)
+
+    result = storage.read("USD")
+
+    assert result is not None
+    assert result["etag"] == 'W/"abc123"'
+    assert result["last_modified"] == "Sat, 17 Oct 2026 00:02:31 GMT"
+    assert result["data"]["rates"]["XYZ"] == 42.0
+
+
+def test_previous_format_version_is_discarded(
+    storage: BinaryFileCacheStorage, cache_entry: dict, temp_cache_dir: Path
+):
+    storage.write("USD", cache_entry)
+    path = temp_cache_dir / "USD.bin"
+    payload = bytearray(path.read_bytes())
+    payload[4:6] = (1).to_bytes(2, "little")
+    path.write_bytes(bytes(payload))
+
+    with pytest.raises(CorruptEntryError):
+        storage.read("USD")
+    assert ExchangeRateCache(storage).get("USD") is None
+    assert not path.exists()
+
+
+def test_corrupted_file_is_removed(
+    storage: BinaryFileCacheStorage, temp_cache_dir: Path
+):
+    (temp_cache_dir / "USD.bin").write_bytes(b"CURB garbage")
+
+    with pytest.raises(CorruptEntryError):
+        storage.read("USD")
+    assert ExchangeRateCache(storage).get("USD") is None
+    assert not (temp_cache_dir / "USD.bin").exists()
+
+
+def test_empty_file_is_removed(storage: BinaryFileCacheStorage, temp_cache_dir: Path):
+    (temp_cache_dir / "USD.bin").touch()
+
+    with pytest.raises(CorruptEntryError):
+        storage.read("USD")
+    assert ExchangeRateCache(storage).get("USD") is None
+    assert not (temp_cache_dir / "USD.bin").exists()
+
+
+def test_list_keys_and_delete(storage: BinaryFileCacheStorage, cache_entry: dict):
+    storage.write("USD", cache_entry)
+    storage.write("settings", {"rate": 1.23})
+
+    assert set(storage.list_keys()) == {"USD", "settings"}
+
+    storage.delete("USD")
+    storage.delete("settings")
+
+    assert storage.list_keys() == []
+
+
+def test_client_reads_rates_from_binary_cache(
+    storage: BinaryFileCacheStorage, cache_entry: dict
+):
+    cache = ExchangeRateCache(storage)
+    cache.set("USD", cache_entry["data"], cache_entry["ttl"])
+    client = ExchangeRateClient(cache=cache, http_client=object())
+
+    assert client.get_rate(Currency.USD, Currency.KRW) == 1385.25
+    assert client.get_rate(Currency.KRW, Currency.AUD) == pytest.approx(1.5 / 1385.25)
@@ -3,7 +3,14 @@ from pathlib import Path
 
 import pytest
 
-from cur.adapters.cache import CachedData, ExchangeRateCache, FileCacheStorage
+from cur.adapters.cache import (
+    CachedData,
+    CorruptEntryError,
+    ExchangeRateCache,
+    FileCacheStorage,
+    MemoryCacheStorage,
+    TieredCacheStorage,
+)
 
 
 class TestCachedData:
@@ -64,6 +71,18 @@ class TestFileCacheStorage:
         cache_file = temp_cache_dir / "USD.json"
         assert cache_file.exists()
 
+    def test_write_replaces_file_atomically(
+        self, storage: FileCacheStorage, temp_cache_dir: Path
+    ):
+        storage.write("USD", {"rate": 1.0})
+        original_inode = (temp_cache_dir / "USD.json").stat().st_ino
+
+        storage.write("USD", {"rate": 2.0})
+
+        assert storage.read("USD") == {"rate": 2.0}
+        assert (temp_cache_dir / "USD.json").stat().st_ino != original_inode
+        assert [f.name for f in temp_cache_dir.iterdir()] == ["USD.json"]
+
     def test_delete_removes_file(self, storage: FileCacheStorage, temp_cache_dir: Path):
         test_data = {"rate": 1.23}
         storage.write("USD", test_data)
@@ -89,9 +108,10 @@ class TestFileCacheStorage:
         cache_file.parent.mkdir(parents=True, exist_ok=True)
         cache_file.write_text("invalid json content")
 
-        result = storage.read("CORRUPTED")
+        with pytest.raises(CorruptEntryError):
+            storage.read("CORRUPTED")
 
-        assert result is None
+        assert ExchangeRateCache(storage).get("CORRUPTED") is None
         assert not cache_file.exists()  # Should be removed
 
     def test_safe_key_conversion_slash(
@@ -121,6 +141,128 @@ class TestFileCacheStorage:
         assert safe_files[0] == temp_cache_dir / "USD_EUR.json"
 
 
+class TestMemoryCacheStorage:
+    @pytest.fixture
+    def storage(self) -> MemoryCacheStorage:
+        return MemoryCacheStorage(max_entries=2)
+
+    def test_write_and_read_returns_data(self, storage: MemoryCacheStorage):
+        storage.write("USD", {"rate": 1.23})
+
+        assert storage.read("USD") == {"rate": 1.23}
+
+    def test_evicts_least_recently_used_entry(self, storage: MemoryCacheStorage):
+        storage.write("USD", {"rate": 1.0})
+        storage.write("KRW", {"rate": 1300.0})
+        storage.read("USD")
+
+        storage.write("AUD", {"rate": 1.5})
+
+        assert set(storage.list_keys()) == {"USD", "AUD"}
+        assert storage.read("KRW") is None
+
+    def test_drops_expired_entries_on_read(self, storage: MemoryCacheStorage):
+        storage.write("USD", CachedData({"rate": 1.0}, int(time.time()) - 1).to_dict())
+
+        assert storage.read("USD") is None
+        assert storage.list_keys() == []
+
+    def test_keeps_expired_entries_within_grace(self):
+        storage = MemoryCacheStorage(grace=60)
+        expired = CachedData({"rate": 1.0}, int(time.time()) - 1).to_dict()
+        storage.write("USD", expired)
+
+        assert storage.read("USD") == expired
+
+
+class TestTieredCacheStorage:
+    @pytest.fixture
+    def memory(self) -> MemoryCacheStorage:
+        return MemoryCacheStorage()
+
+    @pytest.fixture
+    def file_storage(self, tmp_path: Path) -> FileCacheStorage:
+        return FileCacheStorage(cache_dir=tmp_path / "cache")
+
+    @pytest.fixture
+    def storage(
+        self, memory: MemoryCacheStorage, file_storage: FileCacheStorage
+    ) -> TieredCacheStorage:
+        return TieredCacheStorage(memory, file_storage)
+
+    def test_write_goes_through_to_all_tiers(
+        self,
+        storage: TieredCacheStorage,
+        memory: MemoryCacheStorage,
+        file_storage: FileCacheStorage,
+    ):
+        storage.write("USD", {"rate": 1.0})
+
+        assert memory.read("USD") == {"rate": 1.0}
+        assert file_storage.read("USD") == {"rate": 1.0}
+
+    def test_read_promotes_slow_tier_hit(
+        self,
+        storage: TieredCacheStorage,
+        memory: MemoryCacheStorage,
+        file_storage: FileCacheStorage,
+    ):
+        file_storage.write("USD", {"rate": 1.0})
+
+        assert storage.read("USD") == {"rate": 1.0}
+        assert memory.read("USD") == {"rate": 1.0}
+
+    def test_repeated_reads_stay_in_memory(
+        self, storage: TieredCacheStorage, file_storage: FileCacheStorage
+    ):
+        file_storage.write("USD", {"rate": 1.0})
+
+        for _ in range(5):
+            storage.read("USD")
+        storage.read("KRW")
+
+        memory_stats, file_stats = storage.stats()
+        assert (memory_stats.hits, memory_stats.misses) == (4, 2)
+        assert (file_stats.hits, file_stats.misses) == (1, 1)
+
+    def test_expired_entries_within_grace_stay_in_memory(
+        self, file_storage: FileCacheStorage
+    ):
+        storage = TieredCacheStorage(MemoryCacheStorage(grace=60), file_storage)
+        cache = ExchangeRateCache(storage)
+        file_storage.write("USD", CachedData({}, int(time.time()) - 1).to_dict())
+
+        for _ in range(5):
+            assert cache.get_entry("USD") is not None
+
+        memory_stats, file_stats = storage.stats()
+        assert (memory_stats.hits, file_stats.hits) == (4, 1)
+
+    def test_delete_removes_from_all_tiers(
+        self,
+        storage: TieredCacheStorage,
+        memory: MemoryCacheStorage,
+        file_storage: FileCacheStorage,
+    ):
+        storage.write("USD", {"rate": 1.0})
+
+        storage.delete("USD")
+
+        assert memory.read("USD") is None
+        assert file_storage.read("USD") is None
+
+    def test_list_keys_merges_tiers(
+        self,
+        storage: TieredCacheStorage,
+        memory: MemoryCacheStorage,
+        file_storage: FileCacheStorage,
+    ):
+        memory.write("USD", {"rate": 1.0})
+        file_storage.write("KRW", {"rate": 1300.0})
+
+        assert sorted(storage.list_keys()) == ["KRW", "USD"]
+
+
 class TestExchangeRateCache:
     @pytest.fixture
     def temp_cache_dir(self, tmp_path: Path):
@@ -156,6 +298,15 @@ class TestExchangeRateCache:
 
         assert result is None
 
+    def test_get_keeps_expired_entry_for_refresh(
+        self, cache: ExchangeRateCache, temp_cache_dir: Path
+    ):
+        cache.set("USD", {"rate": 1.23}, int(time.time()) - 1)
+
+        cache.get("USD")
+
+        assert (temp_cache_dir / "USD.json").exists()
+
     def test_clear_removes_all_entries(self, cache: ExchangeRateCache):
         future_expiry = int(time.time()) + 1000
         cache.set("USD", {"rate": 1.0}, future_expiry)
@@ -0,0 +1,141 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from cur.adapters import clipboard
+from cur.adapters.clipboard import (
+    ClipboardError,
+    CommandBackend,
+    MemoryClipboard,
+    NullClipboard,
+    PyperclipBackend,
+)
+
+
+@pytest.fixture
+def runtime_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv("DISPLAY", ":0")
+    monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+    monkeypatch.setattr(sys, "platform", "linux")
+    return tmp_path
+
+
+def _python_command(script: str) -> list[str]:
+    return [sys.executable, "-c", script]
+
+
+def test_copy_goes_to_the_fake_backend(fake_clipboard: MemoryClipboard):
+    clipboard.copy("1,385,000")
+    clipboard.start_copy("1385000").wait()
+
+    assert fake_clipboard.copies == ["1,385,000", "1385000"]
+    assert clipboard.paste() == "1385000"
+
+
+def test_command_backend_pipes_text_to_the_command(tmp_path):
+    target = tmp_path / "clipboard.txt"
+    backend = CommandBackend(
+        _python_command(f"import sys; open({str(target)!r}, 'w').write(sys.stdin.read())"),
+        _python_command(f"print(open({str(target)!r}).read(), end='')"),
+    )
+
+    backend.copy("1,385,000")
+
+    assert target.read_text() == "1,385,000"
+    assert backend.paste() == "1,385,000"
+
+
+def test_start_copy_overlaps_with_the_caller(tmp_path):
+    target = tmp_path / "clipboard.txt"
+    clipboard.set_backend(
+        CommandBackend(
+            _python_command(
+                "import sys, time; text = sys.stdin.read(); time.sleep(0.3); "
+                f"open({str(target)!r}, 'w').write(text)"
+            )
+        )
+    )
+
+    started = time.perf_counter()
+    pending = clipboard.start_copy("100", detach=False)
+    assert time.perf_counter() - started < 0.3
+    assert not target.exists()
+
+    pending.wait()
+    assert target.read_text() == "100"
+
+
+def test_failures_surface_on_wait():
+    clipboard.set_backend(CommandBackend(_python_command("raise SystemExit(3)")))
+    pending = clipboard.start_copy("100", detach=False)
+    with pytest.raises(ClipboardError, match="exited with status 3"):
+        pending.wait()
+
+    clipboard.set_backend(CommandBackend(["no-such-clipboard-command"]))
+    with pytest.raises(ClipboardError, match="Cannot run"):
+        clipboard.start_copy("100").wait()
+
+
+@pytest.mark.parametrize(
+    "setting, expected",
+    [("none", NullClipboard), ("pyperclip", PyperclipBackend)],
+)
+def test_configured_backend(monkeypatch, setting, expected):
+    monkeypatch.setenv(clipboard.ENV_VAR, setting)
+
+    assert isinstance(clipboard.configured_backend(), expected)
+
+
+def test_configured_command(monkeypatch):
+    monkeypatch.setenv(clipboard.ENV_VAR, "xclip -selection clipboard")
+
+    backend = clipboard.configured_backend()
+
+    assert isinstance(backend, CommandBackend)
+    assert backend.copy_command == ["xclip", "-selection", "clipboard"]
+
+
+def test_session_command_is_probed_once(runtime_dir, monkeypatch):
+    probes = []
+    monkeypatch.setattr(
+        "shutil.which", lambda name: probes.append(name) or name == "xsel"
+    )
+
+    assert clipboard.session_command() == "xsel"
+    assert clipboard.session_command() == "xsel"
+    assert probes == ["xclip", "xsel"]
+
+
+def test_session_command_is_probed_again_in_another_session(runtime_dir, monkeypatch):
+    monkeypatch.setattr("shutil.which", lambda name: name == "xclip")
+    assert clipboard.session_command() == "xclip"
+
+    monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
+    monkeypatch.setattr("shutil.which", lambda name: name == "wl-copy")
+    assert clipboard.session_command() == "wl-copy"
+
+
+def test_session_choice_never_follows_a_planted_symlink(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    monkeypatch.setenv("DISPLAY", ":0")
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr("shutil.which", lambda name: name == "xclip")
+    victim = tmp_path / "victim"
+    victim.write_text("keep me")
+    choice = Path(clipboard._choice_path())
+    choice.symlink_to(victim)
+
+    assert choice.parent.parent == tmp_path
+    assert clipboard.session_command() == "xclip"
+    assert victim.read_text() == "keep me"
+
+
+def test_no_command_falls_back_to_pyperclip(runtime_dir, monkeypatch):
+    monkeypatch.setenv(clipboard.ENV_VAR, "auto")
+    monkeypatch.setattr("shutil.which", lambda name: False)
+
+    assert isinstance(clipboard.configured_backend(), PyperclipBackend)
@@ -0,0 +1,127 @@
+import gzip
+import json
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from cur.adapters.cache import ExchangeRateCache, FileCacheStorage
+from cur.adapters.exchange_rate_client import (
+    REVALIDATED_TTL,
+    ExchangeRateClient,
+    shared_http_client,
+)
+from cur.core.entity import Currency
+
+ETAG = '"usd-2026-10-18"'
+LAST_MODIFIED = "Sun, 18 Oct 2026 00:02:31 GMT"
+
+
+class RateServer:
+    """Answers like the rate API: gzip bodies, validators, 304 on a match."""
+
+    def __init__(self, next_update: int, etag: str | None = ETAG) -> None:
+        rates = {code: 1.0 + i / 7 for i, code in enumerate(("USD", "KRW", "AUD"))}
+        rates.update({f"X{i:02d}": i * 1.1 for i in range(150)})
+        self.body = json.dumps(
+            {
+                "result": "success",
+                "time_last_update_unix": next_update - 86400,
+                "time_next_update_unix": next_update,
+                "base_code": "USD",
+                "rates": rates,
+            }
+        ).encode()
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+        self.bytes_sent = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            return self._respond(304, b"", {"Cache-Control": "max-age=600"})
+        if request.headers.get("If-Modified-Since") == LAST_MODIFIED:
+            return self._respond(304, b"", {})
+
+        headers = {"Last-Modified": LAST_MODIFIED}
+        if self.etag:
+            headers["ETag"] = self.etag
+        body = self.body
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        return self._respond(200, body, headers)
+
+    def _respond(self, status_code: int, body: bytes, headers: dict) -> httpx.Response:
+        self.bytes_sent += len(body)
+        return httpx.Response(status_code, content=body, headers=headers)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ExchangeRateCache:
+    return ExchangeRateCache(FileCacheStorage(cache_dir=tmp_path))
+
+
+def _client(server: RateServer, cache: ExchangeRateCache) -> ExchangeRateClient:
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(server.handle),
+        headers={"Accept-Encoding": "gzip, deflate"},
+        base_url="https://test/",
+    )
+    return ExchangeRateClient(cache, http_client=http_client, cross_rates=False)
+
+
+def test_full_table_is_fetched_compressed(cache: ExchangeRateCache) -> None:
+    server = RateServer(next_update=int(time.time()) + 3600)
+
+    rate = _client(server, cache).get_rate(Currency.USD, Currency.AUD)
+
+    assert rate == pytest.approx(1 + 2 / 7)
+    assert server.bytes_sent < len(server.body) / 2
+    entry = cache.get_entry("USD")
+    assert entry is not None
+    assert entry.etag == ETAG
+    assert entry.last_modified == LAST_MODIFIED
+
+
+def test_expired_table_is_revalidated_without_a_body(
+    cache: ExchangeRateCache,
+) -> None:
+    server = RateServer(next_update=int(time.time()) - 60)
+    client = _client(server, cache)
+    client.get_rate(Currency.USD, Currency.KRW)
+    first_fetch_bytes = server.bytes_sent
+
+    rate = client.get_rate(Currency.USD, Currency.KRW)
+
+    assert rate == pytest.approx(1 + 1 / 7)
+    assert server.bytes_sent == first_fetch_bytes
+    assert server.requests[-1].headers["If-None-Match"] == ETAG
+    entry = cache.get_entry("USD")
+    assert entry is not None
+    assert not entry.is_expired()
+    assert entry.ttl == pytest.approx(time.time() + 600, abs=5)
+
+    # The extended entry answers from the cache.
+    client.get_rate(Currency.USD, Currency.AUD)
+    assert len(server.requests) == 2
+
+
+def test_last_modified_is_used_without_an_etag(cache: ExchangeRateCache) -> None:
+    server = RateServer(next_update=int(time.time()) - 60, etag=None)
+    client = _client(server, cache)
+    client.get_rate(Currency.USD, Currency.KRW)
+
+    client.get_rate(Currency.USD, Currency.KRW)
+
+    assert server.requests[-1].headers["If-Modified-Since"] == LAST_MODIFIED
+    assert "If-None-Match" not in server.requests[-1].headers
+    entry = cache.get_entry("USD")
+    assert entry is not None
+    assert entry.ttl == pytest.approx(time.time() + REVALIDATED_TTL, abs=5)
+
+
+def test_clients_share_one_pooled_http_client() -> None:
+    assert shared_http_client() is shared_http_client()
+    assert shared_http_client().headers["Accept-Encoding"] == "gzip, deflate"
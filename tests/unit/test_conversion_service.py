@@ -1,15 +1,31 @@
+from array import array
+
 import pytest
 
+from cur.adapters.rate_resolver import ResolvedRate
 from cur.core.entity import Currency
 from cur.services.conversion import ConversionResult, ConversionService
 
 MOCK_RATE = 935.5
+MOCK_UPDATED = 1_790_000_000
 
 
 class TestExchangeRateClient:
     def get_rate(self, base_currency: Currency, target_currency: Currency) -> float:
         return MOCK_RATE
 
+    def resolve_rate(
+        self, base_currency: Currency, target_currency: Currency
+    ) -> ResolvedRate:
+        return ResolvedRate(
+            rate=MOCK_RATE,
+            base_code=base_currency.code,
+            target_code=target_currency.code,
+            tables=(base_currency.code,),
+            time_last_update_unix=MOCK_UPDATED,
+            time_next_update_unix=MOCK_UPDATED + 86400,
+        )
+
 
 @pytest.fixture(scope="module")
 def client() -> TestExchangeRateClient:
@@ -34,8 +50,19 @@ def test_conversion_service_can_convert(service: ConversionService):
         target_currency=krw.code,
         target_amount=expected_krw_amount,
         exchange_rate=MOCK_RATE,
+        rate_updated_unix=MOCK_UPDATED,
+        rate_source="cache",
     )
 
     conversion_result = service.convert(aud_amount, aud, krw)
 
     assert conversion_result == expected_conversion_result
+
+
+def test_conversion_service_can_convert_minor_units(service: ConversionService):
+    results = service.convert_minor_many(
+        array("q", [100, 150, 1]), Currency.USD, Currency.KRW
+    )
+
+    # 1.00, 1.50 and 0.01 USD at 935.5
+    assert list(results) == [936, 1403, 9]
@@ -0,0 +1,203 @@
+import os
+import socket
+import stat
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from cur.core.exception import RateNotFoundError
+from cur.entrypoints.daemon import DaemonServer, handle_request
+from cur.entrypoints.daemon_client import send_request, socket_path
+from cur.services.conversion import ConversionResult
+from cur.utils.runtime import InsecurePathError
+
+
+@pytest.fixture
+def mock_service() -> Mock:
+    service = Mock()
+    service.convert.return_value = ConversionResult(
+        base_amount=1000.0,
+        base_currency="USD",
+        target_amount=1385000.0,
+        target_currency="KRW",
+        exchange_rate=1385.0,
+    )
+    return service
+
+
+@pytest.fixture
+def server(tmp_path: Path, mock_service: Mock):
+    path = str(tmp_path / "cur.sock")
+    server = DaemonServer(path, mock_service)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestHandleRequest:
+    def test_convert_renders_output_and_clipboard_value(self, mock_service: Mock):
+        response = handle_request(
+            mock_service,
+            {"op": "convert", "amount": "1k", "from": "usd", "to": "krw", "copy": "plain"},
+        )
+
+        assert response["ok"] is True
+        assert response["output"] == (
+            "1,000 USD → 1,385,000 KRW\n"
+            "138만 5,000원 (1.4M)\n"
+            "Rate: 1 USD = 1385.0 KRW\n"
+        )
+        assert response["clipboard"] == "1385000"
+        assert response["copied"] == "✓ Copied: 1385000\n"
+        assert mock_service.convert.call_args[0][0] == 1000.0
+
+    def test_metrics_returns_prometheus_text_and_snapshot(self, mock_service: Mock):
+        response = handle_request(mock_service, {"op": "metrics"})
+
+        assert response["ok"] is True
+        assert "# TYPE cur_cache_lookups_total counter" in response["prometheus"]
+        assert "cur_cache_lookups_total" in response["snapshot"]["metrics"]
+
+    def test_convert_renders_json_without_a_clipboard_value(self, mock_service: Mock):
+        response = handle_request(
+            mock_service,
+            {"op": "convert", "amount": "1k", "from": "usd", "to": "krw", "output": "json"},
+        )
+
+        assert response["ok"] is True
+        assert response["clipboard"] is None
+        assert '"formatted": "1,385,000"' in response["output"]
+
+    def test_convert_reports_parse_errors(self, mock_service: Mock):
+        response = handle_request(
+            mock_service, {"op": "convert", "amount": "abc", "from": "usd", "to": "krw"}
+        )
+
+        assert response["ok"] is False
+        assert "Invalid amount format" in response["output"]
+        mock_service.convert.assert_not_called()
+
+    def test_convert_reports_missing_rates(self, mock_service: Mock):
+        mock_service.convert.side_effect = RateNotFoundError(
+            "Target currency JPY not found in USD rates"
+        )
+
+        response = handle_request(
+            mock_service, {"op": "convert", "amount": "1", "from": "usd", "to": "jpy"}
+        )
+
+        assert response["ok"] is False
+        assert response["output"] == (
+            "Error: Target currency JPY not found in USD rates\n"
+        )
+
+    def test_convert_asks_for_fallback_on_unexpected_errors(self, mock_service: Mock):
+        mock_service.convert.side_effect = RuntimeError("boom")
+
+        response = handle_request(
+            mock_service, {"op": "convert", "amount": "1", "from": "usd", "to": "krw"}
+        )
+
+        assert response == {"ok": False, "fallback": True}
+
+    def test_unknown_op(self, mock_service: Mock):
+        response = handle_request(mock_service, {"op": "nope"})
+
+        assert response["ok"] is False
+
+
+class TestDaemonServer:
+    def test_round_trip_over_socket(self, server: DaemonServer, mock_service: Mock):
+        response = send_request(
+            {"op": "convert", "amount": "1000", "from": "usd", "to": "krw"},
+            server.server_address,
+        )
+
+        assert response is not None
+        assert response["clipboard"] == "1,385,000"
+
+    def test_keeps_service_between_requests(
+        self, server: DaemonServer, mock_service: Mock
+    ):
+        request = {"op": "convert", "amount": "1000", "from": "usd", "to": "krw"}
+
+        send_request(request, server.server_address)
+        send_request(request, server.server_address)
+
+        assert mock_service.convert.call_count == 2
+
+    def test_send_request_returns_none_without_daemon(self, tmp_path: Path):
+        assert send_request({"op": "ping"}, str(tmp_path / "missing.sock")) is None
+
+    def test_send_request_returns_none_for_stale_socket(self, tmp_path: Path):
+        stale = tmp_path / "stale.sock"
+        stale.touch()
+
+        assert send_request({"op": "ping"}, str(stale)) is None
+
+    @pytest.mark.parametrize("reply", [b'{"ok": tr', b"[1, 2]\n", b'{"pid": 1}\n'])
+    def test_send_request_returns_none_for_a_malformed_reply(
+        self, tmp_path: Path, reply: bytes
+    ):
+        path = str(tmp_path / "old.sock")
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        os.chmod(path, 0o600)
+        listener.listen(1)
+
+        def answer() -> None:
+            connection, _ = listener.accept()
+            with connection:
+                connection.recv(1024)
+                connection.sendall(reply)
+
+        thread = threading.Thread(target=answer, daemon=True)
+        thread.start()
+        try:
+            assert send_request({"op": "ping"}, path) is None
+        finally:
+            thread.join()
+            listener.close()
+
+    def test_send_request_refuses_a_socket_others_can_use(self, server: DaemonServer):
+        os.chmod(server.server_address, 0o666)
+
+        assert send_request({"op": "ping"}, server.server_address) is None
+
+    def test_server_refuses_to_replace_a_file_that_is_not_its_socket(
+        self, tmp_path: Path, mock_service: Mock
+    ):
+        planted = tmp_path / "cur.sock"
+        planted.write_text("not a socket")
+
+        with pytest.raises(InsecurePathError):
+            DaemonServer(str(planted), mock_service)
+        assert planted.read_text() == "not a socket"
+
+
+class TestSocketPath:
+    @pytest.fixture(autouse=True)
+    def no_xdg(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("CURRENCY_TRANSLATOR_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+
+    def test_falls_back_to_a_private_directory(self, tmp_path: Path):
+        path = Path(socket_path())
+
+        assert path.parent.parent == tmp_path
+        assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+
+    def test_refuses_a_fallback_directory_others_can_write(self, tmp_path: Path):
+        shared = tmp_path / f"currency-translator-{os.getuid()}"
+        shared.mkdir(mode=0o777)
+        shared.chmod(0o777)
+
+        with pytest.raises(InsecurePathError):
+            socket_path()
+        assert send_request({"op": "ping"}) is None
@@ -0,0 +1,46 @@
+import pickle
+
+import pytest
+
+from cur.core.entity import REGISTRY_PATH, Currency, _Registry
+
+
+def test_members_are_interned():
+    assert Currency.USD is Currency.from_string("usd")
+    assert Currency.EUR is Currency["EUR"]
+    assert pickle.loads(pickle.dumps(Currency.KRW)) is Currency.KRW
+
+
+def test_currency_details_come_from_the_registry():
+    assert Currency.KRW.korean_name == "원"
+    assert Currency.KRW.subunit_name is None
+    assert Currency.KRW.minor_digits == 0
+    assert Currency.USD.subunit_name == "센트"
+    assert Currency.KWD.minor_digits == 3
+
+
+def test_unknown_codes_are_not_attributes():
+    with pytest.raises(AttributeError):
+        Currency.XYZ
+    with pytest.raises(KeyError):
+        Currency["usd"]
+
+
+def test_iteration_follows_the_registry_order():
+    currencies = list(Currency)
+
+    assert len(currencies) == len(Currency) > 150
+    assert [currency.index for currency in currencies] == list(range(len(Currency)))
+    assert [currency.code for currency in currencies] == sorted(
+        currency.code for currency in currencies
+    )
+
+
+def test_registry_builds_only_the_currencies_looked_up():
+    registry = _Registry(REGISTRY_PATH)
+
+    currency = registry.get("EUR")
+
+    assert currency is not None and currency.code == "EUR"
+    assert registry.get("XYZ") is None
+    assert list(registry._currencies) == ["EUR"]
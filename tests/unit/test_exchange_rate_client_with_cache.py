@@ -1,40 +1,29 @@
 import time
+from contextlib import contextmanager
 from unittest.mock import Mock
 
 import pytest
-from httpx import Client, Response
+from httpx import Client, Headers, Response
 
 from cur.adapters.cache import CacheStorage, ExchangeRateCache
 from cur.adapters.exchange_rate_client import ExchangeRateClient
 from cur.core.entity import Currency
+from cur.core.exception import RateNotFoundError
 
 
-class InMemoryStorage(CacheStorage):
-    """Mock storage for testing cache behavior."""
-
-    def __init__(self) -> None:
-        self._data: dict[str, dict] = {}
-
-    def read(self, key: str) -> dict | None:
-        return self._data.get(key)
-
-    def write(self, key: str, data: dict) -> None:
-        self._data[key] = data
-
-    def delete(self, key: str) -> None:
-        self._data.pop(key, None)
-
-    def list_keys(self) -> list[str]:
-        return list(self._data.keys())
+def _mock_response(response_data: dict) -> Mock:
+    mock_response = Mock(spec=Response)
+    mock_response.status_code = 200
+    mock_response.headers = Headers()
+    mock_response.json.return_value = response_data
+    return mock_response
 
 
 class TestExchangeRateClientWithCache:
     @staticmethod
     def _setup_mock_response(mock_http_client: Mock, response_data: dict) -> None:
         """Helper to setup mock HTTP response."""
-        mock_response = Mock(spec=Response)
-        mock_response.json.return_value = response_data
-        mock_http_client.get.return_value = mock_response
+        mock_http_client.get.return_value = _mock_response(response_data)
 
     @pytest.fixture
     def mock_api_response(self) -> dict:
@@ -53,14 +42,9 @@ class TestExchangeRateClientWithCache:
         }
 
     @pytest.fixture
-    def mock_storage(self) -> InMemoryStorage:
-        """Mock storage for cache testing."""
-        return InMemoryStorage()
-
-    @pytest.fixture
-    def cache(self, mock_storage: InMemoryStorage) -> ExchangeRateCache:
+    def cache(self, storage_keeping_expired: CacheStorage) -> ExchangeRateCache:
         """Cache with mock storage."""
-        return ExchangeRateCache(storage=mock_storage)
+        return ExchangeRateCache(storage=storage_keeping_expired)
 
     @pytest.fixture
     def mock_http_client(self) -> Mock:
@@ -100,6 +84,23 @@ class TestExchangeRateClientWithCache:
         assert client._client is not None
         assert isinstance(client._client, Client)
 
+    def test_resolve_rate_reports_where_the_rate_came_from(
+        self,
+        client: ExchangeRateClient,
+        mock_http_client: Mock,
+        mock_api_response: dict,
+    ) -> None:
+        """Test that a fetched rate is marked network and a cached one cache."""
+        self._setup_mock_response(mock_http_client, mock_api_response)
+
+        fetched = client.resolve_rate(Currency.USD, Currency.KRW)
+        cached = client.resolve_rate(Currency.USD, Currency.KRW)
+
+        assert fetched.source == "network"
+        assert cached.source == "cache"
+        updated = mock_api_response["time_last_update_unix"]
+        assert cached.time_last_update_unix == updated
+
     def test_get_rate_fetches_from_api_on_cache_miss(
         self,
         client: ExchangeRateClient,
@@ -158,10 +159,10 @@ class TestExchangeRateClientWithCache:
         assert cached_data["base_code"] == "USD"
         assert cached_data["rates"]["KRW"] == 1300.0
 
-    def test_get_rate_raises_value_error_for_currency_not_in_api_response(
+    def test_get_rate_raises_rate_not_found_for_currency_not_in_api_response(
         self, client: ExchangeRateClient, mock_http_client: Mock
     ) -> None:
-        """Test that client raises ValueError when target currency not in API response."""
+        """Test that client raises RateNotFoundError when target currency not in API response."""
         # Arrange - Create a mock response that doesn't include KRW
         limited_response: dict = {
             "result": "success",
@@ -181,17 +182,22 @@ class TestExchangeRateClientWithCache:
         self._setup_mock_response(mock_http_client, limited_response)
 
         # Act & Assert
-        with pytest.raises(ValueError, match="not found in rates"):
+        with pytest.raises(RateNotFoundError, match="not found in USD rates"):
             client.get_rate(Currency.USD, Currency.KRW)
 
     def test_different_base_currencies_cache_separately(
         self,
-        client: ExchangeRateClient,
+        cache: ExchangeRateCache,
         mock_http_client: Mock,
         mock_api_response: dict,
     ) -> None:
         """Test that different base currencies are cached separately."""
         # Arrange
+        # Cross rates would answer AUD -> KRW from the cached USD table
+        client = ExchangeRateClient(
+            cache=cache, http_client=mock_http_client, cross_rates=False
+        )
+
         # Second response for AUD (different base currency)
         aud_response_data = mock_api_response.copy()
         aud_response_data["base_code"] = "AUD"
@@ -202,10 +208,8 @@ class TestExchangeRateClientWithCache:
         }
 
         # Setup multiple responses
-        usd_response = Mock(spec=Response)
-        usd_response.json.return_value = mock_api_response
-        aud_response = Mock(spec=Response)
-        aud_response.json.return_value = aud_response_data
+        usd_response = _mock_response(mock_api_response)
+        aud_response = _mock_response(aud_response_data)
         mock_http_client.get.side_effect = [usd_response, aud_response]
 
         # Act
@@ -216,3 +220,168 @@ class TestExchangeRateClientWithCache:
         assert rate1 == 1300.0  # From USD base
         assert rate2 == 870.0  # From AUD base
         assert mock_http_client.get.call_count == 2  # Both should hit API
+
+    def test_get_rate_inverts_cached_table_of_target_currency(
+        self,
+        client: ExchangeRateClient,
+        mock_http_client: Mock,
+        mock_api_response: dict,
+    ) -> None:
+        """Test that a pair is answered by inverting the target's cached table."""
+        # Arrange
+        self._setup_mock_response(mock_http_client, mock_api_response)
+        client.get_rate(Currency.USD, Currency.KRW)
+
+        # Act
+        resolved = client.resolve_rate(Currency.KRW, Currency.USD)
+
+        # Assert
+        assert resolved.rate == pytest.approx(1 / 1300.0)
+        assert resolved.tables == ("USD",)
+        assert mock_http_client.get.call_count == 1
+
+    def test_get_rate_triangulates_through_cached_table(
+        self,
+        client: ExchangeRateClient,
+        mock_http_client: Mock,
+        mock_api_response: dict,
+    ) -> None:
+        """Test that a pair is triangulated through another cached base table."""
+        # Arrange
+        self._setup_mock_response(mock_http_client, mock_api_response)
+        client.get_rate(Currency.USD, Currency.KRW)
+
+        # Act
+        rate = client.get_rate(Currency.AUD, Currency.KRW)
+
+        # Assert
+        assert rate == pytest.approx(1300.0 / 1.5)
+        assert mock_http_client.get.call_count == 1
+
+    def test_get_rate_ignores_expired_tables_for_cross_rates(
+        self,
+        client: ExchangeRateClient,
+        cache: ExchangeRateCache,
+        mock_http_client: Mock,
+        mock_api_response: dict,
+    ) -> None:
+        """Test that expired tables are not used to derive cross rates."""
+        # Arrange
+        cache.set("USD", mock_api_response, int(time.time()) - 1)
+        aud_response_data = mock_api_response.copy()
+        aud_response_data["base_code"] = "AUD"
+        aud_response_data["rates"] = {"USD": 0.67, "AUD": 1.0, "KRW": 870.0}
+        self._setup_mock_response(mock_http_client, aud_response_data)
+
+        # Act
+        rate = client.get_rate(Currency.AUD, Currency.KRW)
+
+        # Assert
+        assert rate == 870.0
+        mock_http_client.get.assert_called_once()
+
+    def test_waits_for_concurrent_refresh_instead_of_fetching(
+        self,
+        cache: ExchangeRateCache,
+        mock_http_client: Mock,
+        mock_api_response: dict,
+    ) -> None:
+        """Test that a refresh done by the lock holder is reused after waiting."""
+
+        # Arrange - the other holder stores a fresh table while we wait
+        class RefreshedByOtherProcessLock:
+            @contextmanager
+            def hold(self, key: str, timeout: float):
+                cache.set(key, mock_api_response, int(time.time()) + 1000)
+                yield True
+
+        client = ExchangeRateClient(
+            cache=cache,
+            http_client=mock_http_client,
+            lock=RefreshedByOtherProcessLock(),
+        )
+
+        # Act
+        rate = client.get_rate(Currency.USD, Currency.KRW)
+
+        # Assert
+        assert rate == 1300.0
+        mock_http_client.get.assert_not_called()
+
+    def test_fetches_when_lock_times_out(
+        self,
+        cache: ExchangeRateCache,
+        mock_http_client: Mock,
+        mock_api_response: dict,
+    ) -> None:
+        """Test that a lock timeout still falls back to fetching."""
+
+        # Arrange
+        class TimedOutLock:
+            @contextmanager
+            def hold(self, key: str, timeout: float):
+                yield False
+
+        self._setup_mock_response(mock_http_client, mock_api_response)
+        client = ExchangeRateClient(
+            cache=cache, http_client=mock_http_client, lock=TimedOutLock()
+        )
+
+        # Act
+        rate = client.get_rate(Currency.USD, Currency.KRW)
+
+        # Assert
+        assert rate == 1300.0
+        mock_http_client.get.assert_called_once()
+
+    def test_serves_stale_table_within_grace_and_schedules_refresh(
+        self,
+        cache: ExchangeRateCache,
+        mock_http_client: Mock,
+        mock_api_response: dict,
+    ) -> None:
+        """Test that an expired table within the grace window is served stale."""
+        # Arrange
+        cache.set("USD", mock_api_response, int(time.time()) - 10)
+        refresher = Mock()
+        client = ExchangeRateClient(
+            cache=cache,
+            http_client=mock_http_client,
+            stale_grace=60,
+            refresher=refresher,
+        )
+
+        # Act
+        resolved = client.resolve_rate(Currency.USD, Currency.KRW)
+
+        # Assert
+        assert resolved.rate == 1300.0
+        assert resolved.stale is True
+        refresher.schedule.assert_called_once_with(client, Currency.USD)
+        mock_http_client.get.assert_not_called()
+
+    def test_fetches_when_table_is_past_grace(
+        self,
+        cache: ExchangeRateCache,
+        mock_http_client: Mock,
+        mock_api_response: dict,
+    ) -> None:
+        """Test that an expired table past the grace window is refetched."""
+        # Arrange
+        cache.set("USD", mock_api_response, int(time.time()) - 120)
+        self._setup_mock_response(mock_http_client, mock_api_response)
+        refresher = Mock()
+        client = ExchangeRateClient(
+            cache=cache,
+            http_client=mock_http_client,
+            stale_grace=60,
+            refresher=refresher,
+        )
+
+        # Act
+        resolved = client.resolve_rate(Currency.USD, Currency.KRW)
+
+        # Assert
+        assert resolved.stale is False
+        refresher.schedule.assert_not_called()
+        mock_http_client.get.assert_called_once()
@@ -0,0 +1,100 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from cur.adapters.cache import ExchangeRateCache, MemoryCacheStorage
+from cur.adapters.exchange_rate_client import ExchangeRateClient
+from cur.adapters.history import RateHistory
+from cur.core.entity import Currency
+from cur.core.exception import RateNotFoundError
+
+DAY = 86400
+SEP_29 = 1_790_640_000  # 2026-09-29 00:00 UTC
+
+
+def _published(day: int) -> dict:
+    """Update times of the table published `day` days after SEP_29."""
+    return {
+        "last_update": SEP_29 + day * DAY,
+        "next_update": SEP_29 + (day + 1) * DAY,
+    }
+
+
+@pytest.fixture
+def history(tmp_path: Path) -> RateHistory:
+    return RateHistory(tmp_path / "history")
+
+
+def test_at_returns_the_table_in_effect(history: RateHistory, rate_table):
+    for day, krw in enumerate((1380.0, 1385.0, 1390.0)):
+        history.append(rate_table("USD", {"KRW": krw}, **_published(day)))
+
+    assert history.at("USD", SEP_29 - 1) is None
+    assert history.at("USD", SEP_29).rates["KRW"] == 1380.0
+    assert history.at("USD", SEP_29 + DAY + 3600).rates["KRW"] == 1385.0
+    latest = history.at("USD", SEP_29 + 30 * DAY)
+    assert latest.rates == {"USD": 1.0, "KRW": 1390.0}
+    assert latest.time_next_update_unix == SEP_29 + 3 * DAY
+
+
+def test_append_skips_tables_already_recorded(history: RateHistory, rate_table):
+    assert history.append(rate_table("USD", {"KRW": 1385.0}, **_published(1)))
+    assert not history.append(rate_table("USD", {"KRW": 1385.0}, **_published(1)))
+    assert not history.append(rate_table("USD", {"KRW": 1380.0}, **_published(0)))
+
+    assert history.at("USD", SEP_29 + 5 * DAY).rates["KRW"] == 1385.0
+
+
+def test_rows_left_by_an_interrupted_append_are_dropped(
+    history: RateHistory, tmp_path: Path, rate_table
+):
+    history.append(rate_table("USD", {"KRW": 1380.0}, **_published(0)))
+    with (tmp_path / "history" / "USD.dat").open("ab") as data_file:
+        data_file.write(b"\0" * 100)
+
+    history.append(rate_table("USD", {"KRW": 1385.0}, **_published(1)))
+
+    assert history.at("USD", SEP_29 + DAY).rates["KRW"] == 1385.0
+
+
+def test_unknown_base_has_no_history(history: RateHistory):
+    assert history.at("USD", SEP_29) is None
+    assert history.tables_at(SEP_29) == []
+
+
+def _client(history: RateHistory, table: dict | None = None) -> ExchangeRateClient:
+    http_client = Mock()
+    http_client.get.return_value = httpx.Response(
+        200, json=table, request=httpx.Request("GET", "https://test/USD")
+    )
+    return ExchangeRateClient(
+        ExchangeRateCache(MemoryCacheStorage()),
+        http_client=http_client,
+        history=history,
+    )
+
+
+def test_client_records_every_fetched_table(history: RateHistory, rate_table):
+    table = rate_table("USD", {"KRW": 1380.0}, **_published(0))
+    _client(history, table.to_dict()).refresh(Currency.USD)
+
+    assert history.at("USD", SEP_29).rates == table.rates
+
+
+def test_client_converts_at_a_past_time(history: RateHistory, rate_table):
+    history.append(rate_table("USD", {"KRW": 1380.0, "AUD": 1.5}, **_published(0)))
+    history.append(rate_table("USD", {"KRW": 1385.0, "AUD": 1.6}, **_published(1)))
+    client = _client(history)
+
+    assert client.get_rate_at(Currency.USD, Currency.KRW, SEP_29 + 60) == 1380.0
+    # Pairs without their own table are derived from the tables of that time.
+    assert client.get_rate_at(
+        Currency.AUD, Currency.KRW, SEP_29 + DAY + 60
+    ) == pytest.approx(1385.0 / 1.6)
+
+
+def test_client_raises_when_nothing_was_recorded(history: RateHistory):
+    with pytest.raises(RateNotFoundError, match="No USD/KRW rates recorded"):
+        _client(history).get_rate_at(Currency.USD, Currency.KRW, SEP_29)
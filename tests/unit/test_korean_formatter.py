@@ -1,7 +1,13 @@
+from array import array
+
 import pytest
 
 from cur.core.entity import Currency
-from cur.utils.formatters.korean_formatter import format_korean
+from cur.utils.formatters.korean_formatter import (
+    format_korean,
+    format_korean_many,
+    korean_number,
+)
 
 
 @pytest.mark.parametrize(
@@ -51,8 +57,53 @@ from cur.utils.formatters.korean_formatter import format_korean
         (53.45, Currency.AUD, "53 달러 45 센트"),
         (2458.7, Currency.AUD, "2,458 달러 70 센트"),
         (3470.9, Currency.USD, "3,470 달러 90 센트"),
+        # Other registry currencies
+        (15_000, Currency.JPY, "1만 5,000엔"),
+        (1_234.5, Currency.EUR, "1,234 유로 50 센트"),
+        (12.345, Currency.BHD, "12 디나르 345 필스"),
     ],
 )
 def test_format_korean_parametrized(amount, currency, expected):
     output = format_korean(amount, currency)
     assert output == expected
+
+
+@pytest.mark.parametrize(
+    "amount,expected",
+    [
+        (10**16, "1경원"),
+        (12_345_678_901_234_567_890, "1,234경 5,678조 9,012억 3,456만 7,890원"),
+        (3 * 10**20 + 7, "3해 7원"),
+        (10**28, "10,000자원"),
+        (-1_385_000, "-1,385,000원"),
+    ],
+)
+def test_format_korean_large_and_negative(amount, expected):
+    assert format_korean(amount, Currency.KRW) == expected
+
+
+def test_korean_number_groups():
+    assert korean_number(0) == "0"
+    assert korean_number(9_999) == "9,999"
+    assert korean_number(10_000) == "1만"
+    assert korean_number(100_010_000) == "1억 1만"
+
+
+@pytest.mark.parametrize("currency", [Currency.KRW, Currency.USD, Currency.BHD])
+def test_format_korean_many_matches_format_korean(currency):
+    amounts = array(
+        "d",
+        [0, 0.4, 1.5, 999.99, 9_999.5, 10_000, 1_385_000, 150_000_000.75, -42.5]
+        + [1.5e15, 2.5e16],
+    )
+
+    assert format_korean_many(amounts, currency) == [
+        format_korean(amount, currency) for amount in amounts
+    ]
+
+
+def test_format_korean_many_accepts_integer_arrays():
+    amounts = array("q", [5, 10_000, 1_385_000])
+
+    assert format_korean_many(amounts, Currency.KRW) == ["5원", "1만원", "138만 5,000원"]
+    assert format_korean_many([], Currency.KRW) == []
@@ -0,0 +1,87 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cur.core.exception import RateNotFoundError
+from cur.entrypoints.launcher import (
+    _convert_in_process,
+    _convert_with_daemon,
+    parse_convert_args,
+)
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        (["100", "usd", "krw"], ("100", "usd", "krw", "default")),
+        (["1,000", "krw", "usd", "-c", "plain"], ("1,000", "krw", "usd", "plain")),
+        (["1.5k", "aud", "krw", "--copy", "short"], ("1.5k", "aud", "krw", "short")),
+        (["1.5k", "aud", "krw", "--copy=short"], ("1.5k", "aud", "krw", "short")),
+        (["-c", "plain", "1", "usd", "krw"], ("1", "usd", "krw", "plain")),
+        (["100", "usd", "krw", "--trace"], ("100", "usd", "krw", "default")),
+    ],
+)
+def test_parse_convert_args_recognises_convert_form(args, expected):
+    request = parse_convert_args(args)
+
+    assert request is not None
+    assert (request["amount"], request["from"], request["to"], request["copy"]) == expected
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        [],
+        ["--help"],
+        ["batch", "ledger.csv"],
+        ["daemon", "start", "now"],
+        ["100", "usd"],
+        ["100", "usd", "krw", "--copy"],
+        ["100", "usd", "krw", "-c", "fancy"],
+        ["100", "usd", "krw", "--at", "2026-09-30"],
+        ["100", "usd", "krw", "--unknown"],
+        ["100", "usd", "krw", "-o", "yaml"],
+    ],
+)
+def test_parse_convert_args_leaves_other_forms_to_cli(args):
+    assert parse_convert_args(args) is None
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["100", "usd", "krw", "-o", "json"],
+        ["100", "usd", "krw", "--output", "json"],
+        ["100", "usd", "krw", "--output=json"],
+    ],
+)
+def test_parse_convert_args_recognises_output(args):
+    request = parse_convert_args(args)
+
+    assert request is not None
+    assert request["output"] == "json"
+    assert request["copy"] == "default"
+
+
+def test_convert_in_process_reports_missing_rates_in_one_line(capsys):
+    service = Mock()
+    service.convert.side_effect = RateNotFoundError(
+        "Target currency JPY not found in USD rates"
+    )
+
+    with patch("cur.bootstrap.bootstrap", return_value=service):
+        status = _convert_in_process(parse_convert_args(["1", "usd", "jpy"]))
+
+    assert status == 1
+    assert capsys.readouterr().out == (
+        "Error: Target currency JPY not found in USD rates\n"
+    )
+
+
+def test_convert_with_daemon_falls_back_when_reply_lacks_output(capsys):
+    request = parse_convert_args(["1", "usd", "krw"])
+
+    with patch("cur.entrypoints.launcher.send_request", return_value={"ok": True}):
+        assert _convert_with_daemon(request) is None
+
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,54 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from cur.adapters.lock import FileKeyLock, fcntl
+
+pytestmark = pytest.mark.skipif(fcntl is None, reason="flock is not available")
+
+
+@pytest.fixture
+def lock(tmp_path: Path) -> FileKeyLock:
+    return FileKeyLock(tmp_path / "locks")
+
+
+def test_hold_acquires_free_lock(lock: FileKeyLock):
+    with lock.hold("USD", timeout=0.1) as acquired:
+        assert acquired is True
+
+
+def test_hold_times_out_while_another_holder_has_it(lock: FileKeyLock, tmp_path: Path):
+    other = FileKeyLock(tmp_path / "locks")
+
+    with lock.hold("USD", timeout=0.1):
+        with other.hold("USD", timeout=0.05) as acquired:
+            assert acquired is False
+
+
+def test_keys_lock_independently(lock: FileKeyLock, tmp_path: Path):
+    other = FileKeyLock(tmp_path / "locks")
+
+    with lock.hold("USD", timeout=0.1):
+        with other.hold("KRW", timeout=0.05) as acquired:
+            assert acquired is True
+
+
+def test_waiter_acquires_after_release(lock: FileKeyLock, tmp_path: Path):
+    other = FileKeyLock(tmp_path / "locks")
+    released = threading.Event()
+    results = []
+
+    def wait_for_lock():
+        with other.hold("USD", timeout=5) as acquired:
+            results.append((acquired, released.is_set()))
+
+    with lock.hold("USD", timeout=0.1):
+        waiter = threading.Thread(target=wait_for_lock)
+        waiter.start()
+        time.sleep(0.05)
+        released.set()
+    waiter.join()
+
+    assert results == [(True, True)]
@@ -0,0 +1,168 @@
+import json
+import time
+
+import httpx
+import pytest
+
+from cur.adapters.binary_cache import BinaryFileCacheStorage
+from cur.adapters.cache import (
+    CACHE_LOOKUPS,
+    ExchangeRateCache,
+    FileCacheStorage,
+    MemoryCacheStorage,
+)
+from cur.adapters.exchange_rate_client import (
+    HTTP_REQUEST_SECONDS,
+    HTTP_RESPONSES,
+    SERVED_RATE_AGE_SECONDS,
+    ExchangeRateClient,
+)
+from cur.core.entity import Currency
+from cur.utils.metrics import REGISTRY, MetricsRegistry
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    REGISTRY.reset()
+    yield
+    REGISTRY.reset()
+
+
+class TestRegistry:
+    def test_renders_prometheus_text(self):
+        registry = MetricsRegistry()
+        lookups = registry.counter("lookups_total", "Lookups", ("result",))
+        latency = registry.histogram("latency_seconds", "Latency", (0.1, 1))
+        lookups.inc("hit")
+        lookups.inc("hit")
+        lookups.inc("miss")
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(3)
+
+        assert registry.render_prometheus() == (
+            "# HELP lookups_total Lookups\n"
+            "# TYPE lookups_total counter\n"
+            'lookups_total{result="hit"} 2\n'
+            'lookups_total{result="miss"} 1\n'
+            "# HELP latency_seconds Latency\n"
+            "# TYPE latency_seconds histogram\n"
+            'latency_seconds_bucket{le="0.1"} 1\n'
+            'latency_seconds_bucket{le="1"} 2\n'
+            'latency_seconds_bucket{le="+Inf"} 3\n'
+            "latency_seconds_sum 3.55\n"
+            "latency_seconds_count 3\n"
+        )
+
+    def test_snapshot_is_json_serialisable(self):
+        registry = MetricsRegistry()
+        registry.counter("lookups_total", "Lookups", ("result",)).inc("hit")
+        registry.histogram("latency_seconds", "Latency", (1,)).observe(0.5)
+
+        metrics = json.loads(json.dumps(registry.snapshot()))["metrics"]
+
+        assert metrics["lookups_total"]["samples"] == [
+            {"labels": {"result": "hit"}, "value": 1}
+        ]
+        assert metrics["latency_seconds"]["buckets"] == {"1": 1, "+Inf": 1}
+        assert metrics["latency_seconds"]["count"] == 1
+
+    def test_rejects_duplicate_names(self):
+        registry = MetricsRegistry()
+        registry.counter("lookups_total", "Lookups")
+
+        with pytest.raises(ValueError):
+            registry.counter("lookups_total", "Lookups")
+
+
+def test_cache_counts_lookup_results():
+    storage = MemoryCacheStorage()
+    cache = ExchangeRateCache(storage)
+    now = int(time.time())
+    storage.write("FRESH", {"data": {}, "ttl": now + 60})
+    storage.write("CORRUPT", {"ttl": now + 60})
+
+    cache.get("FRESH")
+    cache.get("MISSING")
+    cache.get("CORRUPT")
+
+    assert CACHE_LOOKUPS.value("hit") == 1
+    assert CACHE_LOOKUPS.value("miss") == 1
+    assert CACHE_LOOKUPS.value("corrupt") == 1
+
+
+@pytest.mark.parametrize(
+    ("storage_class", "filename", "payload"),
+    [
+        (FileCacheStorage, "USD.json", b'{"data": {"resu'),
+        (BinaryFileCacheStorage, "USD.bin", b"CURB\x02\x00"),
+    ],
+)
+def test_cache_counts_undecodable_files_as_corrupt(
+    tmp_path, storage_class, filename, payload
+):
+    (tmp_path / filename).write_bytes(payload)
+    cache = ExchangeRateCache(storage_class(tmp_path))
+
+    assert cache.get("USD") is None
+    assert CACHE_LOOKUPS.value("corrupt") == 1
+    assert CACHE_LOOKUPS.value("miss") == 0
+    assert not (tmp_path / filename).exists()
+
+
+def test_resolve_rate_records_one_cache_lookup(rate_table):
+    storage = MemoryCacheStorage()
+    for code in ("EUR", "JPY"):
+        table = rate_table(code, {})
+        storage.write(
+            code, {"data": table.to_dict(), "ttl": table.time_next_update_unix}
+        )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=rate_table("USD", {"KRW": 1385.0}).to_dict())
+
+    client = ExchangeRateClient(
+        ExchangeRateCache(storage),
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(handler), base_url="https://test/"
+        ),
+    )
+
+    # The cross-rate scan over EUR and JPY and the re-check before the fetch
+    # read the cache as well, but only the first lookup counts.
+    client.get_rate(Currency.USD, Currency.KRW)
+    client.get_rate(Currency.USD, Currency.KRW)
+
+    assert CACHE_LOOKUPS.value("miss") == 1
+    assert CACHE_LOOKUPS.value("hit") == 1
+
+
+def test_client_records_requests_and_served_rate_age():
+    updated = int(time.time()) - 7200
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "result": "success",
+                "time_last_update_unix": updated,
+                "time_next_update_unix": updated + 86400,
+                "base_code": "USD",
+                "rates": {"USD": 1.0, "KRW": 1385.0},
+            },
+        )
+
+    client = ExchangeRateClient(
+        ExchangeRateCache(MemoryCacheStorage()),
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(handler), base_url="https://test/"
+        ),
+    )
+
+    client.get_rate(Currency.USD, Currency.KRW)
+    client.get_rate(Currency.USD, Currency.KRW)
+
+    assert HTTP_RESPONSES.value("200") == 1
+    assert HTTP_REQUEST_SECONDS.count == 1
+    assert SERVED_RATE_AGE_SECONDS.count == 2
+    assert 7200 <= SERVED_RATE_AGE_SECONDS._sum / 2 < 7300
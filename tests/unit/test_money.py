@@ -0,0 +1,102 @@
+import random
+from array import array
+from decimal import ROUND_HALF_EVEN, Decimal
+
+import pytest
+
+from cur.core.entity import Currency
+from cur.core.money import (
+    RATE_DIGITS,
+    FixedRate,
+    Rounding,
+    convert_minor,
+    convert_minor_many,
+    from_minor,
+    to_minor,
+)
+
+
+class TestFixedRate:
+    def test_keeps_the_published_decimal(self):
+        assert FixedRate.from_float(0.000712).units == 712 * 10 ** (RATE_DIGITS - 6)
+        assert FixedRate.from_float(1385.5).units == 13855 * 10 ** (RATE_DIGITS - 1)
+
+    def test_converts_back_to_float(self):
+        assert float(FixedRate.from_float(935.5)) == 935.5
+
+
+class TestMinorUnits:
+    def test_uses_the_currency_digits(self):
+        assert to_minor("12.34", Currency.USD) == 1234
+        assert to_minor("1234", Currency.KRW) == 1234
+        assert to_minor("1.234", Currency.KWD) == 1234
+
+    def test_floats_are_read_as_their_shortest_decimal(self):
+        # 1.005 is 1.00499999... in binary.
+        assert to_minor(1.005, Currency.USD, Rounding.HALF_UP) == 101
+
+    def test_from_minor(self):
+        assert from_minor(1234, Currency.USD) == Decimal("12.34")
+        assert from_minor(1234, Currency.KRW) == Decimal("1234")
+
+
+@pytest.mark.parametrize(
+    "rounding, expected",
+    [
+        (Rounding.HALF_EVEN, [2, 2, 3, -2, -2, -3]),
+        (Rounding.HALF_UP, [3, 2, 3, -3, -2, -3]),
+        (Rounding.DOWN, [2, 2, 2, -2, -2, -2]),
+        (Rounding.UP, [3, 3, 3, -3, -3, -3]),
+        (Rounding.FLOOR, [2, 2, 2, -3, -3, -3]),
+        (Rounding.CEILING, [3, 3, 3, -2, -2, -2]),
+    ],
+)
+def test_rounding_modes(rounding, expected):
+    # At 1 KRW per USD, 250 cents are 2.5 won.
+    rate = FixedRate.from_float(1.0)
+    amounts = [250, 210, 290, -250, -210, -290]
+
+    results = [
+        convert_minor(amount, Currency.USD, Currency.KRW, rate, rounding)
+        for amount in amounts
+    ]
+
+    assert results == expected
+    assert list(
+        convert_minor_many(amounts, Currency.USD, Currency.KRW, rate, rounding)
+    ) == expected
+
+
+def test_scales_up_to_more_minor_digits():
+    rate = FixedRate.from_float(0.000712)
+
+    # 1,000,000 won is 712 dinar, i.e. 712,000 fils.
+    assert convert_minor(1_000_000, Currency.KRW, Currency.KWD, rate) == 712_000
+
+
+@pytest.mark.parametrize("rounding", list(Rounding))
+def test_many_matches_decimal_arithmetic(rounding):
+    decimal_rounding = {
+        Rounding.HALF_EVEN: ROUND_HALF_EVEN,
+        Rounding.HALF_UP: "ROUND_HALF_UP",
+        Rounding.DOWN: "ROUND_DOWN",
+        Rounding.UP: "ROUND_UP",
+        Rounding.FLOOR: "ROUND_FLOOR",
+        Rounding.CEILING: "ROUND_CEILING",
+    }[rounding]
+    rng = random.Random(19)
+    amounts = array("q", (rng.randint(-(10**12), 10**12) for _ in range(2_000)))
+    rate = FixedRate.from_float(1385.27)
+
+    results = convert_minor_many(amounts, Currency.USD, Currency.KRW, rate, rounding)
+
+    expected = [
+        int(
+            (from_minor(amount, Currency.USD) * Decimal("1385.27")).quantize(
+                Decimal(1), rounding=decimal_rounding
+            )
+        )
+        for amount in amounts
+    ]
+    assert results.typecode == "q"
+    assert list(results) == expected
@@ -1,9 +1,16 @@
+import io
+import random
+from array import array
+
 import pytest
 
 from cur.utils.formatters.number_formatter import (
     format_plain,
     format_short,
     format_with_commas,
+    write_plain,
+    write_short,
+    write_with_commas,
 )
 
 
@@ -54,3 +61,62 @@ def test_format_short(input: float, expected: str):
     output = format_short(input)
 
     assert output == expected
+
+
+DIFFERENTIAL_NUMBERS = [
+    0,
+    -0.0,
+    0.004,
+    0.005,
+    1.05,
+    100,
+    999.995,
+    1_000,
+    999_999.95,
+    999_999_999,
+    1_500_000_000,
+    -5_000,
+    -1.5,
+    1e20,
+    float("nan"),
+    float("inf"),
+    float("-inf"),
+] + [random.Random(seed).uniform(-1e10, 1e12) for seed in range(2_000)]
+
+
+@pytest.mark.parametrize(
+    "format_one, write_many",
+    [
+        (format_with_commas, write_with_commas),
+        (format_plain, write_plain),
+        (format_short, write_short),
+    ],
+)
+def test_writers_match_scalar_formatters(format_one, write_many):
+    out = io.StringIO()
+
+    write_many(DIFFERENTIAL_NUMBERS, out)
+
+    assert out.getvalue() == "".join(
+        f"{format_one(number)}\n" for number in DIFFERENTIAL_NUMBERS
+    )
+
+
+def test_writers_accept_arrays_and_large_inputs():
+    numbers = array("d", range(1, 200_001))
+    out = io.StringIO()
+
+    write_plain(numbers, out)
+
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 200_000
+    assert lines[0] == "1"
+    assert lines[-1] == "200000"
+
+
+def test_writers_write_nothing_for_no_numbers():
+    out = io.StringIO()
+
+    write_short([], out)
+
+    assert out.getvalue() == ""
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from cur.core.entity import Currency
+from cur.entrypoints.output import (
+    CopyFormat,
+    OutputFormat,
+    render_error,
+    render_result,
+)
+from cur.services.conversion import ConversionResult
+
+RESULT = ConversionResult(
+    base_amount=1000.0,
+    base_currency="USD",
+    target_amount=1385000.0,
+    target_currency="KRW",
+    exchange_rate=1385.0,
+    rate_updated_unix=1_790_000_000,
+    rate_source="file",
+)
+
+
+def test_json_output_has_a_stable_schema():
+    rendered = render_result(
+        RESULT, Currency.KRW, OutputFormat.json, CopyFormat.short
+    )
+
+    assert rendered.endswith("\n")
+    assert json.loads(rendered) == {
+        "schema": 1,
+        "base": {"amount": 1000.0, "currency": "USD", "formatted": "1,000"},
+        "target": {
+            "amount": 1385000.0,
+            "currency": "KRW",
+            "formatted": "1,385,000",
+            "plain": "1385000",
+            "short": "1.4M",
+            "korean": "138만 5,000원",
+        },
+        "rate": 1385.0,
+        "rate_updated_unix": 1_790_000_000,
+        "rate_source": "file",
+        "copy": "1.4M",
+    }
+
+
+def test_script_filter_output_is_one_alfred_item():
+    rendered = render_result(
+        RESULT, Currency.KRW, OutputFormat.script_filter, CopyFormat.plain
+    )
+
+    (item,) = json.loads(rendered)["items"]
+    assert item["title"] == "1,385,000 KRW"
+    assert item["subtitle"] == "138만 5,000원 (1.4M) · 1 USD = 1385.0 KRW"
+    assert item["arg"] == "1385000"
+
+
+@pytest.mark.parametrize("output", [OutputFormat.default, OutputFormat.plain])
+def test_line_outputs(output):
+    rendered = render_result(RESULT, Currency.KRW, output, CopyFormat.default)
+
+    assert rendered == (
+        "1,000 USD → 1,385,000 KRW\n"
+        "138만 5,000원 (1.4M)\n"
+        "Rate: 1 USD = 1385.0 KRW\n"
+    )
+
+
+def test_plain_output_ignores_color():
+    rendered = render_result(
+        RESULT, Currency.KRW, OutputFormat.plain, CopyFormat.default, color=True
+    )
+
+    assert "\x1b[" not in rendered
+
+
+@pytest.mark.parametrize(
+    "output, expected",
+    [
+        (OutputFormat.plain, "Error: Invalid amount\n"),
+        (OutputFormat.json, '{"schema": 1, "error": "Invalid amount"}\n'),
+        (
+            OutputFormat.script_filter,
+            '{"items": [{"title": "Invalid amount", "subtitle": "Error", '
+            '"valid": false}]}\n',
+        ),
+    ],
+)
+def test_errors(output, expected):
+    assert render_error("Invalid amount", output) == expected
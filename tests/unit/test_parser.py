@@ -1,8 +1,16 @@
+import math
+from datetime import datetime, timezone
+
 import pytest
 
 from cur.core.entity import Currency
 from cur.core.exception import ParseError
-from cur.services.parser import parse_amount, parse_currency
+from cur.services.parser import (
+    parse_amount,
+    parse_amounts,
+    parse_currency,
+    parse_datetime,
+)
 
 
 class TestParseAmount:
@@ -104,16 +112,114 @@ class TestParseCurrency:
         assert parse_currency("  usd  ") == Currency.USD
         assert parse_currency("  KRW  ") == Currency.KRW
 
+    def test_parse_any_iso_currency(self):
+        assert parse_currency("eur").code == "EUR"
+        assert parse_currency("JPY").minor_digits == 0
+        assert parse_currency("bhd").minor_digits == 3
+        assert parse_currency("gbp") is parse_currency("GBP")
+
     def test_parse_invalid_currency(self):
-        with pytest.raises(ParseError, match="Unsupported currency: EUR"):
-            parse_currency("EUR")
+        with pytest.raises(ParseError, match="Unsupported currency: XYZ"):
+            parse_currency("XYZ")
 
-        with pytest.raises(ParseError, match="Unsupported currency: JPY"):
-            parse_currency("JPY")
+        with pytest.raises(ParseError, match="Unsupported currency: US"):
+            parse_currency("us")
 
         with pytest.raises(ParseError, match="Unsupported currency: ABC"):
             parse_currency("abc")
 
-    def test_error_message_includes_supported_currencies(self):
-        with pytest.raises(ParseError, match="Supported: AUD, KRW, USD"):
-            parse_currency("GBP")
+    def test_error_message_suggests_iso_codes(self):
+        with pytest.raises(ParseError, match="Use an ISO 4217 code"):
+            parse_currency("dollar")
+
+
+class TestParseDatetime:
+    def test_bare_date_means_end_of_day_utc(self):
+        moment = parse_datetime("2026-09-30")
+        assert moment == datetime(2026, 9, 30, 23, 59, 59, 999999, timezone.utc)
+
+    def test_naive_time_is_utc(self):
+        moment = parse_datetime("2026-09-30T12:30")
+        assert moment == datetime(2026, 9, 30, 12, 30, tzinfo=timezone.utc)
+
+    def test_offset_is_kept(self):
+        moment = parse_datetime("2026-09-30T09:00+09:00")
+        assert moment == datetime(2026, 9, 30, 0, 0, tzinfo=timezone.utc)
+
+    def test_z_suffix_is_utc(self):
+        moment = parse_datetime("2024-01-01T00:00Z")
+        assert moment == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def test_invalid_date(self):
+        with pytest.raises(ParseError, match="Invalid date: yesterday"):
+            parse_datetime("yesterday")
+
+        with pytest.raises(ParseError, match="Invalid date"):
+            parse_datetime("2026-13-01")
+
+
+class TestParseAmounts:
+    def test_plain_column(self):
+        parsed = parse_amounts(["1", "2.5", ".5", "1000000"])
+
+        assert list(parsed.values) == [1.0, 2.5, 0.5, 1_000_000.0]
+        assert not any(parsed.failed)
+        assert parsed.errors == {}
+
+    def test_commas_units_and_whitespace(self):
+        parsed = parse_amounts(["1,000", "1.5k", " 2M ", "3b", "1,234.56"])
+
+        assert list(parsed.values) == [1000.0, 1500.0, 2e6, 3e9, 1234.56]
+        assert not any(parsed.failed)
+
+    def test_failed_rows_are_masked_with_reasons(self):
+        parsed = parse_amounts(["100", "abc", "", "-1", "0", "1e5", "50k"])
+
+        assert list(parsed.failed) == [0, 1, 1, 1, 1, 1, 0]
+        assert math.isnan(parsed.values[1])
+        assert parsed.values[6] == 50_000.0
+        assert parsed.errors == {
+            1: "Invalid amount format: abc",
+            2: "Amount cannot be empty",
+            3: "Invalid amount format: -1",
+            4: "Amount must be greater than zero",
+            5: "Invalid amount format: 1e5",
+        }
+
+    def test_zero_in_plain_column_fails(self):
+        parsed = parse_amounts(["1", "0", "0.0"])
+
+        assert list(parsed.failed) == [0, 1, 1]
+        assert parsed.errors[1] == "Amount must be greater than zero"
+
+    def test_row_with_line_break_is_not_split(self):
+        parsed = parse_amounts(["1\n2", "3"])
+
+        assert list(parsed.failed) == [1, 0]
+        assert parsed.values[1] == 3.0
+
+    @pytest.mark.parametrize(
+        "column",
+        [
+            ["1", "2", "3"],
+            ["1,000", "2k", "x", "", ".5m", "0", "1.", " 7 "],
+        ],
+    )
+    def test_matches_parse_amount(self, column):
+        parsed = parse_amounts(column)
+
+        assert len(parsed) == len(column)
+        for row, amount in enumerate(column):
+            try:
+                expected = parse_amount(amount)
+            except ParseError as e:
+                assert parsed.failed[row] == 1
+                assert parsed.errors[row] == str(e)
+            else:
+                assert parsed.failed[row] == 0
+                assert parsed.values[row] == expected
+
+    def test_empty_column(self):
+        parsed = parse_amounts([])
+
+        assert len(parsed) == 0
@@ -0,0 +1,75 @@
+import math
+import time
+
+import pytest
+
+from cur.adapters.cache import ExchangeRateCache, MemoryCacheStorage
+from cur.adapters.exchange_rate_client import (
+    ExchangeRateClient,
+    LatestExchangeRateResponse,
+)
+from cur.adapters.rate_matrix import RateMatrix
+from cur.core.entity import Currency
+
+
+@pytest.fixture
+def usd_table(rate_table) -> LatestExchangeRateResponse:
+    return rate_table("USD", {"KRW": 1300.0, "AUD": 1.5, "EUR": 0.9})
+
+
+def test_currency_index_is_stable_and_dense():
+    assert [currency.index for currency in Currency] == list(range(len(Currency)))
+    assert Currency.from_string("krw").index == Currency.KRW.index
+
+
+def test_one_table_fills_every_pair(usd_table):
+    matrix = RateMatrix([usd_table])
+
+    assert matrix.rate(Currency.USD, Currency.KRW) == 1300.0
+    assert matrix.rate(Currency.KRW, Currency.USD) == pytest.approx(1 / 1300.0)
+    assert matrix.rate(Currency.AUD, Currency.KRW) == pytest.approx(1300.0 / 1.5)
+    assert matrix.rate(Currency.KRW, Currency.KRW) == 1.0
+
+
+def test_empty_matrix_has_only_the_diagonal():
+    matrix = RateMatrix()
+
+    assert math.isnan(matrix.rate(Currency.USD, Currency.KRW))
+    assert matrix.rate(Currency.USD, Currency.USD) == 1.0
+    assert not matrix.is_fresh()
+
+
+def test_own_table_overrides_the_triangulated_row(rate_table, usd_table):
+    matrix = RateMatrix([usd_table])
+    matrix.update(rate_table("AUD", {"USD": 0.66, "KRW": 870.0}))
+
+    assert matrix.rate(Currency.AUD, Currency.KRW) == 870.0
+    # Rows without a table of their own still come from the pivot.
+    assert matrix.rate(Currency.KRW, Currency.AUD) == pytest.approx(1.5 / 1300.0)
+
+
+def test_refreshing_the_pivot_updates_derived_rows(rate_table, usd_table):
+    matrix = RateMatrix([usd_table])
+    matrix.update(rate_table("USD", {"KRW": 1400.0, "AUD": 1.4}))
+
+    assert matrix.rate(Currency.USD, Currency.KRW) == 1400.0
+    assert matrix.rate(Currency.AUD, Currency.KRW) == pytest.approx(1000.0)
+
+
+def test_expiry_is_the_earliest_table(rate_table, usd_table):
+    now = int(time.time())
+    matrix = RateMatrix([usd_table])
+    matrix.update(rate_table("AUD", {"KRW": 870.0}), expires_at_unix=now - 1)
+
+    assert matrix.expires_at_unix == now - 1
+    assert not matrix.is_fresh()
+
+
+def test_client_keeps_its_matrix_up_to_date(usd_table):
+    cache = ExchangeRateCache(MemoryCacheStorage())
+    cache.set("USD", usd_table.to_dict(), usd_table.time_next_update_unix)
+    client = ExchangeRateClient(cache)
+
+    matrix = client.rate_matrix()
+    assert matrix.rate(Currency.AUD, Currency.USD) == pytest.approx(1 / 1.5)
+    assert client.rate_matrix() is matrix
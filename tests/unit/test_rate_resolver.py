@@ -0,0 +1,72 @@
+import pytest
+
+from cur.adapters.rate_resolver import CrossRateResolver
+
+
+@pytest.fixture
+def resolver() -> CrossRateResolver:
+    return CrossRateResolver()
+
+
+def test_direct_lookup_prefers_base_table(resolver: CrossRateResolver, rate_table):
+    tables = [
+        rate_table("KRW", {"USD": 0.0007}),
+        rate_table("USD", {"KRW": 1400.0}),
+    ]
+
+    resolved = resolver.resolve("USD", "KRW", tables)
+
+    assert resolved is not None
+    assert resolved.rate == 1400.0
+    assert resolved.tables == ("USD",)
+
+
+def test_inversion_uses_target_table(resolver: CrossRateResolver, rate_table):
+    tables = [rate_table("USD", {"KRW": 1400.0})]
+
+    resolved = resolver.resolve("KRW", "USD", tables)
+
+    assert resolved is not None
+    assert resolved.rate == pytest.approx(1 / 1400.0)
+    assert resolved.tables == ("USD",)
+
+
+def test_triangulation_through_pivot_table(resolver: CrossRateResolver, rate_table):
+    tables = [rate_table("USD", {"KRW": 1400.0, "AUD": 1.5})]
+
+    resolved = resolver.resolve("AUD", "KRW", tables)
+
+    assert resolved is not None
+    assert resolved.rate == pytest.approx(1400.0 / 1.5)
+    assert resolved.tables == ("USD",)
+
+
+def test_multi_hop_chains_tables(resolver: CrossRateResolver, rate_table):
+    tables = [
+        rate_table("USD", {"EUR": 0.9}, next_update=3000),
+        rate_table("EUR", {"KRW": 1500.0}, next_update=2500),
+    ]
+
+    resolved = resolver.resolve("USD", "KRW", tables)
+
+    assert resolved is not None
+    assert resolved.rate == pytest.approx(0.9 * 1500.0)
+    assert resolved.tables == ("USD", "EUR")
+    assert resolved.time_next_update_unix == 2500
+
+
+def test_returns_none_when_pair_is_unreachable(resolver: CrossRateResolver, rate_table):
+    tables = [rate_table("USD", {"EUR": 0.9}), rate_table("AUD", {"KRW": 900.0})]
+
+    assert resolver.resolve("USD", "KRW", tables) is None
+
+
+def test_respects_max_hops(rate_table):
+    tables = [
+        rate_table("USD", {"EUR": 0.9}),
+        rate_table("EUR", {"GBP": 0.8}),
+        rate_table("GBP", {"KRW": 1700.0}),
+    ]
+
+    assert CrossRateResolver(max_hops=2).resolve("USD", "KRW", tables) is None
+    assert CrossRateResolver(max_hops=3).resolve("USD", "KRW", tables) is not None
@@ -0,0 +1,92 @@
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cur.adapters.refresher import ProcessRefresher, ThreadRefresher
+from cur.bootstrap import _stale_grace
+from cur.core.entity import Currency
+
+
+class BlockingClient:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.refreshed = threading.Event()
+        self.calls = 0
+
+    def refresh(self, base_currency: Currency) -> None:
+        self.calls += 1
+        self.release.wait(5)
+        self.refreshed.set()
+
+
+def test_thread_refresher_refreshes_in_background():
+    client = BlockingClient()
+
+    ThreadRefresher().schedule(client, Currency.USD)
+    client.release.set()
+
+    assert client.refreshed.wait(5)
+
+
+def test_thread_refresher_coalesces_in_flight_refreshes():
+    client = BlockingClient()
+    refresher = ThreadRefresher()
+
+    refresher.schedule(client, Currency.USD)
+    refresher.schedule(client, Currency.USD)
+    client.release.set()
+    client.refreshed.wait(5)
+
+    assert client.calls == 1
+
+
+def test_thread_refresher_retries_after_failed_refresh():
+    attempts = threading.Semaphore(0)
+
+    class FailingClient:
+        def refresh(self, base_currency: Currency) -> None:
+            attempts.release()
+            raise RuntimeError("network down")
+
+    refresher = ThreadRefresher()
+
+    refresher.schedule(FailingClient(), Currency.USD)
+    assert attempts.acquire(timeout=5)
+    for _ in range(100):
+        if not refresher._in_flight:
+            break
+        threading.Event().wait(0.01)
+    refresher.schedule(FailingClient(), Currency.USD)
+
+    assert attempts.acquire(timeout=5)
+
+
+def test_process_refresher_spawns_detached_refresh_once():
+    refresher = ProcessRefresher()
+
+    with patch("subprocess.Popen") as popen:
+        refresher.schedule(Mock(), Currency.KRW)
+        refresher.schedule(Mock(), Currency.KRW)
+
+    popen.assert_called_once()
+    args, kwargs = popen.call_args
+    assert args[0][-3:] == ["-m", "cur.entrypoints.refresh", "KRW"]
+    assert kwargs["start_new_session"] is True
+
+
+def test_process_refresher_retries_when_spawning_fails():
+    refresher = ProcessRefresher()
+
+    with patch("subprocess.Popen", side_effect=OSError("fork failed")) as popen:
+        refresher.schedule(Mock(), Currency.KRW)
+        refresher.schedule(Mock(), Currency.KRW)
+
+    assert popen.call_count == 2
+
+
+@pytest.mark.parametrize("value, expected", [("300", 300), ("5m", 0), ("-1", 0)])
+def test_stale_grace_falls_back_to_off(monkeypatch, value, expected):
+    monkeypatch.setenv("CURRENCY_TRANSLATOR_STALE_GRACE", value)
+
+    assert _stale_grace() == expected
@@ -0,0 +1,114 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from cur.adapters.cache import ExchangeRateCache
+from cur.adapters.sqlite_cache import SqliteCacheStorage
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "cache" / "cache.sqlite3"
+
+
+@pytest.fixture
+def storage(db_path: Path):
+    with SqliteCacheStorage(db_path) as storage:
+        yield storage
+
+
+def test_init_creates_parent_directory(db_path: Path):
+    with SqliteCacheStorage(db_path) as storage:
+        storage.list_keys()
+
+    assert db_path.exists()
+
+
+def test_read_returns_none_for_missing_key(storage: SqliteCacheStorage):
+    assert storage.read("nonexistent") is None
+
+
+def test_write_and_read_returns_data(storage: SqliteCacheStorage):
+    storage.write("USD", {"rate": 1.23, "currency": "USD"})
+
+    assert storage.read("USD") == {"rate": 1.23, "currency": "USD"}
+
+
+def test_write_replaces_existing_entry(storage: SqliteCacheStorage):
+    storage.write("USD", {"rate": 1.0})
+    storage.write("USD", {"rate": 2.0})
+
+    assert storage.read("USD") == {"rate": 2.0}
+    assert storage.list_keys() == ["USD"]
+
+
+def test_delete_and_list_keys(storage: SqliteCacheStorage):
+    storage.write("USD", {"rate": 1.0})
+    storage.write("KRW", {"rate": 1300.0})
+
+    storage.delete("USD")
+
+    assert storage.list_keys() == ["KRW"]
+
+
+def test_clear_removes_all_entries(storage: SqliteCacheStorage):
+    cache = ExchangeRateCache(storage)
+    future_expiry = int(time.time()) + 1000
+    cache.set("USD", {"rate": 1.0}, future_expiry)
+    cache.set("KRW", {"rate": 1300.0}, future_expiry)
+
+    cache.clear()
+
+    assert storage.list_keys() == []
+
+
+def test_uses_wal_journal(storage: SqliteCacheStorage, db_path: Path):
+    storage.write("USD", {"rate": 1.0})
+
+    assert Path(f"{db_path}-wal").exists()
+
+
+def test_entries_are_shared_between_instances(db_path: Path):
+    with SqliteCacheStorage(db_path) as writer, SqliteCacheStorage(db_path) as reader:
+        writer.write("USD", {"rate": 1.0})
+
+        assert reader.read("USD") == {"rate": 1.0}
+
+
+def test_close_closes_every_thread_connection(storage: SqliteCacheStorage):
+    storage.write("USD", {"rate": 1.0})
+    worker = threading.Thread(target=storage.read, args=("USD",))
+    worker.start()
+    worker.join()
+    connections = list(storage._connections.values())
+
+    storage.close()
+
+    assert len(connections) == 2
+    for connection in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+    assert storage.read("USD") == {"rate": 1.0}
+
+
+def test_concurrent_threads_never_see_torn_entries(storage: SqliteCacheStorage):
+    table = {"rates": {str(n): float(n) for n in range(200)}}
+    storage.write("USD", table)
+    torn = []
+
+    def hammer():
+        for _ in range(200):
+            storage.write("USD", table)
+            if storage.read("USD") != table:
+                torn.append(1)
+
+    threads = [threading.Thread(target=hammer) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert torn == []
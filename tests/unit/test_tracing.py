@@ -0,0 +1,133 @@
+import json
+import threading
+
+import httpx
+import pytest
+
+from cur.adapters.cache import (
+    ExchangeRateCache,
+    MemoryCacheStorage,
+    TieredCacheStorage,
+)
+from cur.adapters.exchange_rate_client import ExchangeRateClient
+from cur.core.entity import Currency
+from cur.utils import tracing
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    tracing.start(str(path))
+    yield path
+    tracing.finish()
+
+
+def _finish(path) -> dict:
+    tracing.finish()
+    return json.loads(path.read_text().splitlines()[-1])
+
+
+def test_spans_are_no_ops_when_disabled():
+    assert not tracing.enabled()
+
+    with tracing.span("parse") as span:
+        tracing.annotate(ignored=True)
+        tracing.record_cache("network")
+
+    assert span is tracing.span("other")
+
+
+def test_records_nested_spans_with_attributes(trace_file):
+    with tracing.span("convert"):
+        with tracing.span("resolve_rate", pair="USD/KRW"):
+            tracing.annotate(source="file")
+    with tracing.span("render"):
+        pass
+
+    trace = _finish(trace_file)
+
+    assert [(s["name"], s["depth"]) for s in trace["spans"]] == [
+        ("convert", 0),
+        ("resolve_rate", 1),
+        ("render", 0),
+    ]
+    assert trace["spans"][1]["pair"] == "USD/KRW"
+    assert trace["spans"][1]["source"] == "file"
+    assert trace["spans"][0]["duration_ms"] >= trace["spans"][1]["duration_ms"]
+
+
+def test_reports_the_costliest_cache_source(trace_file):
+    tracing.record_cache("file")
+    tracing.record_cache("network")
+    tracing.record_cache("memory")
+
+    assert _finish(trace_file)["cache"] == "network"
+
+
+def test_ignores_spans_from_other_threads(trace_file):
+    thread = threading.Thread(target=lambda: tracing.span("refresh").__enter__())
+    thread.start()
+    thread.join()
+
+    assert _finish(trace_file)["spans"] == []
+
+
+def test_tiered_cache_reads_note_the_tier_that_answered(trace_file):
+    disk = MemoryCacheStorage()
+    cache = ExchangeRateCache(TieredCacheStorage(MemoryCacheStorage(), _Disk(disk)))
+    disk.write("USD", {"data": {}, "ttl": 2**40})
+
+    cache.get("USD")
+    cache.get("USD")
+
+    trace = _finish(trace_file)
+    assert [s.get("source") for s in trace["spans"]] == ["file", "memory"]
+    assert trace["cache"] == "file"
+
+
+def test_client_traces_how_the_rate_table_was_obtained(trace_file, rate_table):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=rate_table("USD", {"KRW": 1385.0}).to_dict())
+
+    client = ExchangeRateClient(
+        ExchangeRateCache(MemoryCacheStorage()),
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(handler), base_url="https://test/"
+        ),
+    )
+    client.get_rate(Currency.USD, Currency.KRW)
+    client.get_rate(Currency.USD, Currency.KRW)
+
+    spans = [s for s in _finish(trace_file)["spans"] if s["name"] == "latest_rates"]
+    assert [s["via"] for s in spans] == ["network", "cache"]
+    assert spans[0]["depth"] == 1  # inside resolve_rate
+
+
+def test_breakdown_goes_to_stderr_by_default(capsys):
+    tracing.start()
+    with tracing.span("copy"):
+        pass
+    tracing.finish()
+
+    err = capsys.readouterr().err
+    assert err.startswith("trace: ")
+    assert "  copy" in err
+
+
+class _Disk:
+    """A non-memory tier backed by a dict."""
+
+    def __init__(self, storage: MemoryCacheStorage) -> None:
+        self._storage = storage
+
+    def read(self, key):
+        return self._storage.read(key)
+
+    def write(self, key, data):
+        self._storage.write(key, data)
+
+    def delete(self, key):
+        self._storage.delete(key)
+
+    def list_keys(self):
+        return self._storage.list_keys()
@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import httpx
+
+from cur.adapters.async_exchange_rate_client import AsyncExchangeRateClient
+from cur.adapters.cache import ExchangeRateCache, MemoryCacheStorage
+from cur.core.entity import Currency
+from cur.services.warm import warm_cache
+
+NEXT_UPDATE = int(time.time()) + 3600
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    code = request.url.path.rsplit("/", 1)[-1]
+    if code == "AUD":
+        return httpx.Response(500, request=request)
+    return httpx.Response(
+        200,
+        json={
+            "result": "success",
+            "time_last_update_unix": NEXT_UPDATE - 86400,
+            "time_next_update_unix": NEXT_UPDATE,
+            "base_code": code,
+            "rates": {code: 1.0},
+        },
+    )
+
+
+def _warm(cache: ExchangeRateCache, requests: list, **kwargs):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return _handler(request)
+
+    async def scenario():
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="https://test/"
+        )
+        async with AsyncExchangeRateClient(cache, http_client=http_client) as client:
+            return await warm_cache(client, **kwargs)
+
+    return asyncio.run(scenario())
+
+
+def test_warm_cache_fetches_every_base_into_the_cache() -> None:
+    cache = ExchangeRateCache(MemoryCacheStorage())
+    requests: list = []
+
+    results = _warm(cache, requests, base_currencies=[Currency.USD, Currency.KRW])
+
+    assert [result.base_code for result in results] == ["USD", "KRW"]
+    assert all(result.fetched and result.error is None for result in results)
+    assert all(result.expires_at_unix == NEXT_UPDATE for result in results)
+    assert cache.get("USD") is not None
+    assert cache.get("KRW") is not None
+
+
+def test_warm_cache_reports_failures_without_stopping() -> None:
+    cache = ExchangeRateCache(MemoryCacheStorage())
+
+    bases = [Currency.USD, Currency.AUD, Currency.KRW]
+    results = {
+        result.base_code: result
+        for result in _warm(cache, [], base_currencies=bases)
+    }
+
+    assert set(results) == {"USD", "AUD", "KRW"}
+    assert results["AUD"].error is not None
+    assert results["USD"].error is None
+    assert cache.get("AUD") is None
+
+
+def test_warm_cache_skips_fresh_tables_unless_forced() -> None:
+    cache = ExchangeRateCache(MemoryCacheStorage())
+    requests: list = []
+    _warm(cache, requests, base_currencies=[Currency.USD])
+
+    (cached,) = _warm(cache, requests, base_currencies=[Currency.USD])
+    assert not cached.fetched
+    assert cached.expires_at_unix == NEXT_UPDATE
+    assert len(requests) == 1
+
+    (forced,) = _warm(cache, requests, base_currencies=[Currency.USD], force=True)
+    assert forced.fetched
+    assert len(requests) == 2
@@ -0,0 +1,208 @@
+import io
+from unittest.mock import Mock
+
+import pytest
+
+from cur.adapters.rate_resolver import ResolvedRate
+from cur.core.entity import Currency
+from cur.entrypoints.watch import LiveTable, parse_conversions, watch_loop
+from cur.services.watch import RateWatcher, WatchedConversion
+
+NOW = 1_800_000_000
+NEXT_UPDATE = NOW + 3600
+
+CONVERSIONS = [
+    WatchedConversion(100, Currency.USD, Currency.KRW),
+    WatchedConversion(1000, Currency.KRW, Currency.AUD),
+]
+
+
+def _resolved(base: Currency, target: Currency, rate: float, **kwargs) -> ResolvedRate:
+    defaults = {
+        "tables": (base.code,),
+        "time_last_update_unix": NOW - 3600,
+        "time_next_update_unix": NEXT_UPDATE,
+    }
+    return ResolvedRate(rate, base.code, target.code, **{**defaults, **kwargs})
+
+
+def _client(rates: dict) -> Mock:
+    """A client answering from rates, which the test may change between polls."""
+
+    def resolve_rate(base: Currency, target: Currency) -> ResolvedRate:
+        answer = rates[(base.code, target.code)]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    client = Mock()
+    client.resolve_rate.side_effect = resolve_rate
+    return client
+
+
+def test_first_poll_reports_every_row():
+    rates = {
+        ("USD", "KRW"): _resolved(Currency.USD, Currency.KRW, 1385.0),
+        ("KRW", "AUD"): _resolved(Currency.KRW, Currency.AUD, 0.0011),
+    }
+    watcher = RateWatcher(_client(rates), CONVERSIONS)
+
+    assert watcher.poll() == [0, 1]
+    assert watcher.rows[0].result.target_amount == 138_500
+    assert watcher.rows[1].result.exchange_rate == 0.0011
+
+
+def test_poll_reports_only_rows_whose_rate_changed():
+    rates = {
+        ("USD", "KRW"): _resolved(Currency.USD, Currency.KRW, 1385.0),
+        ("KRW", "AUD"): _resolved(Currency.KRW, Currency.AUD, 0.0011),
+    }
+    watcher = RateWatcher(_client(rates), CONVERSIONS)
+    watcher.poll()
+
+    assert watcher.poll() == []
+
+    rates[("KRW", "AUD")] = _resolved(Currency.KRW, Currency.AUD, 0.0012)
+    assert watcher.poll() == [1]
+
+    rates[("USD", "KRW")] = RuntimeError("offline")
+    assert watcher.poll() == [0]
+    assert watcher.rows[0].error == "offline"
+
+
+def test_next_poll_is_due_when_upstream_publishes():
+    rates = {
+        ("USD", "KRW"): _resolved(Currency.USD, Currency.KRW, 1385.0),
+        ("KRW", "AUD"): _resolved(
+            Currency.KRW, Currency.AUD, 0.0011, time_next_update_unix=NEXT_UPDATE + 60
+        ),
+    }
+    watcher = RateWatcher(_client(rates), CONVERSIONS, min_interval=60)
+    watcher.poll()
+
+    assert watcher.next_poll_at(NOW) == NEXT_UPDATE
+
+
+def test_next_poll_waits_at_least_min_interval():
+    # Upstream is late: the table's next update is already in the past.
+    rates = {
+        ("USD", "KRW"): _resolved(
+            Currency.USD, Currency.KRW, 1385.0, time_next_update_unix=NOW - 10
+        ),
+        ("KRW", "AUD"): _resolved(Currency.KRW, Currency.AUD, 0.0011),
+    }
+    watcher = RateWatcher(_client(rates), CONVERSIONS, min_interval=60)
+    watcher.poll()
+
+    assert watcher.next_poll_at(NOW) == NOW + 60
+
+
+@pytest.mark.parametrize(
+    "answer",
+    [
+        RuntimeError("offline"),
+        _resolved(Currency.USD, Currency.KRW, 1385.0, stale=True),
+    ],
+)
+def test_failed_or_stale_rows_are_retried(answer):
+    rates = {
+        ("USD", "KRW"): answer,
+        ("KRW", "AUD"): _resolved(Currency.KRW, Currency.AUD, 0.0011),
+    }
+    watcher = RateWatcher(_client(rates), CONVERSIONS, retry_interval=300)
+    watcher.poll()
+
+    assert watcher.next_poll_at(NOW) == NOW + 300
+
+
+def test_live_table_redraws_changed_rows_in_place():
+    rates = {
+        ("USD", "KRW"): _resolved(Currency.USD, Currency.KRW, 1385.0),
+        ("KRW", "AUD"): _resolved(Currency.KRW, Currency.AUD, 0.0011),
+    }
+    watcher = RateWatcher(_client(rates), CONVERSIONS)
+    out = io.StringIO()
+    table = LiveTable(out, color=False, in_place=True)
+
+    changed = watcher.poll()
+    table.show(watcher.rows, changed, NEXT_UPDATE)
+    first = out.getvalue().splitlines()
+    assert first[0].startswith("100 USD → 138,500 KRW")
+    assert first[1].startswith("1,000 KRW → 1.1 AUD")
+    assert first[2].startswith("Next update")
+
+    rates[("USD", "KRW")] = _resolved(Currency.USD, Currency.KRW, 1400.0)
+    out.truncate(0)
+    out.seek(0)
+    changed = watcher.poll()
+    table.show(watcher.rows, changed, NEXT_UPDATE)
+
+    redraw = out.getvalue()
+    # Row 0 is three lines up from the cursor, the status line one.
+    assert redraw.startswith("\x1b[3A\r\x1b[2K100 USD → 140,000 KRW")
+    assert "1,000 KRW" not in redraw
+    assert "\x1b[1A\r\x1b[2KNext update" in redraw
+
+
+def test_live_table_appends_changes_when_not_a_terminal():
+    rates = {
+        ("USD", "KRW"): _resolved(Currency.USD, Currency.KRW, 1385.0),
+        ("KRW", "AUD"): _resolved(Currency.KRW, Currency.AUD, 0.0011),
+    }
+    watcher = RateWatcher(_client(rates), CONVERSIONS)
+    out = io.StringIO()
+    table = LiveTable(out, color=False, in_place=False)
+
+    changed = watcher.poll()
+    table.show(watcher.rows, changed, NEXT_UPDATE)
+    rates[("KRW", "AUD")] = _resolved(Currency.KRW, Currency.AUD, 0.0012)
+    changed = watcher.poll()
+    table.show(watcher.rows, changed, NEXT_UPDATE)
+
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 3
+    assert "\x1b" not in out.getvalue()
+    assert lines[2].startswith("1,000 KRW → 1.2 AUD")
+
+
+def test_watch_loop_sleeps_until_the_next_update():
+    rates = {
+        ("USD", "KRW"): _resolved(Currency.USD, Currency.KRW, 1385.0),
+        ("KRW", "AUD"): _resolved(Currency.KRW, Currency.AUD, 0.0011),
+    }
+    client = _client(rates)
+    watcher = RateWatcher(client, CONVERSIONS)
+    now = [float(NOW)]
+    sleeps = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+        if now[0] >= NEXT_UPDATE and client.resolve_rate.call_count > 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        watch_loop(
+            watcher,
+            LiveTable(io.StringIO(), color=False, in_place=True),
+            clock=lambda: now[0],
+            sleep=sleep,
+        )
+
+    # An hour until the next update, slept in bounded steps, then one poll.
+    assert sum(sleeps[:60]) == 3600
+    assert max(sleeps) <= 60
+    assert client.resolve_rate.call_count == 4
+
+
+def test_parse_conversions_takes_triples():
+    assert parse_conversions(["1k", "usd", "krw"]) == [
+        WatchedConversion(1000, Currency.USD, Currency.KRW)
+    ]
+
+
+def test_parse_conversions_rejects_incomplete_triples():
+    from cur.core.exception import ParseError
+
+    with pytest.raises(ParseError):
+        parse_conversions(["100", "usd"])